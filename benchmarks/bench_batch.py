@@ -0,0 +1,54 @@
+"""Benchmark BatchSnakeSim throughput against the number of games
+
+Run from the repository root:
+
+    python -m benchmarks.bench_batch
+
+Every game plays a random policy: mostly straight ahead, with random
+turns and shots. Throughput is reported in game ticks per second, the
+batch size times the steps per second.
+"""
+import argparse
+import time
+import numpy as np
+from src.core.batch import BatchSnakeSim, NOOP, RIGHT, SHOOT
+
+BATCH_SIZES = (1, 64, 256, 1024, 4096, 16384)
+MIN_STEPS, MAX_STEPS = 200, 5_000  # Steps per batch size, bounding the run time
+
+
+def random_actions(rng, count, steps):
+    """Action codes for steps ticks of count games"""
+    actions = rng.integers(NOOP, RIGHT + 1, (steps, count))
+    actions[rng.random((steps, count)) < 0.8] = NOOP
+    actions[rng.random((steps, count)) < 0.05] = SHOOT
+    return actions
+
+
+def run(count, steps, seed=0):
+    """Game ticks per second and games finished for a batch of count games"""
+    batch = BatchSnakeSim(count, seed=seed)
+    actions = random_actions(np.random.default_rng(seed), count, steps)
+    start = time.perf_counter()
+    for tick_actions in actions:
+        batch.step(tick_actions)
+    elapsed = time.perf_counter() - start
+    return count * steps / elapsed, batch.episodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=2_000_000,
+                        help="game ticks per batch size, within the step bounds")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'games':>8} {'steps':>8} {'finished':>9} {'M ticks/sec':>12}")
+    for count in BATCH_SIZES:
+        steps = max(MIN_STEPS, min(MAX_STEPS, args.ticks // count))
+        rate, finished = run(count, steps, args.seed)
+        print(f"{count:>8} {steps:>8} {finished:>9} {rate / 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
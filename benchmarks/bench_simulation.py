@@ -0,0 +1,67 @@
+"""Benchmark headless SimulationCore tick throughput
+
+Run from the repository root:
+
+    python -m benchmarks.bench_simulation
+"""
+import argparse
+import time
+from src.core import SimulationCore
+from src.config.settings import GRID_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT
+
+TARGET_TICKS_PER_SEC = 50_000
+
+# Clockwise turn order used by the patrol policy
+CLOCKWISE = {'up': 'right', 'right': 'down', 'down': 'left', 'left': 'up'}
+
+
+def patrol_action(sim):
+    """Turn clockwise before hitting a wall so the snake keeps circling"""
+    x, y = sim.snake.head
+    direction = sim.snake.direction
+    margin = GRID_SIZE * 4
+    if ((direction == 'up' and y <= margin) or
+            (direction == 'right' and x >= SCREEN_WIDTH - margin - GRID_SIZE) or
+            (direction == 'down' and y >= SCREEN_HEIGHT - margin - GRID_SIZE) or
+            (direction == 'left' and x <= margin)):
+        return CLOCKWISE[direction]
+    return None
+
+
+def mid_game(sim, length=30, ammo=10):
+    """Reset into a typical mid-game state: long body, ammo in hand"""
+    sim.reset()
+    sim.snake.grow(length - 1)
+    sim.snake.add_ammo(ammo)
+
+
+def run(ticks, seed=0):
+    sim = SimulationCore(seed=seed)
+    mid_game(sim)
+    resets = 0
+    start = time.perf_counter()
+    for tick in range(ticks):
+        action = patrol_action(sim)
+        if action is None and tick % 25 == 0:
+            action = 'shoot'
+        if not sim.step(action):
+            mid_game(sim)
+            resets += 1
+    elapsed = time.perf_counter() - start
+    return ticks / elapsed, resets
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=200_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rate, resets = run(args.ticks, args.seed)
+    status = "OK" if rate >= TARGET_TICKS_PER_SEC else "BELOW TARGET"
+    print(f"{args.ticks} ticks, {resets} resets: {rate:,.0f} ticks/sec "
+          f"(target {TARGET_TICKS_PER_SEC:,}) {status}")
+
+
+if __name__ == "__main__":
+    main()
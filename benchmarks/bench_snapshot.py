@@ -0,0 +1,68 @@
+"""Benchmark SimulationCore snapshot, restore and clone rates
+
+Run from the repository root:
+
+    python -m benchmarks.bench_snapshot
+
+Restores alternate between snapshots of two games with different seeds,
+so every restore changes the whole state, random state included. Each rate is
+the best of several rounds, as load on the machine only ever slows a round
+down. Restore and clone must both reach the target rate.
+"""
+import argparse
+import math
+import time
+from src.core import SimulationCore
+from benchmarks.bench_simulation import patrol_action, mid_game
+
+TARGET_PER_SEC = 100_000  # Restores and clones per second needed by lookahead bots
+
+
+def rate(operation, count, rounds=1):
+    """Calls per second of operation in the fastest of rounds runs of count calls"""
+    best = math.inf
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(count):
+            operation()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20_000, help="calls per round")
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=500, help="ticks played before measuring")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    snapshots = []
+    for seed in (args.seed + 1, args.seed):
+        sim = SimulationCore(seed=seed)
+        mid_game(sim)
+        for _ in range(args.warmup):
+            if not sim.step(patrol_action(sim)):
+                mid_game(sim)
+        snapshots.append(sim.snapshot())
+
+    def restore():
+        sim.restore(snapshots[0])
+        snapshots.reverse()
+
+    results = [
+        ("snapshot", rate(lambda: sim.snapshot(include_rng=False), args.count, args.rounds)),
+        ("snapshot with RNG", rate(sim.snapshot, args.count, args.rounds)),
+        ("restore", rate(restore, args.count, args.rounds)),
+        ("clone", rate(sim.clone, args.count, args.rounds)),
+    ]
+    print(f"snake length {len(sim.snake.positions)}")
+    for name, per_sec in results:
+        print(f"{name:>18}: {per_sec:>10,.0f}/sec")
+    slowest, per_sec = min(results[2:], key=lambda result: result[1])
+    status = "OK" if per_sec >= TARGET_PER_SEC else f"BELOW TARGET ({slowest})"
+    print(f"target {TARGET_PER_SEC:,} restores and clones/sec {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark simulation tick time against the number of enemies
+
+Run from the repository root:
+
+    python -m benchmarks.bench_swarm
+
+For each enemy count this reports the time of a full SimulationCore tick
+with that many swarm enemies, and the time to move the same number of
+enemies as scalar Enemy objects versus one vectorized EnemySwarm.
+"""
+import argparse
+import random
+import time
+from src.components.enemy import Enemy
+from src.core import SimulationCore
+from src.core.swarm import EnemySwarm
+from benchmarks.bench_simulation import patrol_action, mid_game
+
+ENEMY_COUNTS = (0, 1, 5, 10, 25, 50, 100, 200)
+
+
+def time_ticks(swarm_size, ticks, seed=0):
+    """Microseconds per SimulationCore tick with swarm_size extra enemies"""
+    sim = SimulationCore(swarm_size=swarm_size, seed=seed)
+    mid_game(sim)
+    start = time.perf_counter()
+    for tick in range(ticks):
+        action = patrol_action(sim)
+        if action is None and tick % 25 == 0:
+            action = 'shoot'
+        if not sim.step(action):
+            mid_game(sim)
+    return (time.perf_counter() - start) / ticks * 1e6
+
+
+def time_moves(count, ticks):
+    """Microseconds per tick to move count scalar enemies and a swarm of count"""
+    targets = [(random.randrange(48) * 25, random.randrange(32) * 25) for _ in range(ticks)]
+    enemies = [Enemy() for _ in range(count)]
+    start = time.perf_counter()
+    for target in targets:
+        for enemy in enemies:
+            enemy.move(target, target)
+    scalar = (time.perf_counter() - start) / ticks * 1e6
+
+    swarm = EnemySwarm(count)
+    start = time.perf_counter()
+    for target in targets:
+        swarm.move(target, target)
+    vectorized = (time.perf_counter() - start) / ticks * 1e6
+    return scalar, vectorized
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=5_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    print(f"{'enemies':>8} {'tick us':>10} {'ticks/sec':>10} {'Enemy us':>10} {'Swarm us':>10}")
+    for count in ENEMY_COUNTS:
+        tick = time_ticks(count, args.ticks, args.seed)
+        scalar, vectorized = time_moves(count, args.ticks) if count else (0.0, 0.0)
+        print(f"{count + 1:>8} {tick:>10.1f} {1e6 / tick:>10,.0f} "
+              f"{scalar:>10.1f} {vectorized:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Soak-test the simulation with the autopilot playing
+
+Run from the repository root:
+
+    python -m benchmarks.soak_autopilot --games 20
+"""
+import argparse
+import time
+from src.core import SimulationCore, Autopilot
+from src.config.settings import AUTOPILOT_BUDGET_MS
+
+
+def play(sim, bot, max_ticks):
+    """Play one game with the bot, returns (score, ticks, length)"""
+    sim.reset()
+    while sim.ticks < max_ticks and sim.step(bot.decide(sim)):
+        pass
+    return sim.score, sim.ticks, len(sim.snake.positions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=20)
+    parser.add_argument('--max-ticks', type=int, default=10_000)
+    parser.add_argument('--budget-ms', type=float, default=AUTOPILOT_BUDGET_MS)
+    parser.add_argument('--swarm', type=int, default=0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    sim = SimulationCore(swarm_size=args.swarm, seed=args.seed)
+    bot = Autopilot(budget_ms=args.budget_ms)
+    start = time.perf_counter()
+    results = [play(sim, bot, args.max_ticks) for _ in range(args.games)]
+    elapsed = time.perf_counter() - start
+
+    scores = sorted(score for score, _, _ in results)
+    ticks = sum(ticks for _, ticks, _ in results)
+    print(f"{args.games} games, {ticks} ticks in {elapsed:.1f}s")
+    print(f"score: min {scores[0]}, median {scores[len(scores) // 2]}, max {scores[-1]}, "
+          f"longest snake {max(length for _, _, length in results)}")
+    stats = bot.decision_stats()
+    print(f"decision ms (last {stats['count']}): mean {stats['mean']:.3f}, p50 {stats['p50']:.3f}, "
+          f"p95 {stats['p95']:.3f}, p99 {stats['p99']:.3f}, max {stats['max']:.3f}; "
+          f"budget {args.budget_ms} ms missed {stats['budget_misses']} times")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""Benchmark suite for the tick, render and spawn hot paths
+
+Run from the repository root:
+
+    python -m benchmarks.suite --save-baseline   # record this machine's baseline
+    python -m benchmarks.suite                   # compare against it
+
+Every benchmark times one hot path in a fixed-seed scenario: a short
+snake, a 500-segment snake, a nearly full board, a bullet storm and a
+particle storm. A round restores the scenario several times and times
+each run of calls as one batch, so a round lasts milliseconds and timer
+overhead stays out of the result. The fastest round is compared, since
+noise from other processes only ever adds time. A benchmark slower than
+the baseline by more than --threshold is reported as a regression and
+the exit status is 1. Rendering runs under the SDL dummy video driver
+unless SDL_VIDEODRIVER is already set.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, List, NamedTuple, Optional
+import numpy as np
+
+SEED = 1234
+ROUNDS = 15
+THRESHOLD = 0.25  # Allowed slowdown of the fastest round before it counts as a regression
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# Scenario sizes
+SHORT_LENGTH = 3
+LONG_LENGTH = 500
+FULL_BOARD_SHARE = 0.95  # Part of the board covered by the snake in the full-board scenario
+PARTICLE_STORM = 20_000  # Live particles in the particle storm
+
+
+class Benchmark(NamedTuple):
+    name: str
+    calls: int  # Timed calls after each setup
+    repeats: int  # Setups per round, enough for a round to take milliseconds
+    setup: Callable[[], None]  # Restores the scenario, untimed
+    call: Callable[[int], object]  # Timed, gets the call index since setup
+    between: Optional[Callable[[], None]] = None  # Untimed work after each batch
+    batch: int = 0  # Calls timed together before between runs, 0 for all of them
+
+
+def serpentine(width, height):
+    """Board cells in back-and-forth row order, each next to the one before"""
+    order = []
+    for gy in range(height):
+        columns = range(width) if gy % 2 == 0 else range(width - 1, -1, -1)
+        order.extend((gx, gy) for gx in columns)
+    return order
+
+
+def scenario(sim, length, bullets=0):
+    """Snapshot of sim with a snake of length laid along the serpentine.
+
+    The head moves along a row with free cells ahead, the food sits on the
+    last cell of the board and the enemy starts in the corner farthest from
+    the head, so a round of ticks plays out without eating or dying.
+    """
+    from src.config.settings import GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, BASE_FPS, ENEMY_SPEED
+    order = serpentine(GRID_WIDTH, GRID_HEIGHT)
+    pixels = [(gx * GRID_SIZE, gy * GRID_SIZE) for gx, gy in order]
+    head, ahead = pixels[length - 1], pixels[length]
+    direction = ('right' if ahead[0] > head[0] else 'left' if ahead[0] < head[0] else 'down')
+    body = tuple(reversed(pixels[:length]))
+    snake = (body, length, direction, BASE_FPS, BASE_FPS, 0, 0, 0, False, 10, 0, None)
+
+    corners = [(0, 0), ((GRID_WIDTH - 1) * GRID_SIZE, 0), (0, (GRID_HEIGHT - 1) * GRID_SIZE),
+               ((GRID_WIDTH - 1) * GRID_SIZE, (GRID_HEIGHT - 1) * GRID_SIZE)]
+    corner = max(corners, key=lambda c: abs(c[0] - head[0]) + abs(c[1] - head[1]))
+    enemy = ((corner,) * 3, 3, 0, ENEMY_SPEED, 0, 'up', True)
+
+    bullet_state = None
+    if bullets:
+        rng = np.random.default_rng(SEED)
+        position = rng.uniform((0, 0), (GRID_WIDTH * GRID_SIZE, GRID_HEIGHT * GRID_SIZE), (bullets, 2))
+        velocity = np.zeros((bullets, 2))
+        axis = rng.integers(0, 2, bullets)
+        velocity[np.arange(bullets), axis] = rng.choice((-1, 1), bullets) * sim.bullets.speed
+        bullet_state = (position, velocity)
+
+    snapshot = sim.snapshot()._replace(
+        snake=snake, enemy=enemy, food=(pixels[-1], 'normal'), ammo=None, bullets=bullet_state,
+        game_over=False, previous_head=head, previous_tail=body[-1],
+        previous_enemy_position=corner, indexes=None)
+    sim.restore(snapshot)
+    return sim.snapshot()
+
+
+def add_particle_storm(graphics, count=PARTICLE_STORM):
+    """Fill the particle system with long-lived moving particles"""
+    rng = np.random.default_rng(SEED)
+    graphics.particles.clear()
+    size = (graphics.width, graphics.height)
+    for radius in (2, 3, 4):
+        graphics.particles.emit_many(rng.uniform((0, 0), size, (count // 3, 2)),
+                                     rng.uniform(-2, 2, (count // 3, 2)),
+                                     (255, 200, 80, 255), radius, lifetime=1_000_000)
+
+
+def build_benchmarks():
+    """Create the game under the dummy driver and every benchmark on it"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    from src.main import Game
+    from src.config.settings import GRID_WIDTH, GRID_HEIGHT, MAX_BULLETS
+
+    game = Game(seed=SEED)
+    game.record_replays = False
+    game.reset_game()
+    sim = game.sim
+    snapshots = {
+        'short': scenario(sim, SHORT_LENGTH),
+        'long': scenario(sim, LONG_LENGTH),
+        'full': scenario(sim, int(GRID_WIDTH * GRID_HEIGHT * FULL_BOARD_SHARE)),
+        'bullets': scenario(sim, SHORT_LENGTH, bullets=MAX_BULLETS),
+    }
+    snapshots['particles'] = snapshots['short']
+
+    def restorer(name, redraw=False):
+        def setup():
+            sim.restore(snapshots[name])
+            game.game_state = "playing"
+            game.graphics.particles.clear()
+            if name == 'particles':
+                add_particle_storm(game.graphics)
+            if redraw:
+                # Draw benchmarks start from a full frame of the scenario
+                game.renderer.request_full_redraw()
+                game.draw_game()
+        return setup
+
+    def draw(index):
+        game.draw_game((index % 4 + 1) / 4)
+
+    def move(index):
+        sim.snake.move()
+
+    def update(index):
+        game.update()
+
+    def randomize_food(index):
+        sim.food.randomize_position(sim.free_cells)
+
+    def update_particles(index):
+        game.graphics.update_particles()
+
+    # Scenarios leave room for about 20 ticks before the snake reaches a wall
+    benchmarks: List[Benchmark] = []
+    for name in ('short', 'long', 'full'):
+        benchmarks.append(Benchmark(f'snake_move/{name}', 20, 200, restorer(name), move))
+    for name in ('short', 'long', 'full', 'bullets'):
+        benchmarks.append(Benchmark(f'game_update/{name}', 20, 20, restorer(name), update))
+    for name in ('short', 'full'):
+        benchmarks.append(Benchmark(f'food_randomize/{name}', 500, 10, restorer(name), randomize_food))
+    for name in ('short', 'long', 'full', 'bullets', 'particles'):
+        # Four interpolated frames per tick, as at 60 fps with a snake near 15 ticks/sec
+        benchmarks.append(Benchmark(f'game_draw/{name}', 40, 2, restorer(name, redraw=True), draw,
+                                    game.update, batch=4))
+    benchmarks.append(Benchmark('update_particles/particles', 20, 1, restorer('particles'),
+                                update_particles))
+    return benchmarks
+
+
+def measure(benchmark, rounds):
+    """Mean time per call in microseconds, one per round"""
+    timer = time.perf_counter
+    call, between = benchmark.call, benchmark.between
+    batch = benchmark.batch or benchmark.calls
+    batches = [range(start, min(start + batch, benchmark.calls))
+               for start in range(0, benchmark.calls, batch)]
+    samples = []
+    for _ in range(rounds):
+        total = 0.0
+        for _ in range(benchmark.repeats):
+            benchmark.setup()
+            for indices in batches:
+                start = timer()
+                for index in indices:
+                    call(index)
+                total += timer() - start
+                if between:
+                    between()
+        samples.append(total / (benchmark.calls * benchmark.repeats) * 1e6)
+    return samples
+
+
+def run(pattern, rounds):
+    """Run the benchmarks whose name contains pattern, returns the results document"""
+    results = {}
+    for benchmark in build_benchmarks():
+        if pattern and pattern not in benchmark.name:
+            continue
+        samples = measure(benchmark, rounds)
+        results[benchmark.name] = {
+            "median_us": statistics.median(samples),
+            "min_us": min(samples),
+            "calls": benchmark.calls * benchmark.repeats,
+            "rounds": rounds,
+        }
+        print(f"{benchmark.name:<28} {results[benchmark.name]['min_us']:>10.1f} us", file=sys.stderr)
+    import pygame
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "seed": SEED,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Print current against baseline fastest rounds, returns the names that regressed"""
+    regressions = []
+    print(f"{'benchmark':<28} {'baseline us':>12} {'current us':>11} {'change':>8}")
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<28} {'-':>12} {result['min_us']:>11.1f} {'new':>8}")
+            continue
+        change = result["min_us"] / base["min_us"] - 1
+        status = ""
+        if change > threshold:
+            status = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<28} {base['min_us']:>12.1f} {result['min_us']:>11.1f} "
+              f"{change:>+8.1%}{status}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="write the results as the baseline")
+    parser.add_argument('--output', help="also write the results to this JSON file")
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help="slowdown ratio that counts as a regression, 0.25 is 25%%")
+    parser.add_argument('--rounds', type=int, default=ROUNDS)
+    parser.add_argument('--only', help="run only benchmarks whose name contains this")
+    args = parser.parse_args()
+
+    current = run(args.only, args.rounds)
+    if args.output:
+        with open(args.output, 'w') as stream:
+            json.dump(current, stream, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as stream:
+            json.dump(current, stream, indent=2)
+        print(f"baseline written to {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, run with --save-baseline first")
+        return
+    with open(args.baseline) as stream:
+        baseline = json.load(stream)
+    regressions = compare(current, baseline, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"no regressions over {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,13 @@
 import random
 import math
-import pygame
 from src.config.settings import (
     SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE,
     ENEMY_SPEED, ENEMY_COLOR, ENEMY_SIZE
 )
 
 class Enemy:
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random  # Game's random stream
         self.length = 3  # Start with 3 segments
         self.growth_queue = 0
         self.color = ENEMY_COLOR
@@ -17,23 +17,24 @@ class Enemy:
         self.active = True
         self.size = ENEMY_SIZE
         self.food_eaten = 0
-        self.direction = random.choice(['up', 'down', 'left', 'right'])
+        self.direction = self.rng.choice(['up', 'down', 'left', 'right'])
         self.spawn_at_edge()  # Call after initializing length and other attributes
         self.positions = [self.position] * self.length
 
     def spawn_at_edge(self):
-        edge = random.choice(['top', 'right', 'bottom', 'left'])
+        edge = self.rng.choice(['top', 'right', 'bottom', 'left'])
         if edge == 'top':
-            self.position = (random.randint(0, SCREEN_WIDTH - GRID_SIZE), 0)
+            self.position = (self.rng.randint(0, SCREEN_WIDTH - GRID_SIZE), 0)
         elif edge == 'right':
-            self.position = (SCREEN_WIDTH - GRID_SIZE, random.randint(0, SCREEN_HEIGHT - GRID_SIZE))
+            self.position = (SCREEN_WIDTH - GRID_SIZE, self.rng.randint(0, SCREEN_HEIGHT - GRID_SIZE))
         elif edge == 'bottom':
-            self.position = (random.randint(0, SCREEN_WIDTH - GRID_SIZE), SCREEN_HEIGHT - GRID_SIZE)
+            self.position = (self.rng.randint(0, SCREEN_WIDTH - GRID_SIZE), SCREEN_HEIGHT - GRID_SIZE)
         else:
-            self.position = (0, random.randint(0, SCREEN_HEIGHT - GRID_SIZE))
+            self.position = (0, self.rng.randint(0, SCREEN_HEIGHT - GRID_SIZE))
         self.positions = [self.position] * self.length
 
-    def move(self, snake_head, food_position):
+    def move(self, snake_head, food_position, waypoint=None):
+        """Step toward the snake or nearby food, via waypoint when chasing the snake"""
         if not self.active:
             return
         # Calculate distances to snake and food
@@ -47,6 +48,11 @@ class Enemy:
         if food_distance < snake_distance * 0.8:
             dx, dy = food_dx, food_dy
             distance = food_distance
+        elif waypoint is not None:
+            # Follow the path around obstacles instead of the straight line
+            dx = waypoint[0] - self.positions[0][0]
+            dy = waypoint[1] - self.positions[0][1]
+            distance = math.sqrt(dx * dx + dy * dy)
         else:
             dx, dy = snake_dx, snake_dy
             distance = snake_distance
@@ -73,6 +79,26 @@ class Enemy:
             self.positions.pop()
         self.position = self.positions[0]
 
+    def copy(self, rng):
+        """Return an independent enemy in the same state, drawing from rng"""
+        other = Enemy.__new__(Enemy)
+        other.__dict__ = self.__dict__.copy()
+        other.rng = rng
+        other.positions = self.positions.copy()
+        return other
+
+    def snapshot(self):
+        """Return the enemy's state as an immutable tuple"""
+        return (tuple(self.positions), self.length, self.growth_queue, self.speed,
+                self.food_eaten, self.direction, self.active)
+
+    def restore(self, state):
+        """Restore state returned by snapshot"""
+        (positions, self.length, self.growth_queue, self.speed,
+         self.food_eaten, self.direction, self.active) = state
+        self.positions = list(positions)
+        self.position = positions[0]
+
     def get_position_grid(self):
         x = round(self.positions[0][0] / GRID_SIZE) * GRID_SIZE
         y = round(self.positions[0][1] / GRID_SIZE) * GRID_SIZE
@@ -92,19 +118,3 @@ class Enemy:
 
     def reset_speed(self):
         self.speed = min(self.base_speed * 0.5, self.base_speed * (1 + self.food_eaten * 0.05))  # Reduced reset speed cap
-
-    def draw(self, screen):
-        # Draw each segment
-        for i, pos in enumerate(self.positions):
-            x, y = pos
-            seg_size = self.size if i == 0 else self.size - 2
-            color = (0, 255 - i * 10, 255 - i * 10) if i < 10 else (0, 50, 50)
-            pygame.draw.rect(screen, color, (x, y, seg_size, seg_size))
-        # Draw eyes on head
-        x, y = self.positions[0]
-        eye_size = max(4, int(self.size / 5))
-        eye_color = (255, 255, 255)
-        pygame.draw.rect(screen, eye_color,
-                        (x + self.size/4, y + self.size/4, eye_size, eye_size))
-        pygame.draw.rect(screen, eye_color,
-                        (x + self.size*2/3, y + self.size/4, eye_size, eye_size))
\ No newline at end of file
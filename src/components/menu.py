@@ -7,9 +7,11 @@ from src.config.settings import (
     SCREEN_WIDTH, SCREEN_HEIGHT, MENU_BACKGROUND,
     MENU_TEXT_COLOR, MENU_HIGHLIGHT_COLOR, MENU_FONT_SIZE
 )
+from src.utils.text import default_text_renderer, quantize_pulse
 
 class Menu:
-    def __init__(self):
+    def __init__(self, text=None):
+        self.text = text if text is not None else default_text_renderer()
         self.main_options = ["Play Game", "High Scores", "Options", "Help", "Quit"]
         self.options_menu = ["Difficulty", "Controls", "Sound", "Back"]
         self.difficulties = ["Easy", "Medium", "Hard"]
@@ -22,13 +24,13 @@ class Menu:
         self.input_delay = 0.15  # Seconds between inputs
         
     def render_text(self, screen, text, position, size, color, pulsing=False):
-        font = pygame.font.Font(None, size)
         if pulsing:
-            # Create a pulsing effect for selected options
-            pulse = (math.sin(time.time() * 5) + 1) / 2  # Value between 0 and 1
-            color = tuple(max(0, min(255, c + 40 * pulse)) for c in color)
+            # Create a pulsing effect for selected options, quantized so the
+            # rendered text is reused from the cache
+            pulse = quantize_pulse((math.sin(time.time() * 5) + 1) / 2)
+            color = tuple(max(0, min(255, int(c + 40 * pulse))) for c in color)
         
-        text_surface = font.render(text, True, color)
+        text_surface = self.text.render(text, size, color)
         text_rect = text_surface.get_rect(center=position)
         screen.blit(text_surface, text_rect)
         
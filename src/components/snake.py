@@ -1,22 +1,43 @@
-import pygame
 import random
-import time
+from collections import deque
 from src.config.settings import (
     GRID_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT,
     SNAKE_HEAD_COLOR, SNAKE_BODY_COLOR,
-    BASE_FPS, BOOSTED_FPS, SPEED_BOOST_DURATION,
+    BASE_FPS, BOOSTED_FPS, SPEED_BOOST_TICKS,
     MAX_FPS, SPEED_INCREMENT
 )
+from src.utils.clock import TickClock
+from src.utils.collision import check_self_collision
+
+# Grid offsets for each direction
+MOVES = {
+    'up': (0, -GRID_SIZE),
+    'down': (0, GRID_SIZE),
+    'left': (-GRID_SIZE, 0),
+    'right': (GRID_SIZE, 0)
+}
+
+OPPOSITES = {
+    'left': 'right',
+    'right': 'left',
+    'up': 'down',
+    'down': 'up'
+}
 
 class Snake:
-    def __init__(self):
+    def __init__(self, clock=None, rng=None):
+        self.clock = clock if clock is not None else TickClock()
+        self.rng = rng if rng is not None else random  # Game's random stream
         self.reset()
         
     def reset(self):
         """Reset snake to initial state"""
         self.length = 1
-        self.positions = [((SCREEN_WIDTH / 2), (SCREEN_HEIGHT / 2))]
-        self.direction = random.choice(['up', 'down', 'left', 'right'])
+        start = ((SCREEN_WIDTH / 2), (SCREEN_HEIGHT / 2))
+        self.positions = deque([start])  # Head at index 0
+        self.occupied = {start: 1}  # Cell -> number of segments on it
+        self.occupied_shared = False  # occupied is also held by a snapshot, copy before changing
+        self.direction = self.rng.choice(['up', 'down', 'left', 'right'])
         self.base_speed = BASE_FPS  # Store base speed separately
         self.speed = self.base_speed
         self.speed_boost_end = 0
@@ -26,6 +47,40 @@ class Snake:
         self.ammo_count = 0  # Initialize ammo count
         self.growth_queue = 0  # Track pending growth segments
         
+    def snapshot(self):
+        """Return the snake's state as an immutable tuple.
+
+        The occupancy counts are shared with the snake until its next move.
+        """
+        self.occupied_shared = True
+        return (tuple(self.positions), self.length, self.direction, self.base_speed,
+                self.speed, self.speed_boost_end, self.score, self.food_eaten,
+                self.is_boosted, self.ammo_count, self.growth_queue, self.occupied)
+
+    def restore(self, state):
+        """Restore state returned by snapshot, occupancy None recounts the positions"""
+        (positions, self.length, self.direction, self.base_speed,
+         self.speed, self.speed_boost_end, self.score, self.food_eaten,
+         self.is_boosted, self.ammo_count, self.growth_queue, occupied) = state
+        self.positions = deque(positions)
+        if occupied is None:
+            occupied = {}
+            for position in positions:
+                occupied[position] = occupied.get(position, 0) + 1
+        self.occupied = occupied
+        self.occupied_shared = True
+
+    def copy(self, clock, rng):
+        """Return an independent snake in the same state, on clock and rng"""
+        other = Snake.__new__(Snake)
+        other.__dict__ = self.__dict__.copy()
+        other.clock = clock
+        other.rng = rng
+        other.positions = self.positions.copy()
+        # Both copy the shared occupancy counts before their next move
+        self.occupied_shared = other.occupied_shared = True
+        return other
+
     @property
     def head(self):
         """Get the snake's head position"""
@@ -33,14 +88,7 @@ class Snake:
     
     def turn(self, direction):
         """Change snake's direction if valid"""
-        opposites = {
-            'left': 'right',
-            'right': 'left',
-            'up': 'down',
-            'down': 'up'
-        }
-        
-        if self.length > 1 and direction == opposites.get(self.direction):
+        if self.length > 1 and direction == OPPOSITES.get(self.direction):
             return
         
         self.direction = direction
@@ -50,24 +98,28 @@ class Snake:
         x, y = self.positions[0]
         
         # Update position based on direction
-        moves = {
-            'up': (0, -GRID_SIZE),
-            'down': (0, GRID_SIZE),
-            'left': (-GRID_SIZE, 0),
-            'right': (GRID_SIZE, 0)
-        }
-        dx, dy = moves[self.direction]
+        dx, dy = MOVES[self.direction]
         
         # Add new head position
         new_position = (x + dx, y + dy)
-        self.positions.insert(0, new_position)
+        self.positions.appendleft(new_position)
+        occupied = self.occupied
+        if self.occupied_shared:
+            occupied = self.occupied = dict(occupied)
+            self.occupied_shared = False
+        occupied[new_position] = occupied.get(new_position, 0) + 1
         
         # Handle growth queue
         if self.growth_queue > 0:
             self.growth_queue -= 1
             self.length += 1
         elif len(self.positions) > self.length:
-            self.positions.pop()
+            tail = self.positions.pop()
+            count = occupied[tail] - 1
+            if count:
+                occupied[tail] = count
+            else:
+                del occupied[tail]
             
         # Update speed boost
         self._update_speed_boost()
@@ -83,13 +135,15 @@ class Snake:
         """Queue growth segments"""
         self.growth_queue += amount
 
-    def apply_food_effect(self, effect, duration=SPEED_BOOST_DURATION):
-        """Apply effects from food"""
+    def apply_food_effect(self, effect, duration=None):
+        """Apply effects from food, duration is measured in clock ticks"""
+        if duration is None:
+            duration = SPEED_BOOST_TICKS  # Looked up per call so tuning overrides apply
         self.food_eaten += 1  # Increment food counter
         
         if effect == 'speed':
             self.speed = BOOSTED_FPS
-            self.speed_boost_end = time.time() + duration
+            self.speed_boost_end = self.clock.ticks + duration
             self.is_boosted = True
         elif effect == 'grow':
             self.grow(3)  # Grow by 3 segments for special food
@@ -98,13 +152,17 @@ class Snake:
 
     def _update_speed_boost(self):
         """Update speed boost status"""
-        if self.is_boosted and time.time() >= self.speed_boost_end:
+        if self.is_boosted and self.clock.ticks >= self.speed_boost_end:
             self.speed = BASE_FPS
             self.is_boosted = False
 
     def collides_with_self(self):
         """Check if snake collides with itself"""
-        return self.head in self.positions[1:]
+        return check_self_collision(self.occupied, self.head)
+
+    def occupies(self, position):
+        """Check if any segment of the snake is on the given cell"""
+        return position in self.occupied
 
     def collides_with_walls(self):
         """Check if snake collides with walls"""
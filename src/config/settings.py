@@ -14,6 +14,10 @@ BASE_FPS = 8  # Slower initial speed
 BOOSTED_FPS = 12  # Moderate boost
 MAX_FPS = 20  # Maximum speed cap
 SPEED_INCREMENT = 0.2  # Speed increase per food eaten
+RENDER_FPS = 60  # Frame rate cap for drawing, independent of the snake's move rate
+MENU_ANIMATION_FPS = 30  # Redraw rate of the animated menu
+IDLE_WAIT_MS = 1000  # Longest sleep while waiting for input in static screens
+INPUT_BUFFER_SIZE = 3  # Turns buffered ahead of the snake, applied one per tick
 
 # Colors
 BLACK = (0, 0, 0)
@@ -26,6 +30,7 @@ PURPLE = (128, 0, 128)
 
 # Game settings
 SPEED_BOOST_DURATION = 5  # Duration of speed boost in seconds
+SPEED_BOOST_TICKS = SPEED_BOOST_DURATION * BOOSTED_FPS  # Boost length in simulation ticks
 ENEMY_SPEED = 0.2  # Drastically reduced starting speed of the enemy
 FONT_SIZE = 36  # Default font size for text display
 MENU_FONT_SIZE = 72  # Font size for menu title
@@ -35,6 +40,7 @@ BACKGROUND_COLOR = BLACK
 SNAKE_HEAD_COLOR = GREEN
 SNAKE_BODY_COLOR = (50, 200, 50)
 GRID_LINE_COLOR = (30, 30, 30)
+DIRTY_RECT_RENDERING = True  # Push only changed areas instead of flipping the whole screen
 
 # Food types and their properties
 FOOD_TYPES = {
@@ -46,6 +52,30 @@ FOOD_TYPES = {
 # Enemy settings
 ENEMY_COLOR = BLUE
 ENEMY_SIZE = GRID_SIZE
+ENEMY_MAX_LENGTH = 64  # Segment cap for swarm enemies
+SWARM_SIZE = 0  # Extra enemies moved as a vectorized swarm, raise for harder games
+ENEMY_AI = 'greedy'  # 'greedy' steers straight at the target, 'pathfinding' routes around the snake
+PATHFINDING_BUDGET_MS = 2.0  # Search time per tick before enemies fall back to greedy steering
+
+# Replay settings
+RECORD_REPLAYS = True  # Record every game played in the window
+REPLAY_DIR = 'replays'  # Directory for session replay files
+REPLAY_BUFFER_SIZE = 4096  # Bytes buffered before a replay file is written
+
+# Profiler settings
+PROFILE_FRAMES = False  # Time frame phases from startup instead of only while the overlay is shown
+PROFILER_WINDOW = 600  # Frames kept for percentiles and trace export, 10 seconds at 60 fps
+PROFILE_DIR = 'profiles'  # Directory for exported frame traces
+
+# Autopilot settings
+AUTOPILOT_BUDGET_MS = 4.0  # Decision time per tick before the bot takes its best move so far
+HAMILTONIAN_FRACTION = 0.5  # Board share the body must cover before the bot follows a fixed cycle
+
+# Bullet settings
+BULLET_COLOR = YELLOW
+BULLET_SIZE = GRID_SIZE // 2
+BULLET_SPEED = GRID_SIZE * 1.5  # Pixels per tick, faster than the snake
+MAX_BULLETS = 32  # Cap on live bullets, further shots are refused
 
 # Menu settings
 MENU_BACKGROUND = BLACK
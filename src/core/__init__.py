@@ -0,0 +1,12 @@
+"""Core package with the pygame-free game simulation."""
+from .simulation import SimulationCore
+from .input_queue import InputQueue
+from .spatial import SpatialGrid
+from .bullets import BulletPool
+from .swarm import EnemySwarm
+from .flow_field import FlowField
+from .autopilot import Autopilot
+from .snapshot import Snapshot
+from .batch import BatchSnakeSim
+
+__all__ = ['SimulationCore', 'InputQueue', 'SpatialGrid', 'BulletPool', 'EnemySwarm', 'FlowField', 'Autopilot', 'Snapshot', 'BatchSnakeSim']
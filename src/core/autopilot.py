@@ -0,0 +1,240 @@
+"""Bot that plays the snake for soak tests and attract mode"""
+import heapq
+import time
+from collections import deque
+from src.config.settings import (
+    GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, AUTOPILOT_BUDGET_MS, HAMILTONIAN_FRACTION
+)
+
+# Number of recent decision times kept for statistics
+DECISION_SAMPLES = 1024
+
+# Node expansions between checks of the time budget
+BUDGET_CHECK_INTERVAL = 64
+
+
+class Autopilot:
+    """Picks the snake's next direction from the current game state.
+
+    ``decide(sim)`` returns a direction for ``SimulationCore.step``. It
+    finds a path to the food with A*, where body segments count as free
+    once the tail has moved off them. The path is only taken if, after
+    eating, the tail can still be reached by flood fill. Otherwise the
+    snake follows its tail or moves into the largest open area. Once the
+    body covers ``hamiltonian_fraction`` of the board, it follows a
+    Hamiltonian cycle instead, which never traps a snake that stays on
+    it. Cells on and around enemies are avoided. Searches stop when the
+    per-tick budget runs out, and the best move found so far is used.
+    """
+
+    def __init__(self, budget_ms=AUTOPILOT_BUDGET_MS, hamiltonian_fraction=HAMILTONIAN_FRACTION,
+                 width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.budget = budget_ms / 1000
+        self.width = width
+        self.height = height
+        self.hamiltonian_length = int(width * height * hamiltonian_fraction)
+        self.successor = self._hamiltonian_cycle()
+        self.neighbors = [list(self._cell_neighbors(cell)) for cell in range(width * height)]
+        self.decision_times = deque(maxlen=DECISION_SAMPLES)
+        self.budget_misses = 0
+        self.deadline = 0.0
+
+    def _hamiltonian_cycle(self):
+        """Next cell along a cycle visiting every cell, for even board heights"""
+        width, height = self.width, self.height
+        order = []
+        for gy in range(height):
+            # Serpentine over columns 1.. then return up column 0
+            columns = range(1, width) if gy % 2 == 0 else range(width - 1, 0, -1)
+            order.extend(gy * width + gx for gx in columns)
+        order.extend(gy * width for gy in range(height - 1, -1, -1))
+        successor = [0] * (width * height)
+        for index, cell in enumerate(order):
+            successor[cell] = order[(index + 1) % len(order)]
+        return successor
+
+    def _cell(self, position):
+        return int(position[1] // GRID_SIZE) * self.width + int(position[0] // GRID_SIZE)
+
+    def _cell_neighbors(self, cell):
+        """(direction, cell) pairs of the on-board neighbors of cell"""
+        gx, gy = cell % self.width, cell // self.width
+        if gy > 0:
+            yield 'up', cell - self.width
+        if gy < self.height - 1:
+            yield 'down', cell + self.width
+        if gx > 0:
+            yield 'left', cell - 1
+        if gx < self.width - 1:
+            yield 'right', cell + 1
+
+    def _out_of_time(self):
+        return time.perf_counter() > self.deadline
+
+    def decide(self, sim):
+        """Return the direction to move in this tick, or None to keep going"""
+        start = time.perf_counter()
+        self.deadline = start + self.budget
+        try:
+            return self._decide(sim)
+        finally:
+            self.decision_times.append(time.perf_counter() - start)
+
+    def _decide(self, sim):
+        snake = sim.snake
+        body = [self._cell(position) for position in snake.positions]
+        head = body[0]
+        growth = snake.growth_queue
+
+        # Steps until each body cell is vacated by the tail
+        vacate = {}
+        for index, cell in enumerate(body):
+            vacate[cell] = max(vacate.get(cell, 0), len(body) - index + growth)
+        danger = self._enemy_cells(sim)
+
+        moves = [(direction, cell) for direction, cell in self.neighbors[head]
+                 if vacate.get(cell, 0) <= 1]
+        if not moves:
+            return None  # Every move is fatal; keep the current direction
+        # Risk a cell near an enemy only when nothing else is open
+        moves = [move for move in moves if move[1] not in danger] or moves
+
+        if len(body) >= self.hamiltonian_length:
+            successor = self.successor[head]
+            for direction, cell in moves:
+                if cell == successor:
+                    return direction
+
+        food = self._cell(sim.food.position)
+        path = self._find_path(head, food, vacate, danger)
+        if path and not self._out_of_time():
+            food_growth = 3 if sim.food.effect == 'grow' else 1
+            if self._tail_reachable(path, body, growth + food_growth, danger):
+                return self._direction(head, path[0], moves)
+        if self._out_of_time():
+            self.budget_misses += 1
+            return self._direction(head, path[0], moves) if path else moves[0][0]
+        return self._safest_move(moves, body, growth, danger)
+
+    def _enemy_cells(self, sim):
+        """Cells an enemy occupies or can reach this tick, including diagonals"""
+        cells = [sim.enemy_cell]
+        if sim.swarm.count:
+            cells += sim.swarm.cells.tolist()
+        danger = set()
+        for x, y in cells:
+            gx, gy = int(x // GRID_SIZE), int(y // GRID_SIZE)
+            for ny in range(max(0, gy - 1), min(self.height, gy + 2)):
+                for nx in range(max(0, gx - 1), min(self.width, gx + 2)):
+                    danger.add(ny * self.width + nx)
+        return danger
+
+    def _direction(self, head, cell, moves):
+        for direction, move_cell in moves:
+            if move_cell == cell:
+                return direction
+        return moves[0][0]
+
+    def _find_path(self, head, goal, vacate, danger):
+        """A* path from head to goal as a list of cells excluding head, or None"""
+        width = self.width
+        gx, gy = goal % width, goal // width
+
+        def estimate(cell):
+            return abs(cell % width - gx) + abs(cell // width - gy)
+
+        came_from = {head: None}
+        cost = {head: 0}
+        frontier = [(estimate(head), 0, head)]
+        expanded = 0
+        while frontier:
+            _, steps, cell = heapq.heappop(frontier)
+            if cell == goal:
+                path = []
+                while cell != head:
+                    path.append(cell)
+                    cell = came_from[cell]
+                path.reverse()
+                return path
+            if steps > cost[cell]:
+                continue
+            expanded += 1
+            if expanded % BUDGET_CHECK_INTERVAL == 0 and self._out_of_time():
+                return None
+            steps += 1
+            for _, neighbor in self.neighbors[cell]:
+                # A body cell is passable once the tail has left it
+                if vacate.get(neighbor, 0) > steps or neighbor in danger:
+                    continue
+                if steps < cost.get(neighbor, steps + 1):
+                    cost[neighbor] = steps
+                    came_from[neighbor] = cell
+                    heapq.heappush(frontier, (steps + estimate(neighbor), steps, neighbor))
+        return None
+
+    def _reachable(self, start, target, blocked):
+        """Flood fill from start until target is touched.
+
+        Returns whether target was reached and how many cells were filled,
+        which is the whole open area around start when it was not.
+        """
+        seen = {start}
+        queue = deque([start])
+        neighbors = self.neighbors
+        if start == target:
+            return True, 1
+        expanded = 0
+        while queue:
+            cell = queue.popleft()
+            for _, neighbor in neighbors[cell]:
+                if neighbor == target:
+                    return True, len(seen)
+                if neighbor not in seen and neighbor not in blocked:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+            # seen can grow by several cells per step, so count steps instead
+            expanded += 1
+            if expanded % BUDGET_CHECK_INTERVAL == 0 and self._out_of_time():
+                break
+        return False, len(seen)
+
+    def _advance(self, path, body, growth):
+        """Body after following path, head first, growing by up to growth"""
+        moved = list(reversed(path)) + body
+        return moved[:len(body) + min(growth, len(path))]
+
+    def _tail_reachable(self, path, body, growth, danger):
+        """Check if the tail is still reachable after following path"""
+        after = self._advance(path, body, growth)
+        tail = after[-1]
+        blocked = set(after[:-1]) | danger
+        return self._reachable(after[0], tail, blocked)[0]
+
+    def _safest_move(self, moves, body, growth, danger):
+        """Prefer moves that keep the tail reachable, then the most open space"""
+        best = None
+        for direction, cell in moves:
+            after = self._advance([cell], body, growth)
+            blocked = set(after[:-1]) | danger
+            tail_found, space = self._reachable(cell, after[-1], blocked)
+            score = (len(after) > 1 and tail_found, space)
+            if best is None or score > best[0]:
+                best = (score, direction)
+        return best[1]
+
+    def decision_stats(self):
+        """Return decision time statistics in milliseconds"""
+        samples = sorted(self.decision_times)
+        if not samples:
+            return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0,
+                    "budget_misses": self.budget_misses}
+        count = len(samples)
+        return {
+            "count": count,
+            "mean": sum(samples) / count * 1000,
+            "p50": samples[count // 2] * 1000,
+            "p95": samples[min(count - 1, int(count * 0.95))] * 1000,
+            "p99": samples[min(count - 1, int(count * 0.99))] * 1000,
+            "max": samples[-1] * 1000,
+            "budget_misses": self.budget_misses,
+        }
@@ -0,0 +1,405 @@
+"""Many independent games stored in arrays and stepped in lockstep"""
+import numpy as np
+from src.components.ammo import AMMO_PER_PICKUP
+from src.components.food import FOOD_WEIGHTS
+from src.config.settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE, GRID_WIDTH, GRID_HEIGHT,
+    BASE_FPS, BOOSTED_FPS, MAX_FPS, SPEED_INCREMENT, SPEED_BOOST_TICKS,
+    ENEMY_SPEED, FOOD_TYPES, BULLET_SPEED, MAX_BULLETS
+)
+
+# Action codes accepted by BatchSnakeSim.step, indexes into ACTIONS
+ACTIONS = (None, 'up', 'down', 'left', 'right', 'shoot')
+NOOP, UP, DOWN, LEFT, RIGHT, SHOOT = range(len(ACTIONS))
+
+# Grid step per direction code, which is the action code minus one
+STEP_X = np.array([0, 0, -1, 1])
+STEP_Y = np.array([-1, 1, 0, 0])
+
+# Food type codes index FOOD_NAMES, in FOOD_TYPES order
+FOOD_NAMES = tuple(FOOD_TYPES)
+FOOD_POINTS = np.array([FOOD_TYPES[name]['points'] for name in FOOD_NAMES])
+FOOD_ODDS = np.cumsum([FOOD_WEIGHTS[name] for name in FOOD_NAMES])
+FOOD_BOOSTS = np.array([FOOD_TYPES[name]['effect'] == 'speed' for name in FOOD_NAMES])
+# Segments gained by the snake (a boost gives none) and by an enemy per food type
+SNAKE_GROWTH = np.array([{'speed': 0, 'grow': 3}.get(FOOD_TYPES[name]['effect'], 1)
+                         for name in FOOD_NAMES])
+ENEMY_GROWTH = np.array([3 if FOOD_TYPES[name]['effect'] == 'grow' else 1
+                         for name in FOOD_NAMES])
+
+CELLS = GRID_WIDTH * GRID_HEIGHT
+START_X = int(SCREEN_WIDTH / 2 // GRID_SIZE)  # Snake.reset starts mid-screen
+START_Y = int(SCREEN_HEIGHT / 2 // GRID_SIZE)
+EDGE_X = SCREEN_WIDTH - GRID_SIZE  # Farthest enemy position on each axis
+EDGE_Y = SCREEN_HEIGHT - GRID_SIZE
+
+# Random draws tried per free-cell sample before listing the free cells
+SAMPLE_ROUNDS = 8
+
+
+class BatchSnakeSim:
+    """``count`` independent games advanced together by one ``step``.
+
+    Every attribute is an array with one row per game, so a tick runs the
+    same few dozen array operations whether it advances one game or
+    thousands. The rules are those of ``SimulationCore.step`` with a
+    single enemy per game: turns and shots, food effects from
+    ``FOOD_TYPES``, the enemy's chase, growth and slowdown, ammo pickup
+    and bullet hits. Random draws come from one NumPy generator, so games
+    follow the same odds as ``SimulationCore`` but not the same sequence.
+
+    Snake bodies are cell indexes (``y * GRID_WIDTH + x``) in a ring
+    buffer shared by all games, and ``occupied`` counts segments per cell
+    for self-collision and food placement. Games that end are recorded
+    in ``final_score`` and ``final_ticks`` and restart within the same
+    ``step``, so every row always holds a running game.
+    """
+
+    def __init__(self, count, seed=None, bullet_capacity=MAX_BULLETS):
+        self.count = count
+        self.rng = np.random.default_rng(seed)
+        self.rows = np.arange(count)
+        self.capacity = CELLS + 1  # A longer body must overlap itself
+        self.body = np.zeros((count, self.capacity), dtype=np.int16)
+        self.head_slot = 0  # Ring buffer slot holding the current heads
+        self.occupied = np.zeros((count, CELLS), dtype=np.int8)
+        # Flat views and row offsets, as 1-D fancy indexing is much faster than 2-D
+        self.body_flat = self.body.reshape(-1)
+        self.body_offsets = self.rows * self.capacity
+        self.occupied_flat = self.occupied.reshape(-1)
+        self.cell_offsets = self.rows * CELLS
+
+        self.bullet_capacity = bullet_capacity
+        self.bullet_x = np.zeros((count, bullet_capacity))
+        self.bullet_y = np.zeros((count, bullet_capacity))
+        self.bullet_dx = np.zeros((count, bullet_capacity))
+        self.bullet_dy = np.zeros((count, bullet_capacity))
+        self.bullet_live = np.zeros((count, bullet_capacity), dtype=bool)
+        self.bullet_fired = np.zeros((count, bullet_capacity), dtype=np.int64)  # Tick fired, oldest hits first
+
+        self.high_score = np.zeros(count, dtype=np.int64)
+        self.final_score = np.zeros(count, dtype=np.int64)  # Score of each row's last finished game
+        self.final_ticks = np.zeros(count, dtype=np.int64)
+        self.episodes = 0  # Games finished across all rows
+        self.reset()
+
+    def __len__(self):
+        return self.count
+
+    def reset(self):
+        """Start a new game in every row"""
+        count = self.count
+        self.head_x = np.zeros(count, dtype=np.int64)
+        self.head_y = np.zeros(count, dtype=np.int64)
+        self.head = np.zeros(count, dtype=np.int64)
+        self.direction = np.zeros(count, dtype=np.int64)
+        self.length = np.zeros(count, dtype=np.int64)
+        self.growth_queue = np.zeros(count, dtype=np.int64)
+        self.food_eaten = np.zeros(count, dtype=np.int64)
+        self.ammo_count = np.zeros(count, dtype=np.int64)
+        self.boosted = np.zeros(count, dtype=bool)
+        self.boost_end = np.zeros(count, dtype=np.int64)
+        self.ticks = np.zeros(count, dtype=np.int64)
+        self.score = np.zeros(count, dtype=np.int64)
+
+        self.enemy_x = np.zeros(count)
+        self.enemy_y = np.zeros(count)
+        self.enemy_cell = np.zeros(count, dtype=np.int64)
+        self.enemy_length = np.zeros(count, dtype=np.int64)
+        self.enemy_growth = np.zeros(count, dtype=np.int64)
+        self.enemy_food_eaten = np.zeros(count, dtype=np.int64)
+        self.enemy_speed = np.zeros(count)
+        self.slowdown_end = np.zeros(count, dtype=np.int64)
+
+        self.food_cell = np.zeros(count, dtype=np.int64)
+        self.food_type = np.zeros(count, dtype=np.int64)
+        self.ammo_cell = np.full(count, -1, dtype=np.int64)  # -1 while no ammo is on the board
+        self.bullet_count = np.zeros(count, dtype=np.int64)
+        self._reset_games(self.rows)
+
+    def _reset_games(self, games):
+        """Restart the games in rows games, as SimulationCore.reset"""
+        self.occupied[games] = 0
+        self.head_x[games] = START_X
+        self.head_y[games] = START_Y
+        start = START_Y * GRID_WIDTH + START_X
+        self.head[games] = start
+        self.body[games, self.head_slot] = start
+        self.occupied[games, start] = 1
+        self.direction[games] = self.rng.integers(0, 4, len(games))
+        self.length[games] = 1
+        for array in (self.growth_queue, self.food_eaten, self.ammo_count, self.boost_end,
+                      self.ticks, self.score, self.enemy_growth, self.enemy_food_eaten,
+                      self.slowdown_end, self.food_type, self.bullet_count):
+            array[games] = 0
+        self.boosted[games] = False
+
+        self.enemy_length[games] = 3
+        self.enemy_speed[games] = ENEMY_SPEED
+        self._spawn_enemies(games)
+        self.ammo_cell[games] = -1
+        self.bullet_live[games] = False
+        # The board is nearly empty, so a free cell always exists
+        self.food_cell[games] = self._sample_free(games, self.ammo_cell)
+
+    def _spawn_enemies(self, games):
+        """Move the enemies of games to random points on the screen edge"""
+        count = len(games)
+        edge = self.rng.integers(0, 4, count)  # Top, right, bottom, left
+        along_x = self.rng.integers(0, EDGE_X + 1, count)
+        along_y = self.rng.integers(0, EDGE_Y + 1, count)
+        x = np.where(edge == 1, EDGE_X, np.where(edge == 3, 0, along_x))
+        y = np.where(edge == 0, 0, np.where(edge == 2, EDGE_Y, along_y))
+        self.enemy_x[games] = x
+        self.enemy_y[games] = y
+        self.enemy_cell[games] = self._cells(x, y)
+
+    def _cells(self, x, y):
+        """Cell indexes of pixel positions rounded to the grid, as Enemy.get_position_grid"""
+        return (np.round(y / GRID_SIZE).astype(np.int64) * GRID_WIDTH +
+                np.round(x / GRID_SIZE).astype(np.int64))
+
+    def _sample_free(self, games, other):
+        """A random free cell for each of games, or -1 where the board is full.
+
+        Cells are free of the snake, the enemy and ``other``, an array of
+        per-game cells (the food or the ammo, -1 for none). Draws are
+        retried a few times, which nearly always succeeds, before the
+        remaining games pick from a list of their free cells.
+        """
+        rng = self.rng
+        cells = rng.integers(0, CELLS, len(games))
+        pending = np.arange(len(games))
+        for _ in range(SAMPLE_ROUNDS):
+            rows = games[pending]
+            drawn = cells[pending]
+            taken = ((self.occupied_flat[self.cell_offsets[rows] + drawn] > 0) |
+                     (drawn == self.enemy_cell[rows]) |
+                     (drawn == other[rows]))
+            pending = pending[taken]
+            if not len(pending):
+                return cells
+            cells[pending] = rng.integers(0, CELLS, len(pending))
+        for index in pending.tolist():
+            row = games[index]
+            free = self.occupied[row] == 0
+            free[self.enemy_cell[row]] = False
+            if other[row] >= 0:
+                free[other[row]] = False
+            choices = np.flatnonzero(free)
+            cells[index] = rng.choice(choices) if len(choices) else -1
+        return cells
+
+    def _random_food(self, count):
+        """Food type codes drawn with Food.set_random_type odds"""
+        return np.searchsorted(FOOD_ODDS, self.rng.random(count) * FOOD_ODDS[-1], side='right')
+
+    def step(self, actions):
+        """Advance every game one tick, returns a mask of the games that ended.
+
+        ``actions`` holds one action code per game. Each ended game's score
+        and length in ticks are stored in ``final_score`` and
+        ``final_ticks`` before the row restarts.
+        """
+        actions = np.asarray(actions)
+        rows = self.rows
+
+        # Turns, except reversing into the body
+        turning = (actions >= UP) & (actions <= RIGHT)
+        if turning.any():
+            wanted = actions - 1
+            turning &= ~(((wanted ^ 1) == self.direction) & (self.length > 1))
+            self.direction = np.where(turning, wanted, self.direction)
+        shooting = actions == SHOOT
+        if shooting.any():
+            self._shoot(np.flatnonzero(shooting & (self.ammo_count > 0) &
+                                       (self.bullet_count < self.bullet_capacity)))
+        ticks = self.ticks
+        ticks += 1
+
+        # Move snakes; off-board heads are clamped for indexing and end the game below
+        x = self.head_x + STEP_X[self.direction]
+        y = self.head_y + STEP_Y[self.direction]
+        off_board = (x < 0) | (x >= GRID_WIDTH) | (y < 0) | (y >= GRID_HEIGHT)
+        head = np.clip(y, 0, GRID_HEIGHT - 1) * GRID_WIDTH + np.clip(x, 0, GRID_WIDTH - 1)
+        self.head_x, self.head_y, self.head = x, y, head
+        growing = self.growth_queue > 0
+        self.growth_queue -= growing
+        slot = self.head_slot = (self.head_slot + 1) % self.capacity
+        occupied = self.occupied_flat
+        shrinking = np.flatnonzero(~growing)
+        tail_slots = (slot - self.length[shrinking]) % self.capacity
+        tail = self.body_flat[self.body_offsets[shrinking] + tail_slots]
+        occupied[self.cell_offsets[shrinking] + tail] -= 1
+        self.length += growing
+        self.body[:, slot] = head
+        head_index = self.cell_offsets + head
+        occupied[head_index] += 1
+        crashed = off_board | (occupied[head_index] > 1)
+
+        # Boosts run out, then enemies slow down during a boost and recover after
+        boosted = self.boosted
+        boosted &= ticks < self.boost_end
+        recovered = ~boosted & (self.slowdown_end > 0) & (ticks >= self.slowdown_end)
+        if boosted.any() or recovered.any():
+            self.enemy_speed[boosted] = max(ENEMY_SPEED * 0.2, 0.1)
+            self.enemy_speed[recovered] = ENEMY_SPEED
+            self.slowdown_end = np.where(boosted, self.boost_end,
+                                         np.where(recovered, 0, self.slowdown_end))
+
+        food_x = (self.food_cell % GRID_WIDTH) * GRID_SIZE
+        food_y = (self.food_cell // GRID_WIDTH) * GRID_SIZE
+        self._move_enemies(x * GRID_SIZE, y * GRID_SIZE, food_x, food_y)
+
+        # Move bullets; a hit respawns the enemy before the collision checks
+        if self.bullet_count.any():
+            hit = self._move_bullets()
+            if len(hit):
+                self._spawn_enemies(hit)
+                self.score[hit] += 5  # Bonus points for hitting enemy
+
+        crashed |= self.enemy_cell == head
+        alive = ~crashed
+
+        # Snake eats food
+        eaters = np.flatnonzero(alive & (head == self.food_cell))
+        if len(eaters):
+            kind = self.food_type[eaters]
+            self.score[eaters] += FOOD_POINTS[kind]
+            self.food_eaten[eaters] += 1
+            self.growth_queue[eaters] += SNAKE_GROWTH[kind]
+            boosting = eaters[FOOD_BOOSTS[kind]]
+            # A fresh boost briefly speeds the enemy until the next tick slows it
+            fresh = boosting[~self.boosted[boosting]]
+            self.boosted[boosting] = True
+            self.boost_end[boosting] = ticks[boosting] + SPEED_BOOST_TICKS
+            self.enemy_speed[fresh] = max(ENEMY_SPEED * 0.5, 1)
+            self.slowdown_end[fresh] = self.boost_end[fresh]
+            alive[eaters[self._respawn_food(eaters)]] = False
+
+        # Enemy eats food
+        eaters = np.flatnonzero(alive & (self.enemy_cell == self.food_cell))
+        if len(eaters):
+            self.enemy_growth[eaters] += ENEMY_GROWTH[self.food_type[eaters]]
+            eaten = self.enemy_food_eaten[eaters] = self.enemy_food_eaten[eaters] + 1
+            # Speed changes slightly for every 4th food consumed
+            fourth = eaters[eaten % 4 == 0]
+            self.enemy_speed[fourth] = np.minimum(ENEMY_SPEED * 0.5,
+                                                  self.enemy_speed[fourth] + ENEMY_SPEED * 0.01)
+            alive[eaters[self._respawn_food(eaters)]] = False
+
+        # Pick up ammo, or place new ammo where there is none
+        ammo_cell = self.ammo_cell
+        pickers = np.flatnonzero(alive & (head == ammo_cell))
+        missing = np.flatnonzero(alive & (ammo_cell < 0))
+        if len(pickers):
+            self.ammo_count[pickers] += AMMO_PER_PICKUP
+            ammo_cell[pickers] = -1
+        if len(missing):
+            ammo_cell[missing] = self._sample_free(missing, self.food_cell)
+
+        np.maximum(self.high_score, self.score, out=self.high_score)
+        ended = ~alive
+        if ended.any():
+            games = np.flatnonzero(ended)
+            self.final_score[games] = self.score[games]
+            self.final_ticks[games] = ticks[games]
+            self.episodes += len(games)
+            self._reset_games(games)
+        return ended
+
+    def _shoot(self, games):
+        """Fire a bullet from the snake's head in each of games"""
+        slots = self.bullet_live[games].argmin(axis=1)  # First free slot
+        direction = self.direction[games]
+        self.bullet_x[games, slots] = self.head_x[games] * GRID_SIZE
+        self.bullet_y[games, slots] = self.head_y[games] * GRID_SIZE
+        self.bullet_dx[games, slots] = STEP_X[direction] * BULLET_SPEED
+        self.bullet_dy[games, slots] = STEP_Y[direction] * BULLET_SPEED
+        self.bullet_live[games, slots] = True
+        self.bullet_fired[games, slots] = self.ticks[games]
+        self.bullet_count[games] += 1
+        self.ammo_count[games] -= 1
+
+    def _move_enemies(self, snake_x, snake_y, food_x, food_y):
+        """Steer every enemy one tick toward its snake or nearby food, as Enemy.move"""
+        enemy_x, enemy_y = self.enemy_x, self.enemy_y
+        snake_dx = snake_x - enemy_x
+        snake_dy = snake_y - enemy_y
+        food_dx = food_x - enemy_x
+        food_dy = food_y - enemy_y
+        snake_distance = np.sqrt(snake_dx * snake_dx + snake_dy * snake_dy)
+        food_distance = np.sqrt(food_dx * food_dx + food_dy * food_dy)
+
+        # Choose target based on distance
+        chase_food = food_distance < snake_distance * 0.8
+        dx = np.where(chase_food, food_dx, snake_dx)
+        dy = np.where(chase_food, food_dy, snake_dy)
+        distance = np.where(chase_food, food_distance, snake_distance)
+        distance[distance == 0] = 1  # A zero delta stays zero
+        rate = self.enemy_speed / (ENEMY_SPEED * 2)
+        enemy_x += dx / distance * GRID_SIZE * rate
+        enemy_y += dy / distance * GRID_SIZE * rate
+        np.clip(enemy_x, 0, EDGE_X, out=enemy_x)
+        np.clip(enemy_y, 0, EDGE_Y, out=enemy_y)
+        self.enemy_cell = self._cells(enemy_x, enemy_y)
+
+        growing = self.enemy_growth > 0
+        self.enemy_growth -= growing
+        self.enemy_length += growing
+
+    def _move_bullets(self):
+        """Move every live bullet, returns the games whose enemy was hit.
+
+        Hits use the same swept test as ``BulletPool.update``: the oldest
+        bullet whose path this tick comes within one cell of the enemy
+        is spent, and bullets that leave the screen are dropped.
+        """
+        games = np.flatnonzero(self.bullet_count)
+        live = self.bullet_live[games]
+        start_x = self.bullet_x[games]
+        start_y = self.bullet_y[games]
+        end_x = start_x + self.bullet_dx[games]
+        end_y = start_y + self.bullet_dy[games]
+        keep = live & (end_x >= 0) & (end_x <= SCREEN_WIDTH) & (end_y >= 0) & (end_y <= SCREEN_HEIGHT)
+
+        # Bounding box of each bullet's path against its game's enemy cell
+        cell = self.enemy_cell[games]
+        target_x = ((cell % GRID_WIDTH) * GRID_SIZE)[:, None]
+        target_y = ((cell // GRID_WIDTH) * GRID_SIZE)[:, None]
+        hits = (live &
+                (np.maximum(start_x, end_x) > target_x - GRID_SIZE) &
+                (np.minimum(start_x, end_x) < target_x + GRID_SIZE) &
+                (np.maximum(start_y, end_y) > target_y - GRID_SIZE) &
+                (np.minimum(start_y, end_y) < target_y + GRID_SIZE))
+        hit = hits.any(axis=1)
+        if hit.any():
+            oldest = np.where(hits, self.bullet_fired[games], np.iinfo(np.int64).max).argmin(axis=1)
+            shot = np.flatnonzero(hit)
+            keep[shot, oldest[shot]] = False
+
+        self.bullet_x[games] = end_x
+        self.bullet_y[games] = end_y
+        self.bullet_live[games] = keep
+        self.bullet_count[games] = keep.sum(axis=1)
+        return games[hit]
+
+    def _respawn_food(self, games):
+        """Give games a new food type and cell, returns a mask of games with a full board"""
+        self.food_type[games] = self._random_food(len(games))
+        cells = self._sample_free(games, self.ammo_cell)
+        self.food_cell[games] = cells
+        return cells < 0
+
+    @property
+    def snake_speed(self):
+        """Move rate of each snake in ticks per second, as Snake.move sets Snake.speed"""
+        return np.where(self.boosted, BOOSTED_FPS,
+                        np.minimum(MAX_FPS, BASE_FPS + self.food_eaten * SPEED_INCREMENT))
+
+    def positions(self, index):
+        """Segment positions of one game's snake in pixels, head first"""
+        slots = (self.head_slot - np.arange(self.length[index])) % self.capacity
+        cells = self.body[index, slots].tolist()
+        return [((cell % GRID_WIDTH) * GRID_SIZE, (cell // GRID_WIDTH) * GRID_SIZE)
+                for cell in cells]
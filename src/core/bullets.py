@@ -0,0 +1,143 @@
+"""Preallocated bullet pool with vectorized movement and swept collision"""
+import numpy as np
+from src.config.settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE, BULLET_SPEED, MAX_BULLETS
+)
+
+# Unit velocity per firing direction
+VELOCITIES = {
+    'up': (0, -1),
+    'down': (0, 1),
+    'left': (-1, 0),
+    'right': (1, 0),
+}
+
+
+class BulletPool:
+    """Live bullets stored as parallel arrays.
+
+    Live bullets occupy the first ``count`` slots in firing order, so a
+    tick moves and culls all of them with a few array operations instead
+    of one ``Bullet`` object and one ``list.remove`` per shot. Hits are
+    tested against the whole segment travelled during the tick, so a
+    bullet moving 1.5 cells per tick cannot skip over an enemy.
+
+    ``copy`` shares the arrays with the new pool and whichever pool next
+    changes them copies them first, so cloning a game is cheap.
+    """
+
+    def __init__(self, capacity=MAX_BULLETS, speed=BULLET_SPEED):
+        self.capacity = capacity
+        self.speed = speed
+        self.count = 0
+        self.dropped = 0  # Shots refused because the pool was full
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.shared = False  # Arrays also held by a copy, copied before changing
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """Yield the (x, y) position of each live bullet"""
+        return iter(map(tuple, self.position[:self.count].tolist()))
+
+    def is_full(self):
+        """Check if no further bullet can be fired"""
+        return self.count >= self.capacity
+
+    def spawn(self, position, direction):
+        """Fire a bullet from position, returns False if the pool is full"""
+        if self.count >= self.capacity:
+            self.dropped += 1
+            return False
+        if self.shared:
+            self._unshare()
+        dx, dy = VELOCITIES[direction]
+        self.position[self.count] = position
+        self.velocity[self.count] = (dx * self.speed, dy * self.speed)
+        self.count += 1
+        return True
+
+    def update(self, targets, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+        """Move all bullets one tick, returns indices of the targets hit.
+
+        ``targets`` is a sequence of (x, y) cell positions; a bullet hits a
+        target when its path comes within less than one cell of it on both
+        axes. Each target absorbs at most one bullet per tick, the oldest
+        one that reached it, and bullets that hit or leave the screen are
+        removed.
+        """
+        n = self.count
+        if not n:
+            return []
+        if self.shared:
+            self._unshare()
+        start = self.position[:n].copy()
+        end = self.position[:n]
+        end += self.velocity[:n]
+
+        keep = ((end[:, 0] >= 0) & (end[:, 0] <= width) &
+                (end[:, 1] >= 0) & (end[:, 1] <= height))
+
+        hit_targets = []
+        if len(targets):
+            # Bounding box of each bullet's path against every target cell
+            low = np.minimum(start, end)[:, None, :]
+            high = np.maximum(start, end)[:, None, :]
+            cells = np.asarray(targets, dtype=float)[None, :, :]
+            hits = ((high > cells - GRID_SIZE) & (low < cells + GRID_SIZE)).all(axis=2)
+            if hits.any():
+                spent = np.zeros(n, dtype=bool)
+                for target in np.flatnonzero(hits.any(axis=0)).tolist():
+                    shooters = np.flatnonzero(hits[:, target] & ~spent)
+                    if len(shooters):
+                        spent[shooters[0]] = True
+                        hit_targets.append(target)
+                keep &= ~spent
+
+        live = int(np.count_nonzero(keep))
+        if live != n:
+            self.position[:live] = self.position[:n][keep]
+            self.velocity[:live] = self.velocity[:n][keep]
+            self.count = live
+        return hit_targets
+
+    def copy(self):
+        """Return an independent pool holding the same bullets"""
+        other = BulletPool.__new__(BulletPool)
+        other.__dict__ = self.__dict__.copy()
+        # Both copy the shared arrays before their next change
+        self.shared = other.shared = True
+        return other
+
+    def _unshare(self):
+        self.position = self.position.copy()
+        self.velocity = self.velocity.copy()
+        self.shared = False
+
+    def snapshot(self):
+        """Return read-only copies of the live bullets, or None if there are none"""
+        if not self.count:
+            return None
+        position = self.position[:self.count].copy()
+        velocity = self.velocity[:self.count].copy()
+        position.flags.writeable = False
+        velocity.flags.writeable = False
+        return (position, velocity)
+
+    def restore(self, state):
+        """Restore state returned by snapshot"""
+        if state is None:
+            self.count = 0
+            return
+        if self.shared:
+            self._unshare()
+        position, velocity = state
+        count = self.count = len(position)
+        self.position[:count] = position
+        self.velocity[:count] = velocity
+
+    def clear(self):
+        """Remove all bullets"""
+        self.count = 0
@@ -0,0 +1,120 @@
+"""Shared breadth-first flow field leading enemies to the snake head"""
+import time
+from collections import deque
+from src.config.settings import GRID_SIZE, GRID_WIDTH, GRID_HEIGHT
+
+# Number of cells expanded between checks of the time budget
+BUDGET_CHECK_INTERVAL = 64
+
+
+class FlowField:
+    """Next step toward one target cell for every reachable board cell.
+
+    A single breadth-first search runs outward from the target, so the
+    cell each board cell was discovered from is its next step on a
+    shortest path; one search serves every enemy. The search is lazy: it
+    stops as soon as all requested cells are reached or the time budget
+    runs out, and resumes from its frontier when asked again for the same
+    target and obstacles. Cells the search has not reached yet have no
+    step and callers fall back to their own steering.
+    """
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        self.neighbors = [self._neighbors(cell) for cell in range(width * height)]
+        self.key = None
+        self.searches = 0  # Fields started from scratch
+        self.reuses = 0  # Requests answered by an existing field
+        self.budget_misses = 0  # Requests that ran out of time
+        self.parent = [-1] * (width * height)
+        self.queue = deque()
+
+    def _neighbors(self, cell):
+        gx, gy = cell % self.width, cell // self.width
+        cells = []
+        if gy > 0:
+            cells.append(cell - self.width)
+        if gy < self.height - 1:
+            cells.append(cell + self.width)
+        if gx > 0:
+            cells.append(cell - 1)
+        if gx < self.width - 1:
+            cells.append(cell + 1)
+        return cells
+
+    def cell_of(self, position):
+        """Cell index a pixel position rounds to, or None if off the board"""
+        gx = round(position[0] / GRID_SIZE)
+        gy = round(position[1] / GRID_SIZE)
+        if 0 <= gx < self.width and 0 <= gy < self.height:
+            return gy * self.width + gx
+        return None
+
+    def target(self, position, blocked, key=None):
+        """Aim the field at position, avoiding the blocked positions.
+
+        The existing search is kept when ``key`` (by default the target
+        position itself) matches the previous call, so obstacles that
+        change without the target moving must be reflected in ``key``.
+        """
+        key = position if key is None else key
+        if key == self.key:
+            self.reuses += 1
+            return
+        self.key = key
+        self.searches += 1
+        parent = self.parent = [-1] * (self.width * self.height)
+        for cell in map(self.cell_of, blocked):
+            if cell is not None:
+                parent[cell] = -2  # Never entered by the search
+        start = self.cell_of(position)
+        self.queue = deque()
+        if start is not None:
+            parent[start] = start
+            self.queue.append(start)
+
+    def expand(self, positions, budget=None):
+        """Search until every position is reached, returns False if out of time.
+
+        ``budget`` is in seconds; None searches without a limit.
+        """
+        parent = self.parent
+        goals = [cell for cell in map(self.cell_of, positions)
+                 if cell is not None and parent[cell] == -1]
+        queue = self.queue
+        neighbors = self.neighbors
+        deadline = None if budget is None else time.perf_counter() + budget
+        expanded = 0
+        while goals and queue:
+            cell = queue.popleft()
+            for neighbor in neighbors[cell]:
+                if parent[neighbor] == -1:
+                    parent[neighbor] = cell
+                    queue.append(neighbor)
+            expanded += 1
+            if expanded % BUDGET_CHECK_INTERVAL == 0:
+                goals = [goal for goal in goals if parent[goal] == -1]
+                if deadline is not None and time.perf_counter() > deadline:
+                    if goals:
+                        self.budget_misses += 1
+                        return False
+        return True
+
+    def step(self, position):
+        """Pixel position of the next cell from position toward the target, or None"""
+        cell = self.cell_of(position)
+        if cell is None:
+            return None
+        next_cell = self.parent[cell]
+        if next_cell < 0:
+            return None
+        return ((next_cell % self.width) * GRID_SIZE, (next_cell // self.width) * GRID_SIZE)
+
+    def stats(self):
+        """Return search, reuse and budget miss counts"""
+        return {
+            "searches": self.searches,
+            "reuses": self.reuses,
+            "budget_misses": self.budget_misses,
+        }
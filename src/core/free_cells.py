@@ -0,0 +1,149 @@
+"""Incrementally maintained index of unoccupied grid cells"""
+import random
+from array import array
+from functools import lru_cache
+from src.config.settings import GRID_SIZE, GRID_WIDTH, GRID_HEIGHT
+
+# Sample by drawing board cells while at least 1/REJECTION_RATIO of them are free
+REJECTION_RATIO = 8
+
+
+@lru_cache(maxsize=None)
+def empty_tables(size):
+    """Read-only cell numbers and zero counts for a board of size cells, copied by reset"""
+    return array('i', range(size)), array('i', [0]) * size
+
+
+class FreeCellIndex:
+    """Free cells of the board kept in an array with swap-remove.
+
+    Every cell has an occupancy count; a cell is listed in ``free`` while its
+    count is zero and ``slots`` remembers where, so occupying, releasing and
+    sampling a random free cell are all O(1). Positions are pixel
+    coordinates as used by the components; positions off the board are
+    ignored. Once few cells are free, samples index ``free`` directly, so
+    they depend on its order, which follows from the order of occupy and
+    release calls. Replays make the same calls and snapshots carry the
+    order, so both draw the same cells; an index rebuilt from positions
+    alone may not.
+
+    The three tables are flat integer arrays. ``snapshot`` hands them out
+    without copying and the index copies them before its next change, so
+    snapshots between changes share one copy.
+    """
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, rng=None):
+        self.rng = rng if rng is not None else random  # Game's random stream
+        self.width = width
+        self.height = height
+        self.all_cells, self.no_counts = empty_tables(width * height)  # Copied on reset
+        self.reset()
+
+    def reset(self):
+        """Mark every cell as free"""
+        self.counts = self.no_counts[:]
+        self.free = self.all_cells[:]
+        self.slots = self.all_cells[:]  # Index of each cell in free, -1 if taken
+        self.shared = False  # Tables also held by a snapshot, copied before changing
+
+    def snapshot(self):
+        """Return the index tables, shared with the index until it next changes"""
+        self.shared = True
+        return (self.counts, self.free, self.slots)
+
+    def restore(self, state):
+        """Restore tables returned by snapshot"""
+        self.counts, self.free, self.slots = state
+        self.shared = True
+
+    def copy(self, rng):
+        """Return an independent index of the same cells, sampling with rng"""
+        other = FreeCellIndex.__new__(FreeCellIndex)
+        other.__dict__ = self.__dict__.copy()
+        other.rng = rng
+        # Both copy the shared tables before their next change
+        self.shared = other.shared = True
+        return other
+
+    def _unshare(self):
+        self.counts = self.counts[:]
+        self.free = self.free[:]
+        self.slots = self.slots[:]
+        self.shared = False
+
+    def _cell(self, position):
+        gx = int(position[0] // GRID_SIZE)
+        gy = int(position[1] // GRID_SIZE)
+        if 0 <= gx < self.width and 0 <= gy < self.height:
+            return gy * self.width + gx
+        return None
+
+    def occupy(self, position):
+        """Add one occupant to the cell at position"""
+        cell = self._cell(position)
+        if cell is not None:
+            self.occupy_cell(cell)
+
+    def occupy_cell(self, cell):
+        """Add one occupant to a cell given by its number"""
+        if self.shared:
+            self._unshare()
+        count = self.counts[cell]
+        self.counts[cell] = count + 1
+        if count == 0:
+            # Swap-remove the cell from the free array
+            free = self.free
+            slot = self.slots[cell]
+            last = free.pop()
+            if last != cell:
+                free[slot] = last
+                self.slots[last] = slot
+            self.slots[cell] = -1
+
+    def occupy_all(self, positions):
+        """Add one occupant to the cell at each position"""
+        occupy = self.occupy
+        for position in positions:
+            occupy(position)
+
+    def release(self, position):
+        """Remove one occupant from the cell at position"""
+        cell = self._cell(position)
+        if cell is not None:
+            self.release_cell(cell)
+
+    def release_cell(self, cell):
+        """Remove one occupant from a cell given by its number"""
+        if self.counts[cell] == 0:
+            return
+        if self.shared:
+            self._unshare()
+        count = self.counts[cell] - 1
+        self.counts[cell] = count
+        if count == 0:
+            self.slots[cell] = len(self.free)
+            self.free.append(cell)
+
+    def is_free(self, position):
+        """Check if the cell at position has no occupants"""
+        cell = self._cell(position)
+        return cell is not None and self.counts[cell] == 0
+
+    def sample(self):
+        """Return a random free position, or None if the board is full"""
+        free = self.free
+        if not free:
+            return None
+        size = len(self.counts)
+        if len(free) * REJECTION_RATIO >= size:
+            # Mostly empty board: draw cells until a free one comes up
+            counts = self.counts
+            cell = self.rng.randrange(size)
+            while counts[cell]:
+                cell = self.rng.randrange(size)
+        else:
+            cell = free[self.rng.randrange(len(free))]
+        return ((cell % self.width) * GRID_SIZE, (cell // self.width) * GRID_SIZE)
+
+    def __len__(self):
+        return len(self.free)
@@ -0,0 +1,66 @@
+"""Buffered player turns applied one per simulation tick"""
+import time
+from collections import deque
+from src.components.snake import OPPOSITES
+from src.config.settings import INPUT_BUFFER_SIZE
+
+# Number of recent input-to-tick latencies kept for statistics
+LATENCY_SAMPLES = 256
+
+
+class InputQueue:
+    """FIFO of timestamped turns so quick presses are not lost.
+
+    Every turn is checked against the direction queued before it (or the
+    snake's current direction), so two presses within one tick become two
+    consecutive moves instead of overwriting each other or reversing.
+    """
+
+    def __init__(self, max_turns=INPUT_BUFFER_SIZE, timer=time.perf_counter):
+        self.max_turns = max_turns
+        self.timer = timer
+        self.turns = deque()
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.dropped = 0
+
+    def push_turn(self, direction, current_direction, length):
+        """Queue a turn, returns False if it is redundant, a reversal or overflow"""
+        last = self.turns[-1][0] if self.turns else current_direction
+        if direction == last:
+            return False
+        if length > 1 and direction == OPPOSITES[last]:
+            return False
+        if len(self.turns) >= self.max_turns:
+            self.dropped += 1
+            return False
+        self.turns.append((direction, self.timer()))
+        return True
+
+    def pop_turn(self):
+        """Take the oldest queued turn for this tick, or None"""
+        if not self.turns:
+            return None
+        direction, timestamp = self.turns.popleft()
+        self.latencies.append(self.timer() - timestamp)
+        return direction
+
+    def clear(self):
+        """Drop all queued turns"""
+        self.turns.clear()
+
+    def __len__(self):
+        return len(self.turns)
+
+    def latency_stats(self):
+        """Return input-to-tick latency statistics in milliseconds"""
+        samples = sorted(self.latencies)
+        if not samples:
+            return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        count = len(samples)
+        return {
+            "count": count,
+            "mean": sum(samples) / count * 1000,
+            "p50": samples[count // 2] * 1000,
+            "p95": samples[min(count - 1, int(count * 0.95))] * 1000,
+            "max": samples[-1] * 1000,
+        }
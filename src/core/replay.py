@@ -0,0 +1,199 @@
+"""Compact replay recording and headless playback of SimulationCore games"""
+from collections import namedtuple
+from src.core.simulation import SimulationCore, DIRECTIONS, SHOOT
+from src.config.settings import REPLAY_BUFFER_SIZE
+
+# File header: magic bytes followed by the format version
+MAGIC = b'SSRP'
+VERSION = 1
+
+# Action codes packed into the low bits of each event
+ACTIONS = DIRECTIONS + (SHOOT,)
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+END_CODE = 7  # Closes a game; its delta is the tick the game ended on
+CODE_BITS = 3
+
+# Enemy AI names stored as one byte
+ENEMY_AIS = ('greedy', 'pathfinding')
+
+
+def encode_varint(value, out):
+    """Append value as an unsigned LEB128 varint"""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data, offset):
+    """Read a varint at offset, returns (value, offset after it)"""
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise EOFError("truncated varint")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class ReplayGame(namedtuple('ReplayGame', 'seed swarm_size enemy_ai events ticks score')):
+    """One recorded game: its setup, the actions applied and how it ended.
+
+    ``events`` holds (tick the action was applied before, action) pairs;
+    ``ticks`` and ``score`` are None if the recording stopped mid-game.
+    """
+    __slots__ = ()
+
+
+class ReplayWriter:
+    """Streams games to a binary file through an in-memory buffer.
+
+    Each game stores its seed and settings, then one varint per action:
+    the ticks since the previous action shifted left by three bits, with
+    the action code in the low bits. A turn in a running game takes one
+    or two bytes. The buffer is written out when it grows past
+    ``buffer_size`` and whenever a game ends.
+    """
+
+    def __init__(self, stream, buffer_size=REPLAY_BUFFER_SIZE):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.buffer = bytearray(MAGIC)
+        self.buffer.append(VERSION)
+        self.in_game = False
+        self.last_tick = 0
+        self.bytes_written = 0
+
+    def begin_game(self, seed, swarm_size=0, enemy_ai='greedy'):
+        """Start recording a game simulated from seed"""
+        if self.in_game:
+            raise ValueError("previous game was not ended")
+        encode_varint(seed, self.buffer)
+        encode_varint(swarm_size, self.buffer)
+        self.buffer.append(ENEMY_AIS.index(enemy_ai))
+        self.in_game = True
+        self.last_tick = 0
+
+    def record(self, tick, action):
+        """Record action as applied before the simulation's tick-th step"""
+        delta = tick - self.last_tick
+        self.last_tick = tick
+        encode_varint(delta << CODE_BITS | ACTION_CODES[action], self.buffer)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def end_game(self, tick, score):
+        """Close the current game at its final tick and score"""
+        if not self.in_game:
+            return
+        encode_varint((tick - self.last_tick) << CODE_BITS | END_CODE, self.buffer)
+        encode_varint(score, self.buffer)
+        self.in_game = False
+        self.flush()
+
+    def flush(self):
+        """Write the buffered bytes to the stream"""
+        if self.buffer:
+            self.stream.write(self.buffer)
+            self.bytes_written += len(self.buffer)
+            self.buffer = bytearray()
+        self.stream.flush()
+
+    def close(self):
+        """Flush and close the stream; an unfinished game stays open-ended"""
+        self.flush()
+        self.stream.close()
+
+
+def read_replay(data):
+    """Yield the games recorded in data.
+
+    The writer only flushes between events, so a recording cut short by a
+    crash yields its last game with ``ticks`` None. Data cut in the middle
+    of a value raises EOFError.
+    """
+    if len(data) <= len(MAGIC) or data[:len(MAGIC)] != MAGIC:
+        raise ValueError("not a replay file")
+    if data[len(MAGIC)] != VERSION:
+        raise ValueError(f"unsupported replay version {data[len(MAGIC)]}")
+    offset = len(MAGIC) + 1
+    while offset < len(data):
+        seed, offset = decode_varint(data, offset)
+        swarm_size, offset = decode_varint(data, offset)
+        if offset >= len(data):
+            raise EOFError("truncated game header")
+        enemy_ai = ENEMY_AIS[data[offset]]
+        offset += 1
+        events = []
+        tick = 0
+        ticks = score = None
+        while offset < len(data):
+            value, offset = decode_varint(data, offset)
+            tick += value >> CODE_BITS
+            code = value & ((1 << CODE_BITS) - 1)
+            if code == END_CODE:
+                ticks = tick
+                score, offset = decode_varint(data, offset)
+                break
+            events.append((tick, ACTIONS[code]))
+        yield ReplayGame(seed, swarm_size, enemy_ai, events, ticks, score)
+
+
+def load_replay(path):
+    """Read every game in a replay file"""
+    with open(path, 'rb') as stream:
+        return list(read_replay(stream.read()))
+
+
+class ReplayPlayer:
+    """Re-simulates a recorded game tick by tick.
+
+    ``step()`` advances one tick, applying the recorded actions first, so
+    a renderer can drive it at any pace; ``run()`` plays the rest of the
+    game headlessly as fast as the simulation allows. Pathfinding games
+    are replayed without a search time budget, so they only match if the
+    recording never ran out of budget either.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.sim = SimulationCore(swarm_size=game.swarm_size, enemy_ai=game.enemy_ai,
+                                  path_budget_ms=None, seed=game.seed)
+        self.next_event = 0
+
+    @property
+    def finished(self):
+        """Check if the recorded game has been played to its end"""
+        if self.sim.game_over:
+            return True
+        return self.game.ticks is not None and self.sim.ticks >= self.game.ticks
+
+    def step(self):
+        """Advance one tick, returns False once the game is finished"""
+        if self.finished:
+            return False
+        sim = self.sim
+        events = self.game.events
+        index = self.next_event
+        while index < len(events) and events[index][0] <= sim.ticks:
+            sim.apply_action(events[index][1])
+            index += 1
+        self.next_event = index
+        sim.step()
+        return not self.finished
+
+    def run(self):
+        """Play to the end of the recording, returns the simulation"""
+        while self.step():
+            pass
+        return self.sim
+
+    def matches_recording(self):
+        """Check if the finished simulation reproduced the recorded end"""
+        game = self.game
+        return (game.ticks is None or
+                (self.sim.ticks == game.ticks and self.sim.score == game.score))
@@ -0,0 +1,410 @@
+"""Headless simulation core holding all game rules"""
+import numpy as np
+from src.components.snake import Snake
+from src.components.food import Food
+from src.components.enemy import Enemy
+from src.components.ammo import Ammo
+from src.core.bullets import BulletPool
+from src.core.flow_field import FlowField
+from src.core.free_cells import FreeCellIndex
+from src.core.snapshot import Snapshot
+from src.core.spatial import SpatialGrid
+from src.core.swarm import EnemySwarm
+from src.config.settings import GRID_SIZE, SWARM_SIZE, ENEMY_AI, PATHFINDING_BUDGET_MS
+from src.utils.collision import check_enemy_collision, check_food_collision, find_enemy_collisions
+from src.utils.clock import TickClock
+from src.utils.rng import GameRng
+
+# Actions accepted by SimulationCore.step
+DIRECTIONS = ('up', 'down', 'left', 'right')
+SHOOT = 'shoot'
+
+# Swarm waypoint for enemies the flow field has not reached
+NO_WAYPOINT = (np.nan, np.nan)
+
+# Spatial grid keys, which mean the same in clones; swarm enemies are keyed by index
+ENEMY_KEY = 'enemy'
+FOOD_KEY = 'food'
+AMMO_KEY = 'ammo'
+
+
+class SimulationCore:
+    """Game state plus rules, advanced one tick at a time without pygame.
+
+    ``step(action)`` applies an optional action (a direction from
+    ``DIRECTIONS`` or ``SHOOT``) and advances the world by one tick.
+    Rendering and input live in ``Game``; this class never touches the
+    display so it can run on headless workers. All timers run on the
+    injected ``TickClock``, so results do not depend on wall-clock time,
+    and all randomness comes from ``rng`` (a ``GameRng``, or one seeded
+    with ``seed``), so a seed plus the actions passed to ``step``
+    reproduce a game exactly.
+    """
+
+    def __init__(self, clock=None, swarm_size=SWARM_SIZE, enemy_ai=ENEMY_AI,
+                 path_budget_ms=PATHFINDING_BUDGET_MS, rng=None, seed=None):
+        self.clock = clock if clock is not None else TickClock()
+        self.rng = rng if rng is not None else GameRng(seed)
+        self.enemy_ai = enemy_ai
+        self.free_cells = FreeCellIndex(rng=self.rng)
+        self.spatial = SpatialGrid()  # Enemies, food and ammo by cell
+        self.bullets = BulletPool()
+        self.swarm = EnemySwarm(swarm_size, rng=self.rng)  # Extra enemies beyond self.enemy
+        # Shared path search for the 'pathfinding' enemy AI, None for greedy steering
+        self.flow_field = FlowField() if enemy_ai == 'pathfinding' else None
+        self.path_budget = None if path_budget_ms is None else path_budget_ms / 1000
+        self.high_score = 0
+        self.snake = Snake(self.clock, self.rng)
+        # Reseed so SimulationCore(seed=s) starts exactly like reset(s)
+        self.reset(self.rng.initial_seed)
+
+    def reset(self, seed=None):
+        """Start a new game keeping the high score, reseeding rng if seed is given"""
+        if seed is not None:
+            self.rng.seed(seed)
+        self.snake.reset()
+        self.enemy = Enemy(self.rng)
+        self.swarm.reset()
+        self.food = Food(self.rng)
+        self.ammo = None
+        self._rebuild_indexes(place_food=True)
+        if self.flow_field is not None:
+            self.flow_field.key = None  # A new game can repeat the last key with another body
+
+        self.bullets.clear()
+        self.score = 0
+        self.enemy_slowdown_end = 0  # Track enemy slowdown timer
+        self.game_over = False
+        self.clock.reset()
+
+        # State before the last tick, for interpolated rendering
+        self.previous_head = self.snake.head
+        self.previous_tail = self.snake.head
+        self.previous_enemy_position = self.enemy.position
+        self.previous_swarm_heads = self.swarm.heads.copy()
+
+    def _rebuild_indexes(self, place_food=False):
+        """Rebuild the free-cell and spatial indexes from scratch"""
+        free_cells = self.free_cells
+        free_cells.reset()
+        free_cells.occupy_all(self.snake.positions)
+        self.enemy_cell = self.enemy.get_position_grid()
+        free_cells.occupy(self.enemy_cell)
+        swarm_cells = self.swarm.cells.tolist()
+        for cell in swarm_cells:
+            free_cells.occupy(cell)
+        if place_food:
+            self.food.randomize_position(free_cells)
+        free_cells.occupy(self.food.position)
+
+        spatial = self.spatial
+        spatial.clear()
+        spatial.insert(ENEMY_KEY, self.enemy_cell, 'enemy')
+        # Swarm enemies are registered by their index in the swarm
+        for index, cell in enumerate(swarm_cells):
+            spatial.insert(index, cell, 'enemy')
+        spatial.insert(FOOD_KEY, self.food.position, 'food')
+        if self.ammo:
+            free_cells.occupy(self.ammo.position)
+            spatial.insert(AMMO_KEY, self.ammo.position, 'ammo')
+
+    def snapshot(self, include_rng=True):
+        """Capture the game state for restore.
+
+        The state of ``rng`` is part of the snapshot so a restored game
+        replays identically; search code that re-randomizes every rollout
+        can pass ``include_rng=False``, which makes snapshots several
+        times cheaper.
+        """
+        swarm = self.swarm
+        return Snapshot(
+            self.clock.snapshot(),
+            self.snake.snapshot(),
+            self.enemy.snapshot(),
+            self.food.snapshot(),
+            self.ammo.position if self.ammo else None,
+            self.bullets.snapshot(),
+            swarm.snapshot(),
+            self.score,
+            self.high_score,
+            self.enemy_slowdown_end,
+            self.game_over,
+            self.previous_head,
+            self.previous_tail,
+            self.previous_enemy_position,
+            self.previous_swarm_heads.copy() if swarm.count else None,
+            self.rng.getstate() if include_rng else None,
+            (self.free_cells.snapshot(), self.enemy_cell),
+        )
+
+    def restore(self, snapshot):
+        """Return to the state captured by snapshot"""
+        self.clock.restore(snapshot.clock)
+        self.snake.restore(snapshot.snake)
+        self.enemy.restore(snapshot.enemy)
+        self.food.restore(snapshot.food)
+        self.bullets.restore(snapshot.bullets)
+        self.swarm.restore(snapshot.swarm)
+        if snapshot.ammo is None:
+            if self.ammo:
+                self.spatial.remove(AMMO_KEY)
+            self.ammo = None
+        else:
+            if self.ammo is None:
+                self.ammo = Ammo()
+            self.ammo.position = snapshot.ammo
+        self.score = snapshot.score
+        self.high_score = snapshot.high_score
+        self.enemy_slowdown_end = snapshot.enemy_slowdown_end
+        self.game_over = snapshot.game_over
+        self.previous_head = snapshot.previous_head
+        self.previous_tail = snapshot.previous_tail
+        self.previous_enemy_position = snapshot.previous_enemy_position
+        if snapshot.previous_swarm_heads is not None:
+            self.previous_swarm_heads = snapshot.previous_swarm_heads.copy()
+        if snapshot.rng is not None:
+            self.rng.setstate(snapshot.rng)
+        if self.flow_field is not None:
+            self.flow_field.key = None  # Obstacles may differ for the same key
+        if snapshot.indexes is None:
+            self._rebuild_indexes()
+            return
+        free_cells, self.enemy_cell = snapshot.indexes
+        self.free_cells.restore(free_cells)
+        # Moving the few entities in the spatial grid is cheaper than copying it
+        spatial = self.spatial
+        spatial.move(ENEMY_KEY, self.enemy_cell, 'enemy')
+        if self.swarm.count:
+            for index, cell in enumerate(self.swarm.cells.tolist()):
+                spatial.move(index, cell, 'enemy')
+        spatial.move(FOOD_KEY, self.food.position, 'food')
+        if self.ammo:
+            spatial.move(AMMO_KEY, self.ammo.position, 'ammo')
+
+    def clone(self):
+        """Return an independent SimulationCore in the same state.
+
+        Components are copied directly instead of running the constructor,
+        which would set up a new game only to replace it. The free-cell and
+        spatial tables, the bullets and the snake occupancy are shared until
+        either game changes them, and so is an empty swarm, which never does.
+        """
+        other = SimulationCore.__new__(SimulationCore)
+        # Scalars, positions and previous_swarm_heads are only ever rebound, so they are shared
+        other.__dict__ = self.__dict__.copy()
+        other.clock = clock = self.clock.copy()
+        other.rng = rng = self.rng.copy()
+        other.snake = self.snake.copy(clock, rng)
+        other.enemy = self.enemy.copy(rng)
+        other.food = self.food.copy(rng)
+        if self.ammo:
+            other.ammo = self.ammo.copy()
+        other.spatial = self.spatial.copy()
+        other.free_cells = self.free_cells.copy(rng)
+        other.bullets = self.bullets.copy()
+        if self.swarm.count:
+            other.swarm = self.swarm.copy(rng)
+        if self.flow_field is not None:
+            other.flow_field = FlowField()
+        return other
+
+    def apply_action(self, action):
+        """Apply a player action without advancing the simulation"""
+        if action in DIRECTIONS:
+            self.snake.turn(action)
+        elif action == SHOOT:
+            return self.shoot()
+        return False
+
+    def shoot(self):
+        """Fire a bullet from the snake's head, returns True if fired"""
+        if not self.snake.can_shoot() or self.bullets.is_full():
+            return False
+        self.bullets.spawn(self.snake.head, self.snake.direction)
+        self.snake.shoot()
+        return True
+
+    def step(self, action=None):
+        """Advance one tick, returns False once the game is over"""
+        if self.game_over:
+            return False
+        if action is not None:
+            self.apply_action(action)
+
+        # Time advances at the snake's current move rate
+        self.clock.tick_rate = self.snake.speed
+        self.clock.advance()
+
+        snake = self.snake
+        enemy = self.enemy
+        food = self.food
+        self.previous_head = snake.head
+        self.previous_tail = snake.positions[-1]
+        self.previous_enemy_position = enemy.position
+        swarm = self.swarm
+        if swarm.count:
+            self.previous_swarm_heads = swarm.heads.copy()
+
+        # Move snake, keeping the free-cell index in sync
+        free_cells = self.free_cells
+        tail = self.previous_tail
+        body_length = len(snake.positions)
+        snake.move()
+        free_cells.occupy(snake.head)
+        if len(snake.positions) == body_length:
+            free_cells.release(tail)
+
+        # Handle enemy slowdown if snake is boosted
+        if snake.is_boosted:
+            # Slow enemy significantly during the snake's boost
+            enemy.speed = max(enemy.base_speed * 0.2, 0.1)  # Drastically reduced speed
+            if swarm.count:
+                swarm.set_speed(max(swarm.base_speed * 0.2, 0.1))
+            self.enemy_slowdown_end = snake.speed_boost_end
+        elif self.enemy_slowdown_end and self.clock.ticks >= self.enemy_slowdown_end:
+            # Restore enemy speed to base value after boost ends
+            enemy.speed = enemy.base_speed
+            swarm.restore_speed()
+            self.enemy_slowdown_end = 0
+
+        # Move enemies
+        waypoint = waypoints = None
+        if self.flow_field is not None:
+            waypoint, waypoints = self._plan_paths()
+        enemy.move(snake.head, food.position, waypoint)
+        self._track_enemy()
+        if swarm.count:
+            previous_cells = swarm.cells
+            swarm.move(snake.head, food.position, waypoints)
+            self._track_swarm(previous_cells)
+
+        # Move bullets
+        if self.bullets.count:
+            targets = (self.enemy_cell,)
+            if swarm.count:
+                targets = [self.enemy_cell] + swarm.cells.tolist()
+            for target in self.bullets.update(targets):
+                if target == 0:
+                    enemy.spawn_at_edge()
+                    self._track_enemy()
+                else:
+                    previous_cells = swarm.cells.copy()
+                    swarm.spawn_at_edge(target - 1)
+                    self._track_swarm(previous_cells)
+                self.score += 5  # Bonus points for hitting enemy
+
+        # Check collisions
+        if (snake.collides_with_walls() or
+                snake.collides_with_self() or
+                check_enemy_collision(self.spatial, snake.head)):
+            self.end_game()
+            return False
+
+        # Check food collision for snake
+        if check_food_collision(self.spatial, snake.head):
+            self.score += food.points
+            self.high_score = max(self.score, self.high_score)
+            prev_boosted = snake.is_boosted
+            snake.apply_food_effect(food.effect)
+            # If snake just got a speed boost, trigger enemy slowdown
+            if food.effect == 'speed' and not prev_boosted:
+                enemy.speed = max(enemy.base_speed * 0.5, 1)
+                if swarm.count:
+                    swarm.set_speed(max(swarm.base_speed * 0.5, 1))
+                self.enemy_slowdown_end = snake.speed_boost_end
+            food.set_random_type()
+            if not self._respawn_food():
+                return False
+
+        # Check food collision for enemy
+        eaters = find_enemy_collisions(self.spatial, food.position)
+        if eaters:
+            amount = 3 if food.effect == 'grow' else 1
+            if ENEMY_KEY in eaters:
+                enemy.grow(amount=amount)
+            else:
+                # Only swarm indices are left, the lowest one eats
+                swarm.grow(min(eaters), amount=amount)
+            food.set_random_type()
+            if not self._respawn_food():
+                return False
+
+        # Handle ammo pickup
+        if not self.ammo:
+            ammo = Ammo()
+            if ammo.randomize_position(free_cells):
+                free_cells.occupy(ammo.position)
+                self.spatial.insert(AMMO_KEY, ammo.position, 'ammo')
+                self.ammo = ammo
+        elif snake.head == self.ammo.position:
+            snake.add_ammo(self.ammo.amount)
+            free_cells.release(self.ammo.position)
+            self.spatial.remove(AMMO_KEY)
+            self.ammo = None
+        return True
+
+    def _plan_paths(self):
+        """Next cells toward the snake head around its body for the enemy and swarm"""
+        field = self.flow_field
+        snake = self.snake
+        # The body can only change when the head moves or the snake grows
+        field.target(snake.head, snake.positions, key=(snake.head, len(snake.positions)))
+        positions = [self.enemy.position]
+        swarm = self.swarm
+        if swarm.count:
+            positions += swarm.heads.tolist()
+
+        # Enemies the search did not reach in time keep greedy steering
+        field.expand(positions, self.path_budget)
+        waypoint = field.step(positions[0])
+        waypoints = None
+        if swarm.count:
+            waypoints = np.array([field.step(head) or NO_WAYPOINT for head in positions[1:]])
+        return waypoint, waypoints
+
+    def _track_enemy(self):
+        """Move the enemy's cell in the free-cell and spatial indexes if it changed"""
+        cell = self.enemy.get_position_grid()
+        if cell != self.enemy_cell:
+            self.free_cells.release(self.enemy_cell)
+            self.free_cells.occupy(cell)
+            self.spatial.move(ENEMY_KEY, cell, 'enemy')
+            self.enemy_cell = cell
+
+    def _track_swarm(self, previous_cells):
+        """Move swarm enemies whose cell changed from previous_cells in both indexes"""
+        cells = self.swarm.cells
+        moved = np.flatnonzero((cells != previous_cells).any(axis=1))
+        if not len(moved):
+            return
+        # Heads are clamped to the board and snapped to cells, so index both by cell number
+        free_cells = self.free_cells
+        spatial = self.spatial
+        scale = (1, free_cells.width)
+        old_cells = (previous_cells[moved] // GRID_SIZE @ scale).tolist()
+        new_cells = (cells[moved] // GRID_SIZE @ scale).tolist()
+        for index, old, new in zip(moved.tolist(), old_cells, new_cells):
+            free_cells.release_cell(old)
+            free_cells.occupy_cell(new)
+            spatial.move_to_cell(index, new, 'enemy')
+
+    def _respawn_food(self):
+        """Move food to a free cell, ending the game if the board is full"""
+        self.free_cells.release(self.food.position)
+        if not self.food.randomize_position(self.free_cells):
+            self.end_game()
+            return False
+        self.free_cells.occupy(self.food.position)
+        self.spatial.move(FOOD_KEY, self.food.position, 'food')
+        return True
+
+    @property
+    def ticks(self):
+        """Number of ticks simulated in the current game"""
+        return self.clock.ticks
+
+    def end_game(self):
+        """Mark the game as finished and record the high score"""
+        self.game_over = True
+        if self.score > self.high_score:
+            self.high_score = self.score
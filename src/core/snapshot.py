@@ -0,0 +1,23 @@
+"""Immutable snapshots of a SimulationCore for lookahead search"""
+from collections import namedtuple
+
+SNAPSHOT_FIELDS = (
+    'clock snake enemy food ammo bullets swarm score high_score enemy_slowdown_end game_over '
+    'previous_head previous_tail previous_enemy_position previous_swarm_heads rng indexes'
+)
+
+
+class Snapshot(namedtuple('Snapshot', SNAPSHOT_FIELDS, defaults=(None,))):
+    """Complete game state at one tick.
+
+    Component states are the tuples returned by their ``snapshot``
+    methods: positions are tuples shared with nothing mutable, and array
+    backed parts (bullets, swarm) are read-only copies. ``ammo`` is the
+    pickup position, None if there is none, and ``rng`` the state of the
+    game's GameRng, None if it was not captured. The free-cell tables and
+    the snake's occupancy counts in ``indexes`` are shared with the game,
+    which copies them before its next change. A snapshot edited with
+    ``_replace`` can set ``indexes`` (and the snake's occupancy) to None
+    to have them rebuilt from the positions on restore.
+    """
+    __slots__ = ()
@@ -0,0 +1,147 @@
+"""Uniform-grid spatial index over the board for collision queries"""
+import math
+from src.config.settings import GRID_SIZE, GRID_WIDTH, GRID_HEIGHT
+
+
+class SpatialGrid:
+    """Maps board cells to the entities standing on them.
+
+    Entities are any hashable objects registered with a ``kind`` (e.g.
+    ``'enemy'``, ``'food'``) at a pixel position; the position is snapped
+    to the cell it rounds to, matching ``Enemy.get_position_grid``. Moving,
+    removing and cell lookups are O(1); rect queries cost one lookup per
+    covered cell regardless of how many entities exist. ``copy`` shares
+    the tables with the new grid until either one changes them.
+    """
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        self.clear()
+
+    def clear(self):
+        """Remove every entity"""
+        self.cells = {}  # Cell index -> {entity: kind}
+        self.entity_cells = {}  # Entity -> cell index
+        self.shared = False  # Tables also held by a copy, copied before changing
+
+    def _cell(self, gx, gy):
+        if 0 <= gx < self.width and 0 <= gy < self.height:
+            return gy * self.width + gx
+        return None
+
+    def copy(self):
+        """Return a grid with the same entities on the same cells.
+
+        Both grids share their tables until either one changes, so entities
+        must be keys that mean the same thing in both, such as names or
+        indexes rather than the objects of one game.
+        """
+        other = SpatialGrid.__new__(SpatialGrid)
+        other.__dict__ = self.__dict__.copy()
+        # Both copy the shared tables before their next change
+        self.shared = other.shared = True
+        return other
+
+    def _unshare(self):
+        self.cells = {cell: occupants.copy() for cell, occupants in self.cells.items()}
+        self.entity_cells = self.entity_cells.copy()
+        self.shared = False
+
+    def cell_of(self, position):
+        """Cell index a pixel position rounds to, or None if off the board"""
+        return self._cell(round(position[0] / GRID_SIZE), round(position[1] / GRID_SIZE))
+
+    def insert(self, entity, position, kind=None):
+        """Add an entity at position, replacing any previous registration"""
+        self.remove(entity)
+        cell = self.cell_of(position)
+        if cell is None:
+            return
+        if self.shared:
+            self._unshare()
+        self.cells.setdefault(cell, {})[entity] = kind
+        self.entity_cells[entity] = cell
+
+    def move(self, entity, position, kind=None):
+        """Update an entity's position, a no-op if its cell did not change"""
+        cell = self.cell_of(position)
+        if cell is None:
+            self.remove(entity)
+        else:
+            self.move_to_cell(entity, cell, kind)
+
+    def move_to_cell(self, entity, cell, kind=None):
+        """Register an entity on a cell given by its index, a no-op if it is already there"""
+        if self.entity_cells.get(entity) == cell:
+            return
+        if self.shared:
+            self._unshare()
+        self.remove(entity)
+        self.cells.setdefault(cell, {})[entity] = kind
+        self.entity_cells[entity] = cell
+
+    def remove(self, entity):
+        """Remove an entity if present"""
+        if entity not in self.entity_cells:
+            return
+        if self.shared:
+            self._unshare()
+        cell = self.entity_cells.pop(entity)
+        occupants = self.cells[cell]
+        del occupants[entity]
+        if not occupants:
+            del self.cells[cell]
+
+    def at(self, position, kind=None):
+        """Entities whose cell is the grid cell at position"""
+        cell = self._cell(int(position[0] // GRID_SIZE), int(position[1] // GRID_SIZE))
+        return self._occupants(cell, kind)
+
+    def query_point(self, position, kind=None):
+        """Entities within less than one cell of position on both axes.
+
+        This is the overlap test used by ``Enemy.collides_with``: an
+        aligned point only touches its own cell, a point between cells
+        touches the cells on either side.
+        """
+        x = position[0] / GRID_SIZE
+        y = position[1] / GRID_SIZE
+        gx = math.floor(x)
+        gy = math.floor(y)
+        if gx == x and gy == y:
+            # Fast path for cell-aligned points such as the snake head
+            return self._occupants(self._cell(gx, gy), kind)
+        xs = (gx,) if gx == x else (gx, gx + 1)
+        ys = (gy,) if gy == y else (gy, gy + 1)
+        found = []
+        for gy in ys:
+            for gx in xs:
+                found.extend(self._occupants(self._cell(gx, gy), kind))
+        return found
+
+    def query_rect(self, rect, kind=None):
+        """Entities whose cell overlaps the pixel rect (x, y, width, height)"""
+        x, y, width, height = rect
+        if width <= 0 or height <= 0:
+            return []
+        gx0 = max(0, int(x // GRID_SIZE))
+        gy0 = max(0, int(y // GRID_SIZE))
+        gx1 = min(self.width - 1, int(math.ceil((x + width) / GRID_SIZE)) - 1)
+        gy1 = min(self.height - 1, int(math.ceil((y + height) / GRID_SIZE)) - 1)
+        found = []
+        for gy in range(gy0, gy1 + 1):
+            for gx in range(gx0, gx1 + 1):
+                found.extend(self._occupants(gy * self.width + gx, kind))
+        return found
+
+    def _occupants(self, cell, kind):
+        occupants = self.cells.get(cell) if cell is not None else None
+        if not occupants:
+            return []
+        if kind is None:
+            return list(occupants)
+        return [entity for entity, entity_kind in occupants.items() if entity_kind == kind]
+
+    def __len__(self):
+        return len(self.entity_cells)
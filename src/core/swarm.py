@@ -0,0 +1,190 @@
+"""Array-backed group of enemies updated in one vectorized pass"""
+import random
+import numpy as np
+from src.config.settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE, ENEMY_SPEED, ENEMY_MAX_LENGTH
+)
+
+# Direction codes stored in EnemySwarm.direction
+DIRECTION_NAMES = ('up', 'down', 'left', 'right')
+UP, DOWN, LEFT, RIGHT = range(4)
+
+
+class EnemySwarm:
+    """Many enemies following the same rules as ``Enemy``.
+
+    Heads, speeds and growth state live in one array per attribute and
+    ``move`` steers every enemy with a handful of array operations. Body
+    segments are kept in a ring buffer shared by all enemies: each tick
+    writes the new heads into the next slot, so no per-enemy list is
+    shifted. Bodies are capped at ``max_length`` segments.
+
+    ``cells`` holds every head snapped to the grid. SimulationCore
+    registers each enemy by its index in the spatial grid and free-cell
+    index, re-indexing only the enemies whose cell changed, and
+    ``collisions`` answers the same overlap test with one comparison over
+    all heads for code without a grid.
+    """
+
+    def __init__(self, count=0, max_length=ENEMY_MAX_LENGTH, rng=None):
+        self.rng = rng if rng is not None else random  # Game's random stream
+        self.count = count
+        self.max_length = max_length
+        self.base_speed = ENEMY_SPEED
+        self.bounds = np.array([SCREEN_WIDTH - GRID_SIZE, SCREEN_HEIGHT - GRID_SIZE])
+        self.heads = np.zeros((count, 2))
+        self.segments = np.zeros((count, max_length, 2))
+        self.head_slot = 0  # Ring buffer slot holding the current heads
+        self.cells = np.zeros((count, 2), dtype=np.int64)  # Heads snapped to the grid
+        self.reset()
+
+    def __len__(self):
+        return self.count
+
+    def reset(self):
+        """Respawn every enemy at a random edge with its starting state"""
+        count = self.count
+        self.length = np.full(count, 3)  # Start with 3 segments
+        self.growth_queue = np.zeros(count, dtype=np.int64)
+        self.food_eaten = np.zeros(count, dtype=np.int64)
+        self.speed = np.full(count, self.base_speed)
+        self.direction = np.array([DIRECTION_NAMES.index(self.rng.choice(DIRECTION_NAMES))
+                                   for _ in range(count)], dtype=np.int8)
+        for index in range(count):
+            self.spawn_at_edge(index)
+
+    def spawn_at_edge(self, index):
+        """Move one enemy to a random point on the screen edge"""
+        edge = self.rng.choice(['top', 'right', 'bottom', 'left'])
+        if edge == 'top':
+            position = (self.rng.randint(0, SCREEN_WIDTH - GRID_SIZE), 0)
+        elif edge == 'right':
+            position = (SCREEN_WIDTH - GRID_SIZE, self.rng.randint(0, SCREEN_HEIGHT - GRID_SIZE))
+        elif edge == 'bottom':
+            position = (self.rng.randint(0, SCREEN_WIDTH - GRID_SIZE), SCREEN_HEIGHT - GRID_SIZE)
+        else:
+            position = (0, self.rng.randint(0, SCREEN_HEIGHT - GRID_SIZE))
+        self.heads[index] = position
+        self.segments[index] = position
+        self.cells[index] = np.round(self.heads[index] / GRID_SIZE) * GRID_SIZE
+
+    def move(self, snake_head, food_position, waypoints=None):
+        """Steer every enemy one tick toward the snake or nearby food.
+
+        ``waypoints`` optionally gives, per enemy, a position to head for
+        instead of the snake head while chasing it; rows of NaN keep the
+        straight line.
+        """
+        if not self.count:
+            return
+        heads = self.heads
+        snake_delta = np.subtract(snake_head, heads)
+        food_delta = np.subtract(food_position, heads)
+        snake_distance = np.sqrt((snake_delta * snake_delta).sum(axis=1))
+        food_distance = np.sqrt((food_delta * food_delta).sum(axis=1))
+
+        # Choose target based on distance
+        chase_food = food_distance < snake_distance * 0.8
+        if waypoints is not None:
+            # Follow the path around obstacles instead of the straight line
+            routed = ~np.isnan(waypoints[:, 0])
+            snake_delta[routed] = waypoints[routed] - heads[routed]
+            snake_distance[routed] = np.sqrt((snake_delta[routed] * snake_delta[routed]).sum(axis=1))
+        delta = np.where(chase_food[:, None], food_delta, snake_delta)
+        distance = np.where(chase_food, food_distance, snake_distance)
+        distance[distance == 0] = 1  # A zero delta stays zero
+        delta /= distance[:, None]
+        delta *= GRID_SIZE
+
+        # Direction codes: vertical 0/1, horizontal 2/3, positive axis odd
+        dx = delta[:, 0]
+        dy = delta[:, 1]
+        horizontal = np.abs(dx) > np.abs(dy)
+        self.direction = np.where(horizontal, (dx > 0) + 2, dy > 0).astype(np.int8)
+
+        # Same step and screen clamp as Enemy.move
+        delta *= (self.speed / (self.base_speed * 2))[:, None]
+        heads += delta
+        np.clip(heads, 0, self.bounds, out=heads)
+        self.cells = self.grid_cells()
+
+        self.head_slot = (self.head_slot + 1) % self.max_length
+        self.segments[:, self.head_slot] = heads
+
+        # Handle growth queue
+        if self.growth_queue.any():
+            growing = self.growth_queue > 0
+            self.growth_queue[growing] -= 1
+            self.length[growing] = np.minimum(self.length[growing] + 1, self.max_length)
+
+    def grid_cells(self):
+        """Heads rounded to the nearest grid cell, as Enemy.get_position_grid"""
+        return (np.round(self.heads / GRID_SIZE) * GRID_SIZE).astype(np.int64)
+
+    def collisions(self, position):
+        """Indices of enemies overlapping position, as Enemy.collides_with"""
+        if not self.count:
+            return []
+        overlap = np.abs(self.cells - position) < GRID_SIZE
+        return np.flatnonzero(overlap[:, 0] & overlap[:, 1]).tolist()
+
+    def positions(self, index):
+        """Segment positions of one enemy, head first"""
+        slots = (self.head_slot - np.arange(self.length[index])) % self.max_length
+        return [tuple(position) for position in self.segments[index, slots].tolist()]
+
+    def copy(self, rng=None):
+        """Return an independent swarm in the same state, drawing from rng"""
+        other = EnemySwarm.__new__(EnemySwarm)
+        other.__dict__ = self.__dict__.copy()
+        other.rng = rng if rng is not None else self.rng
+        if self.count:
+            # Empty arrays of an empty swarm cannot change, so only these are copied
+            for name in ('heads', 'segments', 'cells', 'length', 'growth_queue',
+                         'food_eaten', 'speed', 'direction'):
+                setattr(other, name, getattr(self, name).copy())
+        return other
+
+    def snapshot(self):
+        """Return read-only copies of the swarm arrays, or None for an empty swarm"""
+        if not self.count:
+            return None
+        arrays = tuple(array.copy() for array in (
+            self.heads, self.segments, self.cells, self.length, self.growth_queue,
+            self.food_eaten, self.speed, self.direction))
+        for array in arrays:
+            array.flags.writeable = False
+        return (self.head_slot,) + arrays
+
+    def restore(self, state):
+        """Restore state returned by snapshot"""
+        if state is None:
+            return
+        self.head_slot = state[0]
+        (heads, segments, cells, length, growth_queue,
+         food_eaten, speed, direction) = state[1:]
+        self.heads[:] = heads
+        self.segments[:] = segments
+        self.cells = cells.copy()
+        self.length = length.copy()
+        self.growth_queue = growth_queue.copy()
+        self.food_eaten = food_eaten.copy()
+        self.speed = speed.copy()
+        self.direction = direction.copy()
+
+    def grow(self, index, amount=1):
+        """Queue growth for one enemy after it eats"""
+        self.food_eaten[index] += 1
+        self.growth_queue[index] += amount
+        # Increase speed slightly for every 4th food consumed
+        if self.food_eaten[index] % 4 == 0:
+            self.speed[index] = min(self.base_speed * 0.5,
+                                    self.speed[index] + self.base_speed * 0.01)
+
+    def set_speed(self, speed):
+        """Set every enemy's speed, as done for the snake's boost slowdown"""
+        self.speed[:] = speed
+
+    def restore_speed(self):
+        """Return every enemy to the base speed"""
+        self.speed[:] = self.base_speed
@@ -1,4 +1,8 @@
 """Engine package for enhanced game features."""
 from .graphics import GraphicsEngine
+from .particles import ParticleSystem
+from .background import BackgroundLayers
+from .renderer import GameRenderer
+from .scheduler import IdleScheduler
 
-__all__ = ['GraphicsEngine']
+__all__ = ['GraphicsEngine', 'ParticleSystem', 'BackgroundLayers', 'GameRenderer', 'IdleScheduler']
@@ -0,0 +1,54 @@
+"""Pre-rendered static background layers"""
+import pygame
+from typing import Callable, List, Optional, Tuple
+from pygame import Surface
+from src.config.settings import BACKGROUND_COLOR
+from src.engine.graphics import ColorValue
+
+# A layer draws static content onto the background surface
+LayerDrawer = Callable[[Surface], None]
+
+
+class BackgroundLayers:
+    def __init__(self, color: ColorValue = BACKGROUND_COLOR):
+        """Initialize an empty stack of static layers over a solid color."""
+        self.color = color
+        self.layers: List[Tuple[str, LayerDrawer]] = []
+        self.surface: Optional[Surface] = None
+        self.renders = 0
+
+    def add_layer(self, name: str, draw: LayerDrawer) -> None:
+        """Add a static layer drawn on top of the existing ones."""
+        self.layers.append((name, draw))
+        self.invalidate()
+
+    def remove_layer(self, name: str) -> None:
+        """Remove a layer by name."""
+        self.layers = [layer for layer in self.layers if layer[0] != name]
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Force the layers to be rendered again on the next blit."""
+        self.surface = None
+
+    def get_surface(self, size: Tuple[int, int]) -> Surface:
+        """Return the cached background, rendering it if stale or resized."""
+        if self.surface is None or self.surface.get_size() != size:
+            surface = pygame.Surface(size)
+            surface.fill(self.color)
+            for _, draw in self.layers:
+                draw(surface)
+            # Match the display pixel format so blits are plain copies
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            self.surface = surface
+            self.renders += 1
+        return self.surface
+
+    def blit(self, screen: Surface, area=None) -> None:
+        """Copy the background onto the screen, optionally only one area."""
+        background = self.get_surface(screen.get_size())
+        if area is None:
+            screen.blit(background, (0, 0))
+        else:
+            screen.blit(background, area, area)
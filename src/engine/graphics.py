@@ -1,17 +1,71 @@
 """Graphics Engine module for enhanced visual effects"""
 import pygame
-import numpy as np
 import math
-from typing import Tuple, List, Optional, Union
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple, List, Optional, Union
 from pygame import Surface
+from src.engine.particles import ParticleSystem
+from src.utils.rng import GameRng
+from src.utils.profiler import FrameProfiler
 
 # Type hint for color values (RGB or RGBA)
 ColorValue = Union[Tuple[int, int, int], Tuple[int, int, int, int]]
 
+# Maximum number of generated effect surfaces kept alive
+SURFACE_CACHE_SIZE = 256
+
+
+class SurfaceCache:
+    """Size-bounded LRU cache of generated effect surfaces."""
+
+    def __init__(self, max_size: int = SURFACE_CACHE_SIZE, profiler: Optional[FrameProfiler] = None):
+        self.max_size = max_size
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        self.surfaces: "OrderedDict[Hashable, Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, factory: Callable[[], Surface]) -> Surface:
+        """Return the surface for key, building it with factory on a miss."""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        previous = self.profiler.switch("glow")
+        surface = factory()
+        self.profiler.switch(previous)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self) -> None:
+        """Drop all cached surfaces."""
+        self.surfaces.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current number of entries."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.surfaces),
+        }
+
+
 class GraphicsEngine:
-    def __init__(self, screen: Surface):
-        """Initialize the graphics engine."""
+    def __init__(self, screen: Surface, rng: Optional[GameRng] = None,
+                 profiler: Optional[FrameProfiler] = None):
+        """Initialize the graphics engine with its own random stream for effects."""
         self.screen = screen
+        self.rng = rng if rng is not None else GameRng()
+        # Frame phase timing shared with the renderer, disabled unless the game enables it
+        self.profiler = profiler if profiler is not None else FrameProfiler()
         self.width = screen.get_width()
         self.height = screen.get_height()
         
@@ -29,7 +83,10 @@ class GraphicsEngine:
         self.current_frame = 0
         
         # Particle system
-        self.particles = []
+        self.particles = ParticleSystem()
+
+        # Generated glow/gradient surfaces shared by all components
+        self.surface_cache = SurfaceCache(profiler=self.profiler)
 
     def _ensure_rgba(self, color: ColorValue) -> Tuple[int, int, int, int]:
         """Convert RGB color to RGBA if needed."""
@@ -38,13 +95,19 @@ class GraphicsEngine:
         return color
 
     def create_gradient(self, start_color: ColorValue, end_color: ColorValue, size: int) -> Surface:
-        """Create a gradient surface."""
-        surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        
+        """Return a cached gradient surface (shared, do not draw on it)."""
         # Ensure colors have alpha values
         start_color = self._ensure_rgba(start_color)
         end_color = self._ensure_rgba(end_color)
-        
+        return self.surface_cache.get(
+            ("gradient", start_color, end_color, size),
+            lambda: self._render_gradient(start_color, end_color, size)
+        )
+
+    def _render_gradient(self, start_color: Tuple[int, int, int, int],
+                         end_color: Tuple[int, int, int, int], size: int) -> Surface:
+        """Render a gradient surface."""
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
         for i in range(size):
             factor = i / size
             color = [
@@ -56,10 +119,17 @@ class GraphicsEngine:
         return surface
 
     def create_glow(self, color: ColorValue, radius: int, intensity: float = 1.0) -> Surface:
-        """Create a glowing effect surface."""
-        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        """Return a cached glowing effect surface (shared, do not draw on it)."""
         color = self._ensure_rgba(color)
-        
+        intensity = round(intensity, 2)
+        return self.surface_cache.get(
+            ("glow", color, radius, intensity),
+            lambda: self._render_glow(color, radius, intensity)
+        )
+
+    def _render_glow(self, color: Tuple[int, int, int, int], radius: int, intensity: float) -> Surface:
+        """Render a glowing effect surface."""
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
         for i in range(radius):
             alpha = int((1 - i/radius) * color[3] * intensity)
             if alpha > 0:
@@ -71,6 +141,37 @@ class GraphicsEngine:
                 )
         return surface
 
+    def create_ring_glow(
+        self,
+        color: ColorValue,
+        radius: int,
+        rings: int,
+        alpha: int,
+        alpha_step: int,
+        radius_step: int = 2
+    ) -> Surface:
+        """Return a cached glow made of concentric rings fading outwards.
+
+        Ring ``i`` is drawn with ``alpha - i * alpha_step`` at
+        ``radius - i * radius_step``; invisible rings are skipped.
+        """
+        key = ("rings", tuple(color[:3]), radius, rings, alpha, alpha_step, radius_step)
+
+        def render() -> Surface:
+            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            for i in range(rings):
+                ring_alpha = alpha - i * alpha_step
+                if ring_alpha > 0:
+                    pygame.draw.circle(surface, (*color[:3], ring_alpha),
+                                       (radius, radius), radius - i * radius_step)
+            return surface
+
+        return self.surface_cache.get(key, render)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return hit/miss counters of the effect surface cache."""
+        return self.surface_cache.stats()
+
     def add_particle_effect(
         self,
         position: Tuple[float, float],
@@ -82,47 +183,14 @@ class GraphicsEngine:
         fade: bool = True
     ) -> None:
         """Add a particle effect."""
-        color = self._ensure_rgba(color)
-        particle = {
-            "position": list(position),
-            "color": color,
-            "size": size,
-            "lifetime": lifetime,
-            "max_lifetime": lifetime,
-            "velocity": list(velocity),
-            "gravity": gravity,
-            "fade": fade
-        }
-        self.particles.append(particle)
+        self.particles.emit(position, self._ensure_rgba(color), size, lifetime,
+                            velocity, gravity, fade)
 
     def update_particles(self) -> None:
-        """Update all particle effects."""
+        """Update all particle effects and rasterize them in one batch."""
         self.particle_surface.fill((0, 0, 0, 0))
-
-        for particle in self.particles[:]:
-            # Update position
-            particle["position"][0] += particle["velocity"][0]
-            particle["position"][1] += particle["velocity"][1]
-            particle["velocity"][1] += particle["gravity"]
-
-            # Update lifetime
-            particle["lifetime"] -= 1
-            if particle["lifetime"] <= 0:
-                self.particles.remove(particle)
-                continue
-
-            # Calculate fade effect
-            if particle["fade"]:
-                alpha = int(255 * (particle["lifetime"] / particle["max_lifetime"]))
-                particle["color"] = (*particle["color"][:3], alpha)
-
-            # Render particle
-            pygame.draw.circle(
-                self.particle_surface,
-                particle["color"],
-                (int(particle["position"][0]), int(particle["position"][1])),
-                particle["size"]
-            )
+        self.particles.update()
+        self.particles.draw(self.particle_surface)
 
     def apply_screen_shake(self, intensity: float = 1.0, duration: int = 5) -> None:
         """Apply a screen shake effect."""
@@ -134,9 +202,8 @@ class GraphicsEngine:
 
     def update(self) -> None:
         """Update all visual effects."""
-        # Clear effect surfaces
+        # Clear effect surfaces (particle surface is cleared by update_particles)
         self.light_surface.fill((0, 0, 0, 0))
-        self.particle_surface.fill((0, 0, 0, 0))
         
         # Update particles
         self.update_particles()
@@ -144,8 +211,8 @@ class GraphicsEngine:
         # Apply screen shake
         if hasattr(self, "screen_shake"):
             if self.screen_shake["duration"] > 0:
-                dx = (np.random.random() * 2 - 1) * self.screen_shake["intensity"]
-                dy = (np.random.random() * 2 - 1) * self.screen_shake["intensity"]
+                dx = (self.rng.random() * 2 - 1) * self.screen_shake["intensity"]
+                dy = (self.rng.random() * 2 - 1) * self.screen_shake["intensity"]
                 self.screen.scroll(int(dx), int(dy))
                 self.screen_shake["duration"] -= 1
             else:
@@ -0,0 +1,169 @@
+"""Structure-of-arrays particle system backed by NumPy"""
+import pygame
+import numpy as np
+from typing import Dict, Tuple
+from pygame import Surface
+
+# Maximum number of live particles kept in the preallocated arrays
+PARTICLE_CAPACITY = 32768
+
+
+class ParticleSystem:
+    def __init__(self, capacity: int = PARTICLE_CAPACITY):
+        """Preallocate arrays for up to capacity live particles."""
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0
+
+        self.position = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 4), dtype=np.uint8)
+        self.size = np.zeros(capacity, dtype=np.int16)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.max_lifetime = np.ones(capacity, dtype=np.int32)
+        self.fade = np.zeros(capacity, dtype=bool)
+
+        # Pixel offsets covered by a circle of each radius
+        self.footprints: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def emit(
+        self,
+        position: Tuple[float, float],
+        color: Tuple[int, int, int, int],
+        size: int,
+        lifetime: int,
+        velocity: Tuple[float, float] = (0, 0),
+        gravity: float = 0,
+        fade: bool = True
+    ) -> bool:
+        """Add one particle, returns False if the system is full."""
+        if self.count >= self.capacity:
+            self.dropped += 1
+            return False
+        i = self.count
+        self.position[i] = position
+        self.velocity[i] = velocity
+        self.gravity[i] = gravity
+        self.color[i] = color
+        self.size[i] = size
+        self.lifetime[i] = lifetime
+        self.max_lifetime[i] = max(1, lifetime)
+        self.fade[i] = fade
+        self.count += 1
+        return True
+
+    def emit_many(
+        self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        color: Tuple[int, int, int, int],
+        size: int,
+        lifetime: int,
+        gravity: float = 0,
+        fade: bool = True
+    ) -> int:
+        """Add a burst of particles sharing appearance, returns how many fit."""
+        n = min(len(positions), self.capacity - self.count)
+        self.dropped += len(positions) - n
+        start, end = self.count, self.count + n
+        self.position[start:end] = positions[:n]
+        self.velocity[start:end] = velocities[:n]
+        self.gravity[start:end] = gravity
+        self.color[start:end] = color
+        self.size[start:end] = size
+        self.lifetime[start:end] = lifetime
+        self.max_lifetime[start:end] = max(1, lifetime)
+        self.fade[start:end] = fade
+        self.count = end
+        return n
+
+    def update(self) -> None:
+        """Integrate all particles one step and compact out the dead ones."""
+        n = self.count
+        if not n:
+            return
+        position = self.position[:n]
+        velocity = self.velocity[:n]
+        position += velocity
+        velocity[:, 1] += self.gravity[:n]
+        self.lifetime[:n] -= 1
+
+        alive = self.lifetime[:n] > 0
+        live = int(np.count_nonzero(alive))
+        if live != n:
+            for array in (self.position, self.velocity, self.gravity, self.color,
+                          self.size, self.lifetime, self.max_lifetime, self.fade):
+                array[:live] = array[:n][alive]
+            self.count = live
+
+        # Fade alpha with remaining lifetime
+        n = self.count
+        fade = self.fade[:n]
+        alpha = (255 * self.lifetime[:n] // self.max_lifetime[:n]).astype(np.uint8)
+        self.color[:n, 3] = np.where(fade, alpha, self.color[:n, 3])
+
+    def _footprint(self, size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return x/y offsets of the pixels pygame fills for a circle of radius size."""
+        footprint = self.footprints.get(size)
+        if footprint is None:
+            stamp = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, (255, 255, 255, 255), (size, size), size)
+            dx, dy = np.nonzero(pygame.surfarray.array_alpha(stamp))
+            footprint = (dx - size, dy - size)
+            self.footprints[size] = footprint
+        return footprint
+
+    def draw(self, surface: Surface) -> None:
+        """Rasterize every live particle onto surface with array writes.
+
+        Like ``pygame.draw.circle`` the particle colors replace the pixels
+        they cover instead of blending, so this is meant for a cleared
+        effect surface with per-pixel alpha.
+        """
+        n = self.count
+        if not n:
+            return
+        width, height = surface.get_size()
+        positions = self.position[:n].astype(np.int32)
+        sizes = self.size[:n]
+
+        # Pack colors into the surface's pixel format once per particle
+        colors = self.color[:n].astype(np.uint32)
+        shifts = surface.get_shifts()
+        pixels = (colors[:, 0] << shifts[0] | colors[:, 1] << shifts[1] |
+                  colors[:, 2] << shifts[2] | colors[:, 3] << shifts[3])
+
+        # Write through a flat view of the surface's pixel buffer
+        pitch = surface.get_pitch() // 4
+        target = np.asarray(surface.get_view('1'))
+        try:
+            for size in np.unique(sizes).tolist():
+                index = np.flatnonzero(sizes == size)
+                dx, dy = self._footprint(size)
+                xs = positions[index, 0]
+                ys = positions[index, 1]
+
+                # Particles fully inside the surface need no per-pixel checks
+                inner = (xs >= size) & (xs < width - size) & (ys >= size) & (ys < height - size)
+                inner_index = index[inner]
+                flat = (ys[inner] * pitch + xs[inner])[:, None] + (dy * pitch + dx)
+                target[flat.ravel()] = np.repeat(pixels[inner_index], len(dx))
+
+                edge_index = index[~inner]
+                if len(edge_index):
+                    ex = (positions[edge_index, 0, None] + dx).ravel()
+                    ey = (positions[edge_index, 1, None] + dy).ravel()
+                    owner = np.repeat(edge_index, len(dx))
+                    inside = (ex >= 0) & (ex < width) & (ey >= 0) & (ey < height)
+                    target[ey[inside] * pitch + ex[inside]] = pixels[owner[inside]]
+        finally:
+            # Release the surface lock held by the pixel view
+            del target
+
+    def clear(self) -> None:
+        """Remove all particles."""
+        self.count = 0
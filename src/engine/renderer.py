@@ -0,0 +1,434 @@
+"""Renderer drawing a SimulationCore state with pygame"""
+import math
+import pygame
+from typing import Callable, Hashable, List, Optional, Sequence, Tuple
+from pygame import Rect, Surface
+from src.engine.background import BackgroundLayers
+from src.utils.text import default_text_renderer, quantize_pulse
+from src.config.settings import (
+    GRID_SIZE, BASE_FPS, WHITE, FONT_SIZE, DIRTY_RECT_RENDERING, BULLET_COLOR, BULLET_SIZE,
+    ENEMY_COLOR, ENEMY_SIZE
+)
+from src.utils.display import draw_grid
+
+# Particle velocity trailing behind the snake head
+TRAIL_VELOCITY = {
+    'right': (-2, 0),
+    'left': (2, 0),
+    'up': (0, 2),
+    'down': (0, -2)
+}
+
+# A draw item: identity key, screen area it covers, draw function and its args.
+# Two frames that produce the same key for an item draw identical pixels.
+DrawItem = Tuple[Hashable, Rect, Callable, tuple]
+
+# Moves longer than this (respawns) are not interpolated
+MAX_INTERPOLATION_DISTANCE = GRID_SIZE * 2
+
+# Frame profiler overlay
+PROFILE_FONT_SIZE = 20
+PROFILE_COLUMNS = (0, 90, 150, 210)  # Left edges of the phase and p50/p95/p99 columns
+PROFILE_PADDING = 8
+PROFILE_BACKGROUND = (20, 20, 20)  # Opaque, so redrawing it over itself never darkens
+PROFILE_REFRESH_FRAMES = 30  # Frames between overlay updates, slow enough to read
+
+
+def lerp(start: Tuple[float, float], end: Tuple[float, float], alpha: float) -> Tuple[float, float]:
+    """Interpolate between two positions."""
+    if alpha >= 1 or start == end:
+        return end
+    if (abs(end[0] - start[0]) > MAX_INTERPOLATION_DISTANCE or
+            abs(end[1] - start[1]) > MAX_INTERPOLATION_DISTANCE):
+        return end
+    return (start[0] + (end[0] - start[0]) * alpha,
+            start[1] + (end[1] - start[1]) * alpha)
+
+
+class GameRenderer:
+    def __init__(self, screen: Surface, graphics, text=None, dirty_rects: bool = DIRTY_RECT_RENDERING):
+        """Initialize the renderer with the target screen and effects engine."""
+        self.screen = screen
+        self.graphics = graphics
+        self.text = text if text is not None else default_text_renderer()
+
+        # Static layers rendered once and blitted every frame
+        self.background = BackgroundLayers()
+        self.background.add_layer("grid", draw_grid)
+
+        # Dirty-rectangle state: items drawn last frame and rects to push
+        self.dirty_rects = dirty_rects
+        self.previous_items: List[DrawItem] = []
+        self.update_rects: List[Rect] = []
+        self.full_redraw = True
+        self.pixels_pushed = 0
+
+        # Phase timing comes from the effects engine, which also times glow creation
+        self.profiler = graphics.profiler
+        self.profile_surface = None
+        self.profile_frame = 0
+
+    def request_full_redraw(self) -> None:
+        """Redraw and push the whole screen on the next frame."""
+        self.full_redraw = True
+
+    def set_dirty_rects(self, enabled: bool) -> None:
+        """Switch between dirty-rectangle and full-screen rendering."""
+        self.dirty_rects = enabled
+        self.request_full_redraw()
+
+    def draw(self, sim, alpha: float = 1.0) -> None:
+        """Draw a frame of the simulation state (call present() to show it).
+
+        alpha in [0, 1] interpolates moving entities between the state
+        before the last tick (0) and the current state (1).
+        """
+        # Clear previous frame effects
+        self.profiler.switch("particles")
+        self.graphics.update()
+        self.emit_particles(sim.snake, lerp(sim.previous_head, sim.snake.head, alpha))
+
+        self.profiler.switch("draw")
+        items = self.collect_items(sim, alpha)
+        if self.dirty_rects and not self.full_redraw:
+            self._draw_dirty(items)
+        else:
+            self._draw_full(items)
+        self.previous_items = items
+
+    def present(self) -> None:
+        """Push the drawn frame to the display."""
+        if self.update_rects is None:
+            pygame.display.flip()
+        elif self.update_rects:
+            pygame.display.update(self.update_rects)
+
+    def draw_profile(self, profiler, notes: Optional[Callable[[], Sequence[str]]] = None) -> None:
+        """Draw the profiler's per-phase percentiles in the top-right corner.
+
+        notes returns extra lines shown under the table. It is only called
+        when the overlay is re-rendered, every PROFILE_REFRESH_FRAMES frames.
+        """
+        age = profiler.frames - self.profile_frame
+        if self.profile_surface is None or not 0 <= age < PROFILE_REFRESH_FRAMES:
+            previous = self.profile_surface
+            self.profile_surface = self.render_profile(profiler, notes() if notes else ())
+            self.profile_frame = profiler.frames
+            if previous is not None and (previous.get_width() > self.profile_surface.get_width() or
+                                         previous.get_height() > self.profile_surface.get_height()):
+                # Clear what the larger overlay covered
+                self.request_full_redraw()
+        rect = self.profile_surface.get_rect(topright=(self.screen.get_width() - 10, 10))
+        self.screen.blit(self.profile_surface, rect)
+        if self.update_rects is not None:
+            self.update_rects.append(rect)
+
+    def render_profile(self, profiler, notes: Sequence[str] = ()) -> Surface:
+        """Render the percentile table, one row per phase plus the whole frame, then notes."""
+        # Straight from the font: the numbers change too often for the text cache
+        font = self.text.font(PROFILE_FONT_SIZE)
+        rows = [("ms", "p50", "p95", "p99")]
+        rows += [(name, *(f"{value:.2f}" for value in values))
+                 for name, values in profiler.percentiles().items()]
+        lines = [font.render(note, True, WHITE) for note in notes]
+        line_height = font.get_linesize()
+        width = max([PROFILE_COLUMNS[-1] + 60] + [line.get_width() for line in lines])
+        surface = Surface((width + 2 * PROFILE_PADDING,
+                           line_height * (len(rows) + len(lines)) + 2 * PROFILE_PADDING))
+        surface.fill(PROFILE_BACKGROUND)
+        for row, cells in enumerate(rows):
+            y = PROFILE_PADDING + row * line_height
+            for x, cell in zip(PROFILE_COLUMNS, cells):
+                surface.blit(font.render(cell, True, WHITE), (PROFILE_PADDING + x, y))
+        for row, line in enumerate(lines, len(rows)):
+            surface.blit(line, (PROFILE_PADDING, PROFILE_PADDING + row * line_height))
+        return surface
+
+    def refresh_profile(self) -> None:
+        """Re-render the profiler overlay on the next frame."""
+        self.profile_surface = None
+
+    def stats(self) -> dict:
+        """Return rendering counters for the last frame."""
+        return {
+            "dirty_rects": self.dirty_rects,
+            "pixels_pushed": self.pixels_pushed,
+            "rects": len(self.update_rects) if self.update_rects is not None else 1,
+        }
+
+    def _draw_full(self, items: List[DrawItem]) -> None:
+        """Background and grid in a single blit, then every item."""
+        self.profiler.switch("grid")
+        self.background.blit(self.screen)
+        self.profiler.switch("draw")
+        for _, _, draw, args in items:
+            draw(*args)
+        self.update_rects = None
+        self.pixels_pushed = self.screen.get_width() * self.screen.get_height()
+        self.full_redraw = False
+
+    def _draw_dirty(self, items: List[DrawItem]) -> None:
+        """Rebuild only the areas of items that appeared, moved or vanished."""
+        previous = {(key, tuple(rect)) for key, rect, _, _ in self.previous_items}
+        current = {(key, tuple(rect)) for key, rect, _, _ in items}
+        screen_rect = self.screen.get_rect()
+        dirty = []
+        for _, rect in previous ^ current:
+            rect = Rect(rect).clip(screen_rect)
+            if rect.width and rect.height:
+                dirty.append(rect)
+
+        screen = self.screen
+        switch = self.profiler.switch
+        item_rects = [rect for _, rect, _, _ in items]
+        for rect in dirty:
+            # Restore the background and redraw overlapping items, clipped so
+            # nothing outside the restored area is blended twice
+            screen.set_clip(rect)
+            switch("grid")
+            self.background.blit(screen, rect)
+            switch("draw")
+            for index in rect.collidelistall(item_rects):
+                _, _, draw, args = items[index]
+                draw(*args)
+        screen.set_clip(None)
+
+        self.update_rects = dirty
+        self.pixels_pushed = sum(rect.width * rect.height for rect in dirty)
+
+    def collect_items(self, sim, alpha: float = 1.0) -> List[DrawItem]:
+        """Build the ordered draw list for the simulation state."""
+        items: List[DrawItem] = []
+        # Animation time between the last two ticks
+        current_time = sim.clock.seconds - (1 - alpha) / sim.clock.tick_rate
+
+        self.collect_enemy(items, sim.enemy,
+                           lerp(sim.previous_enemy_position, sim.enemy.position, alpha))
+        if sim.swarm.count:
+            self.collect_swarm(items, sim.swarm, sim.previous_swarm_heads, alpha)
+        self.collect_food(items, sim.food, current_time)
+        self.collect_snake(items, sim.snake, sim.previous_head, sim.previous_tail, alpha)
+
+        # Draw bullets with trail effect
+        for x, y in sim.bullets:
+            items.append((("bullet", x, y), Rect(x, y, BULLET_SIZE, BULLET_SIZE),
+                          self.draw_bullet, (x, y)))
+
+        # Draw ammo pickup with glow effect
+        if sim.ammo:
+            self.collect_ammo(items, sim.ammo, current_time)
+
+        self.collect_hud(items, sim)
+        return items
+
+    def emit_particles(self, snake, head: Tuple[float, float]) -> None:
+        """Add movement particles behind a fast snake's (drawn) head."""
+        if snake.speed > BASE_FPS:
+            self.graphics.add_particle_effect(
+                head,
+                snake.get_color(0),
+                2,
+                10,
+                velocity=TRAIL_VELOCITY[snake.direction]
+            )
+
+    def collect_enemy(self, items: List[DrawItem], enemy, head) -> None:
+        """Add enemy glow, segments and eyes to the draw list, head drawn at head."""
+        self.collect_enemy_body(items, enemy.positions, enemy.color, enemy.size, head)
+
+    def collect_swarm(self, items: List[DrawItem], swarm, previous_heads, alpha: float) -> None:
+        """Add every swarm enemy to the draw list with interpolated heads."""
+        heads = swarm.heads.tolist()
+        previous = previous_heads.tolist()
+        for index in range(swarm.count):
+            head = lerp(previous[index], heads[index], alpha)
+            self.collect_enemy_body(items, swarm.positions(index), ENEMY_COLOR, ENEMY_SIZE, head)
+
+    def collect_enemy_body(self, items: List[DrawItem], positions, enemy_color,
+                           size: int, head) -> None:
+        """Add glow, segments and eyes of one enemy, head drawn at head."""
+        color = (*enemy_color[:3], 128)
+        glow = self.graphics.create_glow(color, GRID_SIZE * 2)
+        glow_pos = (head[0] - GRID_SIZE//2, head[1] - GRID_SIZE//2)
+        items.append((("enemy_glow", glow_pos, color),
+                      glow.get_rect(topleft=glow_pos),
+                      self.screen.blit, (glow, glow_pos)))
+
+        # Draw each segment
+        for i, pos in enumerate(positions):
+            if i == 0:
+                pos = head
+            seg_size = size if i == 0 else size - 2
+            color = (0, 255 - i * 10, 255 - i * 10) if i < 10 else (0, 50, 50)
+            rect = (pos[0], pos[1], seg_size, seg_size)
+            items.append((("enemy", rect, color), Rect(rect),
+                          pygame.draw.rect, (self.screen, color, rect)))
+
+        # Draw eyes on head
+        x, y = head
+        items.append((("enemy_eyes", x, y, size),
+                      Rect(x, y, size, size),
+                      self.draw_enemy_eyes, (x, y, size)))
+
+    def draw_enemy_eyes(self, x: float, y: float, size: int) -> None:
+        """Draw the enemy's eyes with the head at (x, y)."""
+        eye_size = max(4, int(size / 5))
+        eye_color = (255, 255, 255)
+        pygame.draw.rect(self.screen, eye_color,
+                         (x + size/4, y + size/4, eye_size, eye_size))
+        pygame.draw.rect(self.screen, eye_color,
+                         (x + size*2/3, y + size/4, eye_size, eye_size))
+
+    def collect_food(self, items: List[DrawItem], food, current_time: float) -> None:
+        """Add food with pulsing glow at the given game time in seconds."""
+        # Calculate size with pulse effect
+        pulse_offset = math.sin(current_time * 5) * 4
+        base_size = GRID_SIZE - 2
+        size = base_size + pulse_offset
+        glow_size = int(size * 1.5)
+
+        x, y = food.position
+        glow_pos = (x - glow_size + GRID_SIZE//2, y - glow_size + GRID_SIZE//2)
+        items.append((("food", food.position, food.color, size),
+                      Rect(glow_pos, (glow_size * 2, glow_size * 2)),
+                      self.draw_food, (food, size, glow_size)))
+
+    def draw_food(self, food, size: float, glow_size: int) -> None:
+        """Draw food with its glow at the given pulse size."""
+        screen = self.screen
+        x, y = food.position
+
+        # Draw glow effect
+        glow_surface = self.graphics.create_ring_glow(food.color, glow_size, 10, 100, 10)
+        screen.blit(glow_surface,
+                    (x - glow_size + GRID_SIZE//2,
+                     y - glow_size + GRID_SIZE//2))
+
+        # Draw main food
+        pygame.draw.rect(screen, food.color,
+                         (x + (GRID_SIZE - size)//2,
+                          y + (GRID_SIZE - size)//2,
+                          size, size))
+
+        # Draw shine effect
+        shine_color = (255, 255, 255, 150)
+        shine_size = size // 3
+        pygame.draw.rect(screen, shine_color,
+                         (x + GRID_SIZE//4,
+                          y + GRID_SIZE//4,
+                          shine_size, shine_size))
+
+    def collect_snake(self, items: List[DrawItem], snake, previous_head,
+                      previous_tail, alpha: float = 1.0) -> None:
+        """Add snake head and body segments to the draw list.
+
+        Between ticks the head slides out of the neck and the vacated tail
+        segment slides into the new tail.
+        """
+        positions = snake.positions
+        if alpha < 1 and len(positions) > 1 and previous_tail != positions[-1]:
+            pos = lerp(previous_tail, positions[-1], alpha)
+            color = snake.get_color(len(positions) - 1)
+            items.append((("body", pos, color),
+                          Rect(pos[0] - 1, pos[1] - 1, GRID_SIZE + 1, GRID_SIZE + 1),
+                          self.draw_snake_body, (pos, color)))
+
+        for i, pos in enumerate(positions):
+            color = snake.get_color(i)
+            if i == 0:  # Head
+                pos = lerp(previous_head, pos, alpha)
+                items.append((("head", pos, color),
+                              Rect(pos, (GRID_SIZE, GRID_SIZE)),
+                              self.draw_snake_head, (pos, color)))
+            else:  # Body segments, shine line may spill one pixel
+                items.append((("body", pos, color),
+                              Rect(pos[0] - 1, pos[1] - 1, GRID_SIZE + 1, GRID_SIZE + 1),
+                              self.draw_snake_body, (pos, color)))
+
+    def draw_snake_head(self, pos, color) -> None:
+        """Draw the snake head with gradient and eyes."""
+        screen = self.screen
+        head_surface = self.graphics.create_gradient(
+            color, (*color[:3], 180), GRID_SIZE
+        )
+        screen.blit(head_surface, pos)
+
+        # Draw eyes
+        eye_color = WHITE
+        eye_size = 4
+        pygame.draw.rect(screen, eye_color,
+                         (pos[0] + GRID_SIZE//4, pos[1] + GRID_SIZE//4,
+                          eye_size, eye_size))
+        pygame.draw.rect(screen, eye_color,
+                         (pos[0] + GRID_SIZE*2//3, pos[1] + GRID_SIZE//4,
+                          eye_size, eye_size))
+
+    def draw_snake_body(self, pos, color) -> None:
+        """Draw a snake body segment with shine."""
+        pygame.draw.rect(self.screen, color,
+                         (pos[0], pos[1], GRID_SIZE-1, GRID_SIZE-1))
+        # Add shine effect to body
+        pygame.draw.line(self.screen, WHITE,
+                         (pos[0], pos[1]),
+                         (pos[0] + GRID_SIZE//2, pos[1]), 2)
+
+    def draw_bullet(self, x: float, y: float) -> None:
+        """Draw a bullet at its top-left corner."""
+        pygame.draw.rect(self.screen, BULLET_COLOR, (x, y, BULLET_SIZE, BULLET_SIZE))
+
+    def collect_ammo(self, items: List[DrawItem], ammo, current_time: float) -> None:
+        """Add ammo pickup with effects at the given game time in seconds."""
+        # Pulsing effect
+        pulse = (math.sin(current_time * 5) + 1) / 2  # Value between 0 and 1
+        size = GRID_SIZE - 4 + (pulse * 4)  # Size varies by 4 pixels
+
+        # Glow pulse quantized so the glow surfaces are reused
+        glow_radius = int(GRID_SIZE * 0.8)
+        glow_alpha = int(80 * quantize_pulse(pulse))
+
+        x, y = ammo.position
+        glow_pos = (x - glow_radius + GRID_SIZE//2, y - glow_radius + GRID_SIZE//2)
+        items.append((("ammo", ammo.position, size, glow_alpha),
+                      Rect(glow_pos, (glow_radius * 2, glow_radius * 2)),
+                      self.draw_ammo, (ammo, size, glow_radius, glow_alpha)))
+
+    def draw_ammo(self, ammo, size: float, glow_radius: int, glow_alpha: int) -> None:
+        """Draw ammo pickup with glow and cross at the given pulse size."""
+        screen = self.screen
+        x, y = ammo.position
+
+        # Draw the glow
+        glow_surface = self.graphics.create_ring_glow(ammo.color, glow_radius, 5, glow_alpha, 15)
+        screen.blit(glow_surface,
+                    (x - glow_radius + GRID_SIZE//2,
+                     y - glow_radius + GRID_SIZE//2))
+
+        # Draw main ammo box
+        pygame.draw.rect(screen, ammo.color,
+                         (x + (GRID_SIZE - size)/2,
+                          y + (GRID_SIZE - size)/2,
+                          size, size))
+
+        # Draw cross pattern
+        cross_color = (255, 255, 255)
+        cross_size = size * 0.6
+        center_x = x + GRID_SIZE/2
+        center_y = y + GRID_SIZE/2
+
+        # Horizontal line
+        pygame.draw.line(screen, cross_color,
+                         (center_x - cross_size/2, center_y),
+                         (center_x + cross_size/2, center_y), 2)
+
+        # Vertical line
+        pygame.draw.line(screen, cross_color,
+                         (center_x, center_y - cross_size/2),
+                         (center_x, center_y + cross_size/2), 2)
+
+    def collect_hud(self, items: List[DrawItem], sim) -> None:
+        """Add score, high score and ammo counters to the draw list."""
+        score_text = f"Score: {sim.score}  High Score: {sim.high_score}  Ammo: {sim.snake.ammo_count}"
+        score_surface = self.text.render(score_text, FONT_SIZE, WHITE)
+        items.append((("hud", score_text),
+                      score_surface.get_rect(topleft=(10, 10)),
+                      self.screen.blit, (score_surface, (10, 10))))
@@ -0,0 +1,100 @@
+"""Power-aware frame scheduling for the non-playing game states"""
+import time
+import pygame
+from collections import defaultdict
+from typing import Dict, List, Optional
+from src.config.settings import MENU_ANIMATION_FPS, IDLE_WAIT_MS
+
+# Seconds between animation frames per state; None means the state is static
+# and is only redrawn when it is entered or receives input
+FRAME_INTERVALS: Dict[str, Optional[float]] = {
+    "menu": 1 / MENU_ANIMATION_FPS,
+    "paused": None,
+    "game_over": None,
+}
+
+
+class IdleScheduler:
+    """Event waiting and redraw decisions for states with per-state animation intervals."""
+
+    def __init__(self, frame_intervals: Dict[str, Optional[float]] = FRAME_INTERVALS,
+                 max_wait_ms: int = IDLE_WAIT_MS):
+        self.frame_intervals = frame_intervals
+        self.max_wait_ms = max_wait_ms
+        self.state = None
+        self.dirty = True
+        self.next_frame = 0.0
+
+        # CPU and wall time spent per state, and frames drawn per state
+        self.cpu_time: Dict[str, float] = defaultdict(float)
+        self.wall_time: Dict[str, float] = defaultdict(float)
+        self.frames: Dict[str, int] = defaultdict(int)
+        self._cpu_mark = time.process_time()
+        self._wall_mark = time.perf_counter()
+
+    def invalidate(self) -> None:
+        """Request a redraw on the next loop iteration."""
+        self.dirty = True
+
+    def poll(self, state: str) -> List[pygame.event.Event]:
+        """Return pending events, sleeping until input or the next frame is due."""
+        if state != self.state:
+            self.state = state
+            self.dirty = True
+
+        timeout_ms = self._timeout_ms(state)
+        if timeout_ms == 0:
+            events = pygame.event.get()
+        else:
+            # Block in SDL instead of spinning; returns NOEVENT on timeout
+            event = pygame.event.wait(timeout_ms)
+            events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+        if events:
+            self.dirty = True
+        return events
+
+    def _timeout_ms(self, state: str) -> int:
+        if self.dirty:
+            return 0
+        interval = self.frame_intervals.get(state)
+        if interval is None:
+            return self.max_wait_ms
+        remaining = self.next_frame - time.perf_counter()
+        if remaining <= 0:
+            return 0
+        return max(1, min(self.max_wait_ms, int(remaining * 1000)))
+
+    def should_render(self, state: str) -> bool:
+        """Check if a frame is due for state, consuming the redraw request."""
+        now = time.perf_counter()
+        interval = self.frame_intervals.get(state)
+        due = interval is not None and now >= self.next_frame
+        if not (self.dirty or due):
+            return False
+        self.dirty = False
+        if interval is not None:
+            self.next_frame = now + interval
+        self.frames[state] += 1
+        return True
+
+    def account(self, state: str) -> None:
+        """Charge the time since the last call to state."""
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        self.cpu_time[state] += cpu - self._cpu_mark
+        self.wall_time[state] += wall - self._wall_mark
+        self._cpu_mark = cpu
+        self._wall_mark = wall
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return CPU seconds, wall seconds, CPU share and frames per state."""
+        report = {}
+        for state, wall in self.wall_time.items():
+            cpu = self.cpu_time[state]
+            report[state] = {
+                "cpu_seconds": cpu,
+                "wall_seconds": wall,
+                "cpu_share": cpu / wall if wall else 0.0,
+                "frames": self.frames[state],
+            }
+        return report
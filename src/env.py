@@ -0,0 +1,198 @@
+"""Gym-style environment for training agents against the game
+
+    env = SnakeEnv(seed=0)
+    observation, info = env.reset()
+    observation, reward, terminated, truncated, info = env.step(action)
+
+Observations are float32 planes of shape (channels, GRID_HEIGHT,
+GRID_WIDTH), one plane per entry of CHANNELS with 1.0 on occupied
+cells. Actions are indexes into ACTIONS.
+"""
+import numpy as np
+from src.core.batch import ACTIONS
+from src.core.simulation import SimulationCore
+from src.config.settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE, GRID_WIDTH, GRID_HEIGHT,
+    FOOD_TYPES, SWARM_SIZE, ENEMY_AI
+)
+
+# Observation planes: the snake's two planes are updated in place each tick,
+# the rest are cleared and redrawn
+CHANNELS = ('snake_head', 'snake_body', 'enemy') + tuple(
+    f'food_{name}' for name in FOOD_TYPES) + ('ammo', 'bullets')
+SNAKE_HEAD, SNAKE_BODY, ENEMY = range(3)
+FOOD_CHANNELS = {name: CHANNELS.index(f'food_{name}') for name in FOOD_TYPES}
+AMMO = CHANNELS.index('ammo')
+BULLETS = CHANNELS.index('bullets')
+OBSERVATION_SHAPE = (len(CHANNELS), GRID_HEIGHT, GRID_WIDTH)
+
+RENDER_MODES = ('human', 'rgb_array')
+FRAME_SIZE = (SCREEN_WIDTH // 10, SCREEN_HEIGHT // 10)  # Default rgb_array width and height
+
+
+class SnakeEnv:
+    """One game behind ``reset``/``step``/``render``.
+
+    The observation is written into one preallocated array that every
+    call returns, so copy it before the next step if it must be kept.
+    Pass ``observation`` to have the planes written into an array you
+    own, such as one row of a rollout buffer. Between ticks only the
+    snake's new head and vacated tail cell change in its planes, so an
+    observation costs the same for a long snake as for a short one.
+
+    The reward is the score gained during the tick. ``terminated`` is set
+    when the snake dies, and ``truncated`` after ``max_ticks`` ticks, if
+    given. ``render_mode='rgb_array'`` makes ``render`` draw the game with
+    the real renderer off screen and return it scaled to ``frame_size``,
+    also into a preallocated array; ``'human'`` opens a window.
+    """
+
+    def __init__(self, seed=None, max_ticks=None, render_mode=None, frame_size=FRAME_SIZE,
+                 observation=None, swarm_size=SWARM_SIZE, enemy_ai=ENEMY_AI):
+        if render_mode is not None and render_mode not in RENDER_MODES:
+            raise ValueError(f"render_mode must be one of {RENDER_MODES}, got {render_mode!r}")
+        if observation is None:
+            observation = np.zeros(OBSERVATION_SHAPE, dtype=np.float32)
+        elif observation.shape != OBSERVATION_SHAPE:
+            raise ValueError(f"observation must have shape {OBSERVATION_SHAPE}, got {observation.shape}")
+        self.observation = observation
+        self.max_ticks = max_ticks
+        self.render_mode = render_mode
+        self.frame_size = frame_size
+        self.frame = None  # Last rgb_array frame, (height, width, 3) uint8
+        self.renderer = None  # Created by the first render call
+        self.sim = SimulationCore(swarm_size=swarm_size, enemy_ai=enemy_ai, seed=seed)
+        self.length = 0
+        self._write_observation()
+
+    @property
+    def action_count(self):
+        """Number of discrete actions"""
+        return len(ACTIONS)
+
+    def reset(self, seed=None):
+        """Start a new game, reseeding when seed is given; returns (observation, info)"""
+        self.sim.reset(seed)
+        self._write_observation()
+        return self.observation, self._info()
+
+    def step(self, action):
+        """Apply an action code and advance one tick.
+
+        Returns (observation, reward, terminated, truncated, info).
+        """
+        sim = self.sim
+        score = sim.score
+        alive = sim.step(ACTIONS[action])
+        if alive:
+            self._update_observation()
+        else:
+            self._write_observation()
+        truncated = alive and self.max_ticks is not None and sim.ticks >= self.max_ticks
+        return self.observation, sim.score - score, not alive, truncated, self._info()
+
+    def _info(self):
+        sim = self.sim
+        return {
+            "score": sim.score,
+            "ticks": sim.ticks,
+            "length": len(sim.snake.positions),
+            "ammo": sim.snake.ammo_count,
+            "boosted": sim.snake.is_boosted,
+        }
+
+    def _write_observation(self):
+        """Draw every plane from scratch"""
+        observation = self.observation
+        observation.fill(0)
+        positions = self.sim.snake.positions
+        for x, y in positions:
+            if 0 <= x < SCREEN_WIDTH and 0 <= y < SCREEN_HEIGHT:
+                observation[SNAKE_BODY, int(y // GRID_SIZE), int(x // GRID_SIZE)] = 1
+        x, y = positions[0]
+        if 0 <= x < SCREEN_WIDTH and 0 <= y < SCREEN_HEIGHT:
+            observation[SNAKE_BODY, int(y // GRID_SIZE), int(x // GRID_SIZE)] = 0
+            observation[SNAKE_HEAD, int(y // GRID_SIZE), int(x // GRID_SIZE)] = 1
+        self.length = len(positions)
+        self._write_entities()
+
+    def _update_observation(self):
+        """Move the snake's planes by one tick and redraw the other entities"""
+        sim = self.sim
+        observation = self.observation
+        positions = sim.snake.positions
+        x, y = sim.previous_head
+        observation[SNAKE_HEAD, int(y // GRID_SIZE), int(x // GRID_SIZE)] = 0
+        if len(positions) > 1:
+            observation[SNAKE_BODY, int(y // GRID_SIZE), int(x // GRID_SIZE)] = 1
+        if len(positions) == self.length:
+            # The tail moved on; a live snake never has two segments on one cell
+            x, y = sim.previous_tail
+            observation[SNAKE_BODY, int(y // GRID_SIZE), int(x // GRID_SIZE)] = 0
+        x, y = positions[0]
+        observation[SNAKE_HEAD, int(y // GRID_SIZE), int(x // GRID_SIZE)] = 1
+        self.length = len(positions)
+        self._write_entities()
+
+    def _write_entities(self):
+        """Clear and redraw the enemy, food, ammo and bullet planes"""
+        sim = self.sim
+        observation = self.observation
+        observation[ENEMY:] = 0
+        # Only enemy heads collide, so their bodies are left out
+        x, y = sim.enemy_cell
+        observation[ENEMY, int(y // GRID_SIZE), int(x // GRID_SIZE)] = 1
+        if sim.swarm.count:
+            cells = sim.swarm.cells // GRID_SIZE
+            observation[ENEMY, cells[:, 1], cells[:, 0]] = 1
+        x, y = sim.food.position
+        observation[FOOD_CHANNELS[sim.food.type], int(y // GRID_SIZE), int(x // GRID_SIZE)] = 1
+        if sim.ammo:
+            x, y = sim.ammo.position
+            observation[AMMO, int(y // GRID_SIZE), int(x // GRID_SIZE)] = 1
+        if sim.bullets.count:
+            # Bullets may sit on the far screen edge, one cell past the grid
+            cells = (sim.bullets.position[:sim.bullets.count] // GRID_SIZE).astype(np.int64)
+            on_grid = (cells[:, 0] < GRID_WIDTH) & (cells[:, 1] < GRID_HEIGHT)
+            observation[BULLETS, cells[on_grid, 1], cells[on_grid, 0]] = 1
+
+    def render(self):
+        """Draw the current state: returns the frame for 'rgb_array', None otherwise"""
+        if self.render_mode is None:
+            return None
+        if self.renderer is None:
+            self._open_renderer()
+        import pygame
+        self.renderer.draw(self.sim)
+        if self.render_mode == 'human':
+            pygame.event.pump()
+            self.renderer.present()
+            return None
+        pygame.transform.smoothscale(self.screen, self.frame_size, self.small_screen)
+        pixels = pygame.surfarray.pixels3d(self.small_screen)  # (width, height, 3) view
+        np.copyto(self.frame, pixels.transpose(1, 0, 2))
+        del pixels  # Unlock the surface
+        return self.frame
+
+    def _open_renderer(self):
+        # pygame is only needed for frames, so training without render never imports it
+        import pygame
+        from src.engine import GraphicsEngine, GameRenderer
+        pygame.init()
+        if self.render_mode == 'human':
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Advanced Snake Game - Environment")
+        else:
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.small_screen = pygame.Surface(self.frame_size)
+            width, height = self.frame_size
+            self.frame = np.zeros((height, width, 3), dtype=np.uint8)
+        graphics = GraphicsEngine(self.screen, self.sim.rng.split('visuals'))
+        self.renderer = GameRenderer(self.screen, graphics, dirty_rects=False)
+
+    def close(self):
+        """Release the renderer and its window"""
+        if self.renderer is not None:
+            import pygame
+            pygame.quit()
+            self.renderer = None
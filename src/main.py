@@ -1,253 +1,202 @@
 """Main game module"""
+import os
 import pygame
 import sys
 import time
-from src.components.snake import Snake
-from src.components.food import Food
-from src.components.enemy import Enemy
 from src.components.menu import Menu
-from src.components.bullet import Bullet
-from src.components.ammo import Ammo
-from src.engine import GraphicsEngine
+from src.core import SimulationCore, InputQueue, Autopilot
+from src.core.simulation import DIRECTIONS, SHOOT
+from src.core.replay import ReplayWriter
+from src.engine import GraphicsEngine, GameRenderer, IdleScheduler
+from src.utils.clock import FixedTimestep
+from src.utils.profiler import FrameProfiler
+from src.utils.rng import GameRng
+from src.utils.text import default_text_renderer
 from src.config.settings import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE,
-    BASE_FPS, BLACK, WHITE, GRID_LINE_COLOR,
+    SCREEN_WIDTH, SCREEN_HEIGHT, RENDER_FPS,
+    FONT_SIZE, BLACK, WHITE, RECORD_REPLAYS, REPLAY_DIR, PROFILE_FRAMES, PROFILE_DIR,
 )
 
+# Keyboard bindings for player actions
+KEY_ACTIONS = {
+    pygame.K_UP: 'up',
+    pygame.K_w: 'up',
+    pygame.K_DOWN: 'down',
+    pygame.K_s: 'down',
+    pygame.K_LEFT: 'left',
+    pygame.K_a: 'left',
+    pygame.K_RIGHT: 'right',
+    pygame.K_d: 'right',
+    pygame.K_SPACE: SHOOT,
+}
+
+# Toggles the autopilot bot while playing
+AUTOPILOT_KEY = pygame.K_TAB
+
+# Frame profiler: show the per-phase overlay, and export the recorded trace
+PROFILER_KEY = pygame.K_F3
+PROFILE_EXPORT_KEY = pygame.K_F4
+
 class Game:
-    def __init__(self):
+    def __init__(self, seed=None):
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Advanced Snake Game")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
+        self.render_fps = RENDER_FPS  # Simulation runs at the snake's speed
+        self.timestep = FixedTimestep()
+        self.scheduler = IdleScheduler()  # Throttles menu, pause and game over
+        self.text = default_text_renderer()  # Cached fonts and text surfaces
         
+        # Separate random streams so visual effects never shift gameplay
+        self.rng = GameRng(seed)
+
+        # Per-phase frame timing, a no-op until enabled
+        self.profiler = FrameProfiler(enabled=PROFILE_FRAMES)
+        self.show_profile = False
+        self.profile_export = None  # Where the last trace export went, shown in the overlay
+
         # Initialize graphics engine
-        self.graphics = GraphicsEngine(self.screen)
+        self.graphics = GraphicsEngine(self.screen, self.rng.split('visuals'), self.profiler)
+        self.renderer = GameRenderer(self.screen, self.graphics, self.text)
         
         # Game components
-        self.menu = Menu()
-        self.snake = Snake()
-        self.food = Food()
-        self.enemy = Enemy()
-        self.bullets = []
-        self.ammo = None
+        self.menu = Menu(self.text)
+        self.sim = SimulationCore(rng=self.rng.split('gameplay'))
+        self.input_queue = InputQueue()
+        self.autopilot = None  # Bot steering the snake instead of the keyboard
+        self.record_replays = RECORD_REPLAYS
+        self.replay = None  # Session replay writer, opened with the first game
+        self.events = []  # Events polled this frame, shared by all states
         
         # Game state
         self.game_state = "menu"  # menu, playing, paused, game_over
-        self.score = 0
-        self.high_score = 0
-        self.enemy_slowdown_end = 0  # Track enemy slowdown timer
         
     def handle_input(self):
-        for event in pygame.event.get():
+        if self.game_state == "playing":
+            self.events = pygame.event.get()
+        else:
+            self.events = self.scheduler.poll(self.game_state)
+        for event in self.events:
             if event.type == pygame.QUIT:
                 return False
                 
             if event.type == pygame.KEYDOWN:
+                if event.key == PROFILER_KEY:
+                    self.toggle_profile()
+                elif event.key == PROFILE_EXPORT_KEY and self.profiler.frames:
+                    csv_path, _ = self.profiler.export(PROFILE_DIR)
+                    self.profile_export = os.path.splitext(csv_path)[0]
+                    self.renderer.refresh_profile()
+
                 if event.key == pygame.K_ESCAPE:
                     if self.game_state == "playing":
                         self.game_state = "paused"
                     elif self.game_state == "paused":
                         self.game_state = "playing"
+                        self.timestep.reset()
+                        self.renderer.request_full_redraw()
                         
-                if self.game_state == "playing":
-                    if event.key in (pygame.K_UP, pygame.K_w):
-                        self.snake.turn('up')
-                    elif event.key in (pygame.K_DOWN, pygame.K_s):
-                        self.snake.turn('down')
-                    elif event.key in (pygame.K_LEFT, pygame.K_a):
-                        self.snake.turn('left')
-                    elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                        self.snake.turn('right')
-                    elif event.key == pygame.K_SPACE:
-                        if self.snake.can_shoot():
-                            new_bullet = Bullet(
-                                self.snake.head[0],
-                                self.snake.head[1],
-                                self.snake.direction
-                            )
-                            self.bullets.append(new_bullet)
-                            self.snake.shoot()
+                if self.game_state == "playing" and event.key == AUTOPILOT_KEY:
+                    self.autopilot = None if self.autopilot else Autopilot()
+                    self.input_queue.clear()
+
+                if self.game_state == "playing" and event.key in KEY_ACTIONS:
+                    action = KEY_ACTIONS[event.key]
+                    if action in DIRECTIONS:
+                        # Buffered and applied one per tick
+                        snake = self.sim.snake
+                        self.input_queue.push_turn(action, snake.direction, snake.length)
+                    elif self.sim.apply_action(action):
+                        self.record(action)
         return True
+
+    def toggle_profile(self):
+        """Show or hide the frame profiler overlay, timing frames while it is shown"""
+        self.show_profile = not self.show_profile
+        if self.show_profile:
+            self.profiler.enable()
+        elif not PROFILE_FRAMES:
+            self.profiler.disable()
+        self.renderer.request_full_redraw()
+
+    def profile_notes(self):
+        """Lines shown under the profiler's percentile table"""
+        notes = []
+        latency = self.input_queue.latency_stats()
+        if latency["count"]:
+            notes.append(f"input to tick p50 {latency['p50']:.1f} p95 {latency['p95']:.1f} "
+                         f"max {latency['max']:.1f} ms")
+        render = self.renderer.stats()
+        screen_pixels = self.screen.get_width() * self.screen.get_height()
+        notes.append(f"pushed {render['pixels_pushed'] / screen_pixels:.1%} of screen in "
+                     f"{render['rects']} rects" + ("" if render['dirty_rects'] else ", dirty rects off"))
+        states = self.scheduler.stats()
+        if states:
+            notes.append("cpu " + ", ".join(f"{state} {report['cpu_share']:.0%}"
+                                            for state, report in states.items()))
+        if self.profile_export:
+            notes.append(f"trace saved to {self.profile_export}.csv and .json")
+        return notes
+
+    def record(self, action):
+        """Log an action applied before the next simulation tick"""
+        if self.replay:
+            self.replay.record(self.sim.ticks, action)
         
     def update(self):
         if self.game_state != "playing":
             return
             
-        # Move snake
-        self.snake.move()
-        
-        # Handle enemy slowdown if snake is boosted
-        if self.snake.is_boosted:
-            # Slow enemy significantly during the snake's boost
-            self.enemy.speed = max(self.enemy.base_speed * 0.2, 0.1)  # Drastically reduced speed
-            self.enemy_slowdown_end = self.snake.speed_boost_end
-        elif self.enemy_slowdown_end and time.time() >= self.enemy_slowdown_end:
-            # Restore enemy speed to base value after boost ends
-            self.enemy.speed = self.enemy.base_speed
-            self.enemy_slowdown_end = 0
-
-        # Move enemy
-        self.enemy.move(self.snake.head, self.food.position)
-        
-        # Move bullets
-        for bullet in self.bullets[:]:
-            bullet.move()
-            if bullet.is_off_screen(SCREEN_WIDTH, SCREEN_HEIGHT):
-                self.bullets.remove(bullet)
-            elif self.enemy.collides_with(bullet.get_position()):
-                self.bullets.remove(bullet)
-                self.enemy.spawn_at_edge()
-                self.score += 5  # Bonus points for hitting enemy
-        
-        # Check collisions
-        if (self.snake.collides_with_walls() or 
-            self.snake.collides_with_self() or 
-            self.enemy.collides_with(self.snake.head)):
+        if self.autopilot:
+            turn = self.autopilot.decide(self.sim)
+        else:
+            turn = self.input_queue.pop_turn()
+        # Turns along the current direction are no-ops, so keep them out of the replay
+        if turn is not None and turn != self.sim.snake.direction:
+            self.record(turn)
+        if not self.sim.step(turn):
             self.game_over()
-            return
-            
-        # Check food collision for snake
-        if self.snake.head == self.food.position:
-            self.score += self.food.points
-            self.high_score = max(self.score, self.high_score)
-            prev_boosted = self.snake.is_boosted
-            self.snake.apply_food_effect(self.food.effect)
-            # If snake just got a speed boost, trigger enemy slowdown
-            if self.food.effect == 'speed' and not prev_boosted:
-                self.enemy.speed = max(self.enemy.base_speed * 0.5, 1)
-                self.enemy_slowdown_end = self.snake.speed_boost_end
-            self.food.set_random_type()
-            self.food.randomize_position(self.snake.positions, self.enemy.position)
-            
-        # Check food collision for enemy
-        if self.enemy.collides_with(self.food.position):
-            if self.food.effect == 'grow':
-                self.enemy.grow(amount=3)
-            else:
-                self.enemy.grow(amount=1)
-            self.food.set_random_type()
-            self.food.randomize_position(self.snake.positions, self.enemy.position)
             
-        # Handle ammo pickup
-        if not self.ammo:
-            self.ammo = Ammo()
-            self.ammo.randomize_position(
-                self.snake.positions,
-                self.food.position,
-                self.enemy.get_position_grid()
-            )
-        elif self.snake.head == self.ammo.position:
-            self.snake.add_ammo(self.ammo.amount)
-            self.ammo = None
-            
-    def draw_game(self):
-        self.screen.fill(BLACK)
-        
-        # Clear previous frame effects
-        self.graphics.update()
-        
-        # Draw grid with fading effect
-        for x in range(0, SCREEN_WIDTH, GRID_SIZE):
-            fade = 1 - abs(x - SCREEN_WIDTH/2) / (SCREEN_WIDTH/2)
-            color = tuple(int(c * fade) for c in GRID_LINE_COLOR)
-            pygame.draw.line(self.screen, color, (x, 0), (x, SCREEN_HEIGHT))
-        for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
-            fade = 1 - abs(y - SCREEN_HEIGHT/2) / (SCREEN_HEIGHT/2)
-            color = tuple(int(c * fade) for c in GRID_LINE_COLOR)
-            pygame.draw.line(self.screen, color, (0, y), (SCREEN_WIDTH, y))
-        
-        # Draw enemy with glow effect
-        enemy_glow = self.graphics.create_glow((*self.enemy.color[:3], 128), GRID_SIZE * 2)
-        self.screen.blit(enemy_glow, 
-                        (self.enemy.position[0] - GRID_SIZE//2,
-                         self.enemy.position[1] - GRID_SIZE//2))
-        self.enemy.draw(self.screen)
-        
-        # Draw food with pulsing glow
-        self.food.draw(self.screen)
-        
-        # Draw snake with enhanced effects
-        for i, pos in enumerate(self.snake.positions):
-            color = self.snake.get_color(i)
-            if i == 0:  # Head
-                # Create gradient for head
-                head_surface = self.graphics.create_gradient(
-                    color, (*color[:3], 180), GRID_SIZE
-                )
-                self.screen.blit(head_surface, pos)
-                
-                # Add movement particles
-                if self.snake.speed > BASE_FPS:
-                    self.graphics.add_particle_effect(
-                        pos,
-                        color,
-                        2,
-                        10,
-                        velocity=(-2, 0) if self.snake.direction == 'right' else
-                                (2, 0) if self.snake.direction == 'left' else
-                                (0, 2) if self.snake.direction == 'up' else
-                                (0, -2)
-                    )
-                
-                # Draw eyes
-                eye_color = WHITE
-                eye_size = 4
-                pygame.draw.rect(self.screen, eye_color,
-                               (pos[0] + GRID_SIZE//4, pos[1] + GRID_SIZE//4,
-                                eye_size, eye_size))
-                pygame.draw.rect(self.screen, eye_color,
-                               (pos[0] + GRID_SIZE*2//3, pos[1] + GRID_SIZE//4,
-                                eye_size, eye_size))
-            else:  # Body segments
-                color = self.snake.get_color(i)
-                pygame.draw.rect(self.screen, color,
-                               (pos[0], pos[1], GRID_SIZE-1, GRID_SIZE-1))
-                # Add shine effect to body
-                pygame.draw.line(self.screen, WHITE,
-                               (pos[0], pos[1]),
-                               (pos[0] + GRID_SIZE//2, pos[1]), 2)
-        
-        # Draw bullets with trail effect
-        for bullet in self.bullets:
-            bullet.draw(self.screen)
-            
-        # Draw ammo pickup with glow effect
-        if self.ammo:
-            self.ammo.draw(self.screen)
-            
-        # Draw HUD
-        score_text = f"Score: {self.score}  High Score: {self.high_score}  Ammo: {self.snake.ammo_count}"
-        score_surface = self.font.render(score_text, True, WHITE)
-        self.screen.blit(score_surface, (10, 10))
-        
-        pygame.display.flip()
+    def draw_game(self, alpha=1.0):
+        self.renderer.draw(self.sim, alpha)
+        if self.show_profile:
+            self.profiler.switch("overlay")
+            self.renderer.draw_profile(self.profiler, self.profile_notes)
+        self.profiler.switch("present")
+        self.renderer.present()
         
     def game_over(self):
         self.game_state = "game_over"
-        if self.score > self.high_score:
-            self.high_score = self.score
+        if self.replay:
+            self.replay.end_game(self.sim.ticks, self.sim.score)
             
     def reset_game(self):
-        self.snake.reset()
-        self.enemy = Enemy()
-        self.food = Food()
-        self.food.randomize_position(self.snake.positions, self.enemy.position)
-        self.bullets = []
-        self.ammo = None
-        self.score = 0
+        # A fresh seed per game so its replay only needs the seed and inputs
+        seed = self.rng.getrandbits(63)
+        self.sim.reset(seed)
+        if self.record_replays:
+            if self.replay is None:
+                self.replay = self.open_replay()
+            self.replay.begin_game(seed, self.sim.swarm.count, self.sim.enemy_ai)
+        self.input_queue.clear()
         self.game_state = "playing"
+        self.timestep.reset()
+        self.renderer.request_full_redraw()
         
     def run(self):
+        profiler = self.profiler
         while True:
+            # Only playing frames are recorded, idle screens wait on input
+            profiler.start_frame("input")
+            self.scheduler.account(self.game_state)
             if not self.handle_input():
                 break
                 
             if self.game_state == "menu":
-                self.menu.display_menu(self.screen)
-                events = pygame.event.get()
-                action = self.menu.handle_input(events)
+                if self.scheduler.should_render("menu"):
+                    self.menu.display_menu(self.screen)
+                action = self.menu.handle_input(self.events)
                 
                 if action == "start_game":
                     self.reset_game()
@@ -255,23 +204,33 @@ class Game:
                     break
                     
             elif self.game_state == "playing":
-                self.update()
-                self.draw_game()
-                self.clock.tick(self.snake.speed)
+                # Fixed-timestep simulation at the snake's speed, drawing at
+                # up to render_fps with positions interpolated between ticks
+                profiler.switch("wait")
+                self.timestep.add_frame(self.clock.tick(self.render_fps) / 1000)
+                profiler.switch("update")
+                step_time = 1 / self.sim.snake.speed
+                while self.game_state == "playing" and self.timestep.consume(step_time):
+                    self.update()
+                    step_time = 1 / self.sim.snake.speed
+                if self.game_state == "playing":
+                    self.draw_game(self.timestep.alpha(step_time))
+                profiler.end_frame()
                 
             elif self.game_state == "game_over":
-                self.screen.fill(BLACK)
-                game_over_text = self.font.render(f"Game Over! Score: {self.score}", True, WHITE)
-                restart_text = self.font.render("Press SPACE to restart or ESC for menu", True, WHITE)
-                
-                self.screen.blit(game_over_text, 
-                    (SCREEN_WIDTH//2 - game_over_text.get_width()//2, SCREEN_HEIGHT//2 - 50))
-                self.screen.blit(restart_text,
-                    (SCREEN_WIDTH//2 - restart_text.get_width()//2, SCREEN_HEIGHT//2 + 50))
-                
-                pygame.display.flip()
+                if self.scheduler.should_render("game_over"):
+                    self.screen.fill(BLACK)
+                    game_over_text = self.text.render(f"Game Over! Score: {self.sim.score}", FONT_SIZE, WHITE)
+                    restart_text = self.text.render("Press SPACE to restart or ESC for menu", FONT_SIZE, WHITE)
+                    
+                    self.screen.blit(game_over_text, 
+                        (SCREEN_WIDTH//2 - game_over_text.get_width()//2, SCREEN_HEIGHT//2 - 50))
+                    self.screen.blit(restart_text,
+                        (SCREEN_WIDTH//2 - restart_text.get_width()//2, SCREEN_HEIGHT//2 + 50))
+                    
+                    pygame.display.flip()
                 
-                for event in pygame.event.get():
+                for event in self.events:
                     if event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_SPACE:
                             self.reset_game()
@@ -279,14 +238,26 @@ class Game:
                             self.game_state = "menu"
                             
             elif self.game_state == "paused":
-                pause_text = self.font.render("PAUSED", True, WHITE)
-                self.screen.blit(pause_text, 
-                    (SCREEN_WIDTH//2 - pause_text.get_width()//2, SCREEN_HEIGHT//2))
-                pygame.display.flip()
+                if self.scheduler.should_render("paused"):
+                    pause_text = self.text.render("PAUSED", FONT_SIZE, WHITE)
+                    self.screen.blit(pause_text, 
+                        (SCREEN_WIDTH//2 - pause_text.get_width()//2, SCREEN_HEIGHT//2))
+                    pygame.display.flip()
                 
+        if self.replay:
+            if self.game_state in ("playing", "paused"):
+                self.replay.end_game(self.sim.ticks, self.sim.score)
+            self.replay.close()
+        self.text.clear()
         pygame.quit()
         sys.exit()
 
+    def open_replay(self):
+        """Create the replay file for this session"""
+        os.makedirs(REPLAY_DIR, exist_ok=True)
+        path = os.path.join(REPLAY_DIR, time.strftime("%Y%m%d-%H%M%S") + ".ssr")
+        return ReplayWriter(open(path, 'wb'))
+
 if __name__ == "__main__":
     game = Game()
     game.run()
\ No newline at end of file
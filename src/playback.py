@@ -0,0 +1,81 @@
+"""Replay viewer: re-simulate recorded games headlessly or on screen
+
+Run from the repository root:
+
+    python -m src.playback replays/<session>.ssr --speed 4
+    python -m src.playback replays/<session>.ssr --headless
+"""
+import argparse
+import sys
+import time
+import pygame
+from src.core.replay import ReplayPlayer, load_replay
+from src.engine import GraphicsEngine, GameRenderer
+from src.utils.clock import FixedTimestep
+from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, RENDER_FPS
+
+
+def simulate(games):
+    """Re-simulate every game without a display and report each result"""
+    all_match = True
+    for index, game in enumerate(games):
+        player = ReplayPlayer(game)
+        start = time.perf_counter()
+        sim = player.run()
+        elapsed = time.perf_counter() - start
+        match = player.matches_recording()
+        all_match &= match
+        rate = sim.ticks / elapsed if elapsed else 0
+        print(f"game {index}: {sim.ticks} ticks, score {sim.score}, "
+              f"{len(game.events)} inputs, {rate:,.0f} ticks/sec, "
+              f"{'matches recording' if match else 'DIVERGED from recording'}")
+    return all_match
+
+
+def watch(games, speed):
+    """Render the games one after another at speed times real time"""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Advanced Snake Game - Replay")
+    clock = pygame.time.Clock()
+    renderer = GameRenderer(screen, GraphicsEngine(screen))
+    timestep = FixedTimestep()
+
+    for game in games:
+        player = ReplayPlayer(game)
+        renderer.request_full_redraw()
+        timestep.reset()
+        while not player.finished:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (
+                        event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    pygame.quit()
+                    return
+            timestep.add_frame(clock.tick(RENDER_FPS) / 1000)
+            step_time = 1 / (player.sim.snake.speed * speed)
+            while not player.finished and timestep.consume(step_time):
+                player.step()
+                step_time = 1 / (player.sim.snake.speed * speed)
+            renderer.draw(player.sim, timestep.alpha(step_time))
+            renderer.present()
+    pygame.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path')
+    parser.add_argument('--game', type=int, help="play only this game of the session")
+    parser.add_argument('--speed', type=float, default=1.0, help="playback speed multiplier")
+    parser.add_argument('--headless', action='store_true', help="re-simulate without a display")
+    args = parser.parse_args()
+
+    games = load_replay(args.path)
+    if args.game is not None:
+        games = games[args.game:args.game + 1]
+    if args.headless:
+        sys.exit(0 if simulate(games) else 1)
+    watch(games, args.speed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""Tournament runner: play seeded headless games for bots and settings sweeps
+
+Run from the repository root:
+
+    python -m src.tournament --bots autopilot greedy --games 500
+    python -m src.tournament --bots greedy --set ENEMY_SPEED=0.2,0.4 \\
+        --set SPEED_INCREMENT=0.1,0.2 --checkpoint sweep.jsonl
+
+Every combination of bot and --set values is one configuration, and each
+configuration plays the same --games seeds. Games run on a process pool
+and their results stream back as they finish. With --checkpoint, each
+result is appended to a JSON lines file, and rerunning the same command
+skips the games already recorded there. A bot is a name from BOTS or
+'module:factory', where factory(seed) returns a function from the
+simulation to an action.
+
+Games are reproducible from their seed, except that the autopilot stops
+searching when its time budget runs out, so its results depend on
+machine load. Raise --set AUTOPILOT_BUDGET_MS=... to compare runs exactly.
+"""
+import argparse
+import ast
+import importlib
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from src.config import settings
+from src.core import SimulationCore, Autopilot
+from src.core.simulation import DIRECTIONS, SHOOT
+from src.components.snake import MOVES, OPPOSITES
+from src.utils.rng import GameRng
+from src.config.settings import GRID_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT
+
+DEFAULT_MAX_TICKS = 20_000  # Games still running after this many ticks count as survived
+PROGRESS_INTERVAL = 2.0  # Seconds between progress lines
+
+
+def autopilot_bot(seed):
+    """The Autopilot bot, tuned by the AUTOPILOT_* settings"""
+    return Autopilot(budget_ms=settings.AUTOPILOT_BUDGET_MS,
+                     hamiltonian_fraction=settings.HAMILTONIAN_FRACTION).decide
+
+
+def greedy_bot(seed):
+    """Step toward the food, avoiding walls and the body one move ahead"""
+    rng = GameRng(seed).split('bot')
+
+    def decide(sim):
+        snake = sim.snake
+        x, y = snake.head
+        food_x, food_y = sim.food.position
+        tail = snake.positions[-1]
+        best = None
+        for direction in DIRECTIONS:
+            if len(snake.positions) > 1 and direction == OPPOSITES[snake.direction]:
+                continue
+            dx, dy = MOVES[direction]
+            cell = (x + dx, y + dy)
+            if not (0 <= cell[0] < SCREEN_WIDTH and 0 <= cell[1] < SCREEN_HEIGHT):
+                continue
+            if snake.occupies(cell) and cell != tail:
+                continue
+            distance = abs(cell[0] - food_x) + abs(cell[1] - food_y) + rng.random() * GRID_SIZE
+            if best is None or distance < best[0]:
+                best = (distance, direction)
+        if best is not None and snake.can_shoot() and rng.random() < 0.05:
+            return SHOOT
+        return best[1] if best else None
+    return decide
+
+
+def random_bot(seed):
+    """Keep going, with random turns and shots"""
+    rng = GameRng(seed).split('bot')
+
+    def decide(sim):
+        roll = rng.random()
+        if roll < 0.15:
+            return rng.choice(DIRECTIONS)
+        return SHOOT if roll < 0.2 else None
+    return decide
+
+
+# Built-in bots by name, each a factory taking the game seed
+BOTS = {
+    'autopilot': autopilot_bot,
+    'greedy': greedy_bot,
+    'random': random_bot,
+}
+
+
+def resolve_bot(name):
+    """Return the factory for a bot name or a 'module:factory' path"""
+    if name in BOTS:
+        return BOTS[name]
+    if ':' not in name:
+        raise ValueError(f"unknown bot {name!r}, expected one of {sorted(BOTS)} or module:factory")
+    module, factory = name.split(':', 1)
+    return getattr(importlib.import_module(module), factory)
+
+
+# Settings values at import, restored before each game's overrides are applied
+DEFAULTS = {name: value for name, value in vars(settings).items() if name.isupper()}
+
+
+def apply_settings(overrides):
+    """Set settings values for the next game, then restore every other one.
+
+    Components import settings by name, so each value is rebound in every
+    loaded ``src`` module that holds it. SPEED_BOOST_TICKS follows
+    BOOSTED_FPS and SPEED_BOOST_DURATION unless it is overridden itself.
+    Settings that other constants are derived from at import, such as the
+    screen and grid sizes, cannot be swept.
+    """
+    for name in overrides:
+        if name not in DEFAULTS:
+            raise ValueError(f"unknown setting {name!r}")
+    values = dict(DEFAULTS, **overrides)
+    if 'SPEED_BOOST_TICKS' not in overrides:
+        values['SPEED_BOOST_TICKS'] = values['SPEED_BOOST_DURATION'] * values['BOOSTED_FPS']
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not (module_name == 'src' or module_name.startswith('src.')):
+            continue
+        namespace = vars(module)
+        for name, value in values.items():
+            if name in namespace and namespace[name] is not value:
+                namespace[name] = value
+
+
+def play_game(task):
+    """Play one game in a worker process, returns its result record"""
+    config, game, seed, max_ticks = task
+    apply_settings(dict(config['settings']))
+    bot = resolve_bot(config['bot'])(seed)
+    # Unbounded enemy path searches keep results independent of machine load
+    sim = SimulationCore(swarm_size=settings.SWARM_SIZE, enemy_ai=settings.ENEMY_AI,
+                         path_budget_ms=None, seed=seed)
+    start = time.perf_counter()
+    alive = True
+    while alive and sim.ticks < max_ticks:
+        alive = sim.step(bot(sim))
+    return {
+        "config": config['id'],
+        "game": game,
+        "seed": seed,
+        "score": sim.score,
+        "ticks": sim.ticks,
+        "survived": alive,
+        "length": len(sim.snake.positions),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def parse_sweep(specs):
+    """Turn ['NAME=v1,v2', ...] into [(NAME, [v1, v2]), ...] of Python literals"""
+    sweep = []
+    for spec in specs:
+        name, _, values = spec.partition('=')
+        if not values:
+            raise ValueError(f"--set expects NAME=value[,value...], got {spec!r}")
+        sweep.append((name.strip(), [ast.literal_eval(value.strip()) for value in values.split(',')]))
+    return sweep
+
+
+def build_configs(bots, sweep):
+    """Every combination of bot and swept setting values"""
+    configs = []
+    names = [name for name, _ in sweep]
+    for bot in bots:
+        for values in itertools.product(*(values for _, values in sweep)):
+            overrides = list(zip(names, values))
+            label = ' '.join(f"{name}={value!r}" for name, value in overrides)
+            configs.append({"id": len(configs), "bot": bot, "settings": overrides,
+                            "label": f"{bot} {label}".strip()})
+    return configs
+
+
+def game_seeds(seed, games):
+    """Seeds shared by every configuration, so they face the same games"""
+    rng = GameRng(seed)
+    return [rng.split(f'game/{index}').initial_seed for index in range(games)]
+
+
+class Checkpoint:
+    """JSON lines file of the run's parameters followed by one line per game.
+
+    Reopening a file for the same run returns the games already played; a
+    line cut short by an interrupted write is dropped. A file written for
+    different parameters is refused rather than mixed in.
+    """
+
+    def __init__(self, path, run):
+        self.path = path
+        self.results = []
+        if os.path.exists(path) and os.path.getsize(path):
+            self._load(run)
+        else:
+            with open(path, 'w') as stream:
+                stream.write(json.dumps({"run": run}) + '\n')
+        self.stream = open(path, 'a')
+
+    def _load(self, run):
+        with open(self.path, 'rb') as stream:
+            data = stream.read()
+        complete = data[:data.rfind(b'\n') + 1]
+        if len(complete) != len(data):
+            with open(self.path, 'r+b') as stream:
+                stream.truncate(len(complete))
+        lines = complete.decode().splitlines()
+        if not lines or json.loads(lines[0]).get("run") != run:
+            raise ValueError(f"{self.path} was written for a different run; "
+                             "use another --checkpoint path")
+        self.results = [json.loads(line) for line in lines[1:]]
+
+    def done(self):
+        """(config id, game index) pairs already recorded"""
+        return {(result["config"], result["game"]) for result in self.results}
+
+    def record(self, result):
+        self.stream.write(json.dumps(result) + '\n')
+        self.stream.flush()
+
+    def close(self):
+        self.stream.close()
+
+
+def summarize(configs, results):
+    """Print score and survival statistics per configuration"""
+    by_config = {config['id']: [] for config in configs}
+    for result in results:
+        by_config[result["config"]].append(result)
+    width = max(len(config['label']) for config in configs)
+    print(f"{'configuration':<{width}} {'games':>6} {'mean':>8} {'±95%':>7} {'median':>7} "
+          f"{'max':>6} {'ticks':>8} {'survived':>9}")
+    for config in configs:
+        games = by_config[config['id']]
+        if not games:
+            continue
+        count = len(games)
+        scores = sorted(game["score"] for game in games)
+        mean = sum(scores) / count
+        spread = (math.sqrt(sum((score - mean) ** 2 for score in scores) / (count - 1))
+                  if count > 1 else 0.0)
+        ticks = sum(game["ticks"] for game in games) / count
+        survived = sum(game["survived"] for game in games) / count
+        print(f"{config['label']:<{width}} {count:>6} {mean:>8.2f} {1.96 * spread / math.sqrt(count):>7.2f} "
+              f"{scores[count // 2]:>7} {scores[-1]:>6} {ticks:>8.0f} {survived:>9.1%}")
+
+
+def ignore_interrupts():
+    """Leave Ctrl+C to the parent process, which stops the pool"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def run_tasks(tasks, workers, checkpoint, results):
+    """Play tasks on a pool of workers, recording results as they arrive"""
+    total = len(tasks)
+    start = last_report = time.perf_counter()
+    # One game per task: a game outlasts the pipe round trip, and results arrive as they finish
+    with multiprocessing.Pool(workers, initializer=ignore_interrupts) as pool:
+        for finished, result in enumerate(pool.imap_unordered(play_game, tasks), 1):
+            results.append(result)
+            if checkpoint:
+                checkpoint.record(result)
+            now = time.perf_counter()
+            if now - last_report >= PROGRESS_INTERVAL or finished == total:
+                rate = finished / (now - start)
+                print(f"{finished}/{total} games, {rate:.1f} games/s, "
+                      f"{(total - finished) / rate:.0f}s left", file=sys.stderr)
+                last_report = now
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bots', nargs='+', default=['autopilot'],
+                        help=f"bot names ({', '.join(BOTS)}) or module:factory paths")
+    parser.add_argument('--set', dest='sweep', action='append', default=[], metavar='NAME=V1,V2',
+                        help="settings value(s) to sweep, repeat for a grid")
+    parser.add_argument('--games', type=int, default=100, help="games per configuration")
+    parser.add_argument('--max-ticks', type=int, default=DEFAULT_MAX_TICKS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--checkpoint', help="JSON lines file to record results in and resume from")
+    args = parser.parse_args()
+
+    sweep = parse_sweep(args.sweep)
+    for name, _ in sweep:
+        if name not in DEFAULTS:
+            parser.error(f"unknown setting {name!r}")
+    for bot in args.bots:
+        resolve_bot(bot)
+    configs = build_configs(args.bots, sweep)
+    run = {"bots": args.bots, "sweep": sweep, "games": args.games, "max_ticks": args.max_ticks,
+           "seed": args.seed}
+
+    checkpoint = None
+    if args.checkpoint:
+        try:
+            checkpoint = Checkpoint(args.checkpoint, json.loads(json.dumps(run)))
+        except ValueError as error:
+            parser.error(str(error))
+    results = checkpoint.results if checkpoint else []
+    done = checkpoint.done() if checkpoint else set()
+    seeds = game_seeds(args.seed, args.games)
+    tasks = [(config, game, seeds[game], args.max_ticks)
+             for config in configs for game in range(args.games)
+             if (config['id'], game) not in done]
+    if done:
+        print(f"resuming: {len(done)} games recorded, {len(tasks)} to play", file=sys.stderr)
+
+    try:
+        if tasks:
+            run_tasks(tasks, args.workers, checkpoint, results)
+    except KeyboardInterrupt:
+        print("interrupted" + (", rerun the same command to resume" if checkpoint else ""),
+              file=sys.stderr)
+    finally:
+        if checkpoint:
+            checkpoint.close()
+    summarize(configs, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Tick-based virtual clock shared by the game components"""
+from src.config.settings import BASE_FPS
+
+
+class TickClock:
+    """Counts simulation ticks instead of reading wall-clock time.
+
+    Game rules measure durations in ``ticks`` so a run behaves the same no
+    matter how fast it is simulated. ``seconds`` tracks the equivalent play
+    time at the current ``tick_rate`` for animations and display.
+    """
+
+    def __init__(self, tick_rate=BASE_FPS):
+        self.tick_rate = tick_rate
+        self.reset()
+
+    def reset(self):
+        """Rewind the clock to tick zero"""
+        self.ticks = 0
+        self.seconds = 0.0
+
+    def snapshot(self):
+        """Return the clock's state as an immutable tuple"""
+        return (self.ticks, self.seconds, self.tick_rate)
+
+    def restore(self, state):
+        """Restore state returned by snapshot"""
+        self.ticks, self.seconds, self.tick_rate = state
+
+    def copy(self):
+        """Return an independent clock at the same tick"""
+        other = TickClock.__new__(TickClock)
+        other.__dict__ = self.__dict__.copy()
+        return other
+
+    def advance(self, ticks=1):
+        """Advance the clock by a number of ticks"""
+        self.ticks += ticks
+        self.seconds += ticks / self.tick_rate
+
+    def ticks_for(self, seconds):
+        """Convert a duration in seconds to ticks at the current rate"""
+        return max(1, round(seconds * self.tick_rate))
+
+
+class FixedTimestep:
+    """Turns variable real frame times into whole fixed-length simulation steps.
+
+    Frame time is accumulated and ``consume`` releases one step at a time,
+    so the simulation rate is independent of how often frames are drawn.
+    ``alpha`` is how far the accumulator is into the next step, for
+    interpolating the rendered state.
+    """
+
+    def __init__(self, max_frame_time=0.25):
+        self.max_frame_time = max_frame_time  # Avoid a spiral of catch-up steps
+        self.reset()
+
+    def reset(self):
+        """Drop any accumulated time"""
+        self.accumulator = 0.0
+
+    def add_frame(self, frame_time):
+        """Accumulate the real time taken by the last frame in seconds"""
+        self.accumulator += min(frame_time, self.max_frame_time)
+
+    def consume(self, step_time):
+        """Take one step of step_time seconds if enough time has accumulated"""
+        if self.accumulator >= step_time:
+            self.accumulator -= step_time
+            return True
+        return False
+
+    def alpha(self, step_time):
+        """Fraction of the next step already elapsed, between 0 and 1"""
+        return min(1.0, self.accumulator / step_time)
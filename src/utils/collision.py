@@ -11,15 +11,19 @@ def check_wall_collision(pos, width, height):
     x, y = pos
     return x < 0 or x >= width or y < 0 or y >= height
 
-def check_self_collision(positions):
-    """Check if snake collides with itself"""
-    head = positions[0]
-    return head in positions[1:]
+def check_self_collision(occupied, head):
+    """Check if snake collides with itself using its cell occupancy counts"""
+    return occupied.get(head, 0) > 1
 
-def check_enemy_collision(snake_head, enemy_pos):
-    """Check if snake collides with enemy"""
-    return check_collision(snake_head, enemy_pos)
+def find_enemy_collisions(grid, position):
+    """Enemies in the spatial grid overlapping position"""
+    return grid.query_point(position, kind='enemy')
 
-def check_food_collision(snake_head, food_pos):
-    """Check if snake collides with food"""
-    return snake_head == food_pos  # Exact match for food collection
\ No newline at end of file
+def check_enemy_collision(grid, position):
+    """Check if any enemy in the spatial grid overlaps position"""
+    return bool(grid.query_point(position, kind='enemy'))
+
+def check_food_collision(grid, snake_head):
+    """Food in the spatial grid at the snake's head, or None"""
+    found = grid.at(snake_head, kind='food')
+    return found[0] if found else None  # Exact cell match for food collection
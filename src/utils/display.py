@@ -4,24 +4,26 @@ import time
 from src.config.settings import (
     GRID_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT,
     BLACK, WHITE, GREEN, RED, BLUE, YELLOW,
-    GRID_LINE_COLOR
+    GRID_LINE_COLOR, FONT_SIZE
 )
+from src.utils.text import default_text_renderer, quantize_pulse
 
-def render_text(screen, text, font, color, position, shadow=False, pulsing=False):
-    """Render text with optional shadow and pulsing effect"""
+def render_text(screen, text, size, color, position, shadow=False, pulsing=False):
+    """Render text at a point size with optional shadow and pulsing effect"""
+    text_renderer = default_text_renderer()
     if pulsing:
-        # Create a pulsing effect
-        pulse = (math.sin(time.time() * 5) + 1) / 2  # Value between 0 and 1
-        color = tuple(max(0, min(255, c + 40 * pulse)) for c in color)
+        # Create a pulsing effect, quantized so renders come from the cache
+        pulse = quantize_pulse((math.sin(time.time() * 5) + 1) / 2)
+        color = tuple(max(0, min(255, int(c + 40 * pulse))) for c in color)
     
     if shadow:
         # Render shadow first
-        shadow_surface = font.render(text, True, (0, 0, 0))
+        shadow_surface = text_renderer.render(text, size, (0, 0, 0))
         shadow_pos = (position[0] + 2, position[1] + 2)
         screen.blit(shadow_surface, shadow_pos)
     
     # Render main text
-    text_surface = font.render(text, True, color)
+    text_surface = text_renderer.render(text, size, color)
     screen.blit(text_surface, position)
 
 def draw_background(screen, color=BLACK):
@@ -31,29 +33,31 @@ def draw_background(screen, color=BLACK):
 
 def draw_grid(screen):
     """Draw a grid on the screen with fade effect towards edges"""
-    for x in range(0, SCREEN_WIDTH, GRID_SIZE):
+    width, height = screen.get_size()
+    for x in range(0, width, GRID_SIZE):
         # Calculate fade based on distance from center
-        fade = 1 - abs(x - SCREEN_WIDTH/2) / (SCREEN_WIDTH/2)
+        fade = 1 - abs(x - width/2) / (width/2)
         color = tuple(int(c * fade) for c in GRID_LINE_COLOR)
-        pygame.draw.line(screen, color, (x, 0), (x, SCREEN_HEIGHT))
+        pygame.draw.line(screen, color, (x, 0), (x, height))
     
-    for y in range(0, SCREEN_HEIGHT, GRID_SIZE):
-        fade = 1 - abs(y - SCREEN_HEIGHT/2) / (SCREEN_HEIGHT/2)
+    for y in range(0, height, GRID_SIZE):
+        fade = 1 - abs(y - height/2) / (height/2)
         color = tuple(int(c * fade) for c in GRID_LINE_COLOR)
-        pygame.draw.line(screen, color, (0, y), (SCREEN_WIDTH, y))
+        pygame.draw.line(screen, color, (0, y), (width, y))
 
-def display_score(screen, font, score, high_score, boost_active=False):
+def display_score(screen, score, high_score, boost_active=False, size=FONT_SIZE):
     """Display the current score and high score with visual effects"""
     # Score shadow
     score_text = f"Score: {score}"
-    render_text(screen, score_text, font, WHITE, (10, 10), shadow=True, pulsing=boost_active)
+    render_text(screen, score_text, size, WHITE, (10, 10), shadow=True, pulsing=boost_active)
     
     # High score with golden color
     high_score_text = f"High Score: {high_score}"
-    render_text(screen, high_score_text, font, YELLOW, (10, 50), shadow=True)
+    render_text(screen, high_score_text, size, YELLOW, (10, 50), shadow=True)
 
-def display_game_over(screen, font, score, high_score):
+def display_game_over(screen, score, high_score, size=FONT_SIZE):
     """Display an animated game over screen"""
+    text_renderer = default_text_renderer()
     # Create a semi-transparent overlay
     overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
     overlay.fill(BLACK)
@@ -62,36 +66,36 @@ def display_game_over(screen, font, score, high_score):
     
     # Game over text with pulsing effect
     game_over_text = "GAME OVER!"
-    text_pos = (SCREEN_WIDTH // 2 - font.size(game_over_text)[0] // 2, 
+    text_pos = (SCREEN_WIDTH // 2 - text_renderer.size(game_over_text, size)[0] // 2, 
                 SCREEN_HEIGHT // 2 - 50)
-    render_text(screen, game_over_text, font, RED, text_pos, shadow=True, pulsing=True)
+    render_text(screen, game_over_text, size, RED, text_pos, shadow=True, pulsing=True)
     
     # Score display
     score_text = f"Score: {score}"
-    score_pos = (SCREEN_WIDTH // 2 - font.size(score_text)[0] // 2, 
+    score_pos = (SCREEN_WIDTH // 2 - text_renderer.size(score_text, size)[0] // 2, 
                  SCREEN_HEIGHT // 2 + 10)
-    render_text(screen, score_text, font, WHITE, score_pos, shadow=True)
+    render_text(screen, score_text, size, WHITE, score_pos, shadow=True)
     
     # High score display
     if score == high_score:
         high_score_text = "NEW HIGH SCORE!"
-        high_score_pos = (SCREEN_WIDTH // 2 - font.size(high_score_text)[0] // 2,
+        high_score_pos = (SCREEN_WIDTH // 2 - text_renderer.size(high_score_text, size)[0] // 2,
                          SCREEN_HEIGHT // 2 + 70)
-        render_text(screen, high_score_text, font, YELLOW, high_score_pos, 
+        render_text(screen, high_score_text, size, YELLOW, high_score_pos, 
                    shadow=True, pulsing=True)
     
     # Restart prompt
     restart_text = "Press SPACE to restart or ESC for menu"
-    restart_pos = (SCREEN_WIDTH // 2 - font.size(restart_text)[0] // 2,
+    restart_pos = (SCREEN_WIDTH // 2 - text_renderer.size(restart_text, size)[0] // 2,
                   SCREEN_HEIGHT * 3 // 4)
-    render_text(screen, restart_text, font, WHITE, restart_pos, shadow=True)
+    render_text(screen, restart_text, size, WHITE, restart_pos, shadow=True)
 
-def display_boost_indicator(screen, font, remaining_time):
+def display_boost_indicator(screen, remaining_time, size=FONT_SIZE):
     """Display active speed boost indicator"""
     if remaining_time > 0:
         boost_text = f"SPEED BOOST: {remaining_time:.1f}s"
         boost_pos = (SCREEN_WIDTH - 200, 10)
-        render_text(screen, boost_text, font, YELLOW, boost_pos, pulsing=True)
+        render_text(screen, boost_text, size, YELLOW, boost_pos, pulsing=True)
 
 def draw_snake_segment(screen, position, size, is_head=False):
     """Draw a snake segment with effects"""
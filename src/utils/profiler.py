@@ -0,0 +1,141 @@
+"""Per-phase frame-time profiler with rolling percentiles and trace export"""
+import csv
+import json
+import os
+import time
+import numpy as np
+from src.config.settings import PROFILER_WINDOW
+
+# Frame phases in the order a playing frame goes through them
+PHASES = ('input', 'wait', 'update', 'particles', 'grid', 'glow', 'draw', 'overlay', 'present')
+PERCENTILES = (50, 95, 99)
+HISTOGRAM_EDGES_MS = (0, 0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, 66, float('inf'))
+
+
+class FrameProfiler:
+    """Splits each frame's wall time between named phases.
+
+    A frame runs from ``start_frame`` to ``end_frame``. Code calls
+    ``switch(phase)`` where a phase begins; the time since the previous
+    switch is charged to the phase that was running. ``switch`` returns
+    that phase, so nested work such as building a glow surface in the
+    middle of drawing can switch back when it is done. ``end_frame``
+    stores the frame in a rolling window of ``window`` frames, which the
+    percentiles, histograms and exports read.
+
+    While disabled, every one of these calls returns straight away, so
+    the instrumentation costs one method call per phase.
+    """
+
+    def __init__(self, window=PROFILER_WINDOW, enabled=False, phases=PHASES):
+        self.phases = tuple(phases)
+        self.columns = {phase: index for index, phase in enumerate(self.phases)}
+        self.window = window
+        # Seconds per phase, then the whole frame, one row per frame
+        self.samples = np.zeros((window, len(self.phases) + 1))
+        self.frames = 0
+        self.enabled = False
+        if enabled:
+            self.enable()
+
+    def enable(self):
+        """Start timing from now, keeping frames already recorded"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.start_frame()
+
+    def disable(self):
+        """Stop timing; the current frame is dropped"""
+        self.enabled = False
+
+    def reset(self):
+        """Forget every recorded frame"""
+        self.frames = 0
+        self.samples.fill(0)
+
+    def switch(self, phase):
+        """Charge the time since the last switch to the running phase and start phase"""
+        if not self.enabled:
+            return None
+        now = time.perf_counter()
+        previous = self.phase
+        if previous is not None:
+            self.current[self.columns[previous]] += now - self.last
+        self.phase = phase
+        self.last = now
+        return previous
+
+    def start_frame(self, phase=None):
+        """Start timing a frame in phase, dropping any time not yet recorded"""
+        if not self.enabled:
+            return
+        self.current = [0.0] * (len(self.phases) + 1)
+        self.phase = phase
+        self.frame_start = self.last = time.perf_counter()
+
+    def end_frame(self):
+        """Record the frame since start_frame"""
+        if not self.enabled:
+            return
+        self.switch(None)
+        current = self.current
+        current[-1] = self.last - self.frame_start
+        self.samples[self.frames % self.window] = current
+        self.frames += 1
+
+    def trace(self):
+        """Recorded frames oldest first, in seconds, shape (frames, phases + 1)"""
+        if self.frames <= self.window:
+            return self.samples[:self.frames]
+        start = self.frames % self.window
+        return np.concatenate((self.samples[start:], self.samples[:start]))
+
+    def percentiles(self):
+        """{phase: (p50, p95, p99)} in milliseconds over the window, 'frame' for the total"""
+        trace = self.trace()
+        if not len(trace):
+            return {}
+        values = np.percentile(trace, PERCENTILES, axis=0) * 1000
+        return {name: tuple(values[:, column])
+                for column, name in enumerate(self.phases + ('frame',))}
+
+    def histograms(self, edges=HISTOGRAM_EDGES_MS):
+        """{phase: frame counts per bucket between edges in milliseconds} over the window"""
+        trace = self.trace() * 1000
+        return {name: np.histogram(trace[:, column], edges)[0].tolist()
+                for column, name in enumerate(self.phases + ('frame',))}
+
+    def write_csv(self, path):
+        """Write the trace as one row per frame, times in milliseconds"""
+        first = self.frames - len(self.trace())
+        with open(path, 'w', newline='') as stream:
+            writer = csv.writer(stream)
+            writer.writerow(('frame',) + self.phases + ('total',))
+            for offset, row in enumerate(self.trace() * 1000):
+                writer.writerow([first + offset] + [f"{value:.4f}" for value in row])
+
+    def write_json(self, path):
+        """Write the percentiles, histograms and trace, times in milliseconds"""
+        trace = self.trace()
+        document = {
+            "phases": list(self.phases),
+            "first_frame": self.frames - len(trace),
+            "frames": len(trace),
+            "percentiles": list(PERCENTILES),
+            "percentiles_ms": {name: list(values) for name, values in self.percentiles().items()},
+            # The last bucket has no upper edge
+            "histogram_edges_ms": list(HISTOGRAM_EDGES_MS[:-1]),
+            "histograms": self.histograms(),
+            "trace_ms": np.round(trace * 1000, 4).tolist(),
+        }
+        with open(path, 'w') as stream:
+            json.dump(document, stream, indent=1)
+
+    def export(self, directory):
+        """Write CSV and JSON traces named after the current time, returns their paths"""
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, time.strftime("%Y%m%d-%H%M%S"))
+        self.write_csv(base + ".csv")
+        self.write_json(base + ".json")
+        return base + ".csv", base + ".json"
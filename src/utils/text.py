@@ -0,0 +1,83 @@
+"""Shared text rendering service with font and surface caches"""
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from pygame import Surface
+
+# Maximum number of rendered text surfaces kept alive
+TEXT_CACHE_SIZE = 256
+
+# Number of discrete pulse phases used for animated text colors
+PULSE_STEPS = 16
+
+
+def quantize_pulse(pulse: float, steps: int = PULSE_STEPS) -> float:
+    """Snap a 0..1 pulse value to one of a fixed number of phases."""
+    return round(pulse * steps) / steps
+
+
+class TextRenderer:
+    def __init__(self, font_path: Optional[str] = None, max_size: int = TEXT_CACHE_SIZE):
+        """Initialize caches; font_path None uses pygame's default font."""
+        self.font_path = font_path
+        self.max_size = max_size
+        self.fonts: Dict[int, pygame.font.Font] = {}
+        self.surfaces: "OrderedDict[Tuple[str, int, tuple, bool], Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def font(self, size: int) -> pygame.font.Font:
+        """Return the cached font object for a point size."""
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(self.font_path, size)
+            self.fonts[size] = font
+        return font
+
+    def render(self, text: str, size: int, color: Tuple[int, ...], antialias: bool = True) -> Surface:
+        """Return a cached rendering of text (shared, do not draw on it)."""
+        key = (text, size, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(size).render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def size(self, text: str, size: int) -> Tuple[int, int]:
+        """Return the width and height text would take at a point size."""
+        return self.font(size).size(text)
+
+    def clear(self) -> None:
+        """Drop cached fonts and surfaces, required before pygame.quit()."""
+        self.fonts.clear()
+        self.surfaces.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and cache sizes."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.surfaces),
+            "fonts": len(self.fonts),
+        }
+
+
+_default_text_renderer: Optional[TextRenderer] = None
+
+
+def default_text_renderer() -> TextRenderer:
+    """Return the text renderer shared by the menu, HUD and display helpers."""
+    global _default_text_renderer
+    if _default_text_renderer is None:
+        _default_text_renderer = TextRenderer()
+    return _default_text_renderer
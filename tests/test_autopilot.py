@@ -0,0 +1,77 @@
+"""Tests for the Autopilot's searches and time budget"""
+import time
+import unittest
+from src.core import Autopilot, SimulationCore
+from src.core.autopilot import BUDGET_CHECK_INTERVAL
+
+WIDTH, HEIGHT = 16, 12
+START = 9 * WIDTH + 4
+
+
+class TestReachable(unittest.TestCase):
+    def setUp(self):
+        self.autopilot = Autopilot(width=WIDTH, height=HEIGHT)
+        self.autopilot.deadline = time.perf_counter() + 60
+        # Wall off the right-hand column
+        self.target = WIDTH - 1
+        self.blocked = {gy * WIDTH + WIDTH - 2 for gy in range(HEIGHT)}
+        # A fill from START past this half wall grows by two cells at a time
+        # around each multiple of BUDGET_CHECK_INTERVAL
+        self.gaps = self.blocked | {5 * WIDTH + gx for gx in range(0, WIDTH - 4, 2)}
+
+    def test_reaches_an_open_target(self):
+        reached, _ = self.autopilot._reachable(0, WIDTH * HEIGHT - 3, self.blocked)
+        self.assertTrue(reached)
+
+    def test_fills_the_whole_area_when_target_is_cut_off(self):
+        reached, filled = self.autopilot._reachable(0, self.target, self.blocked)
+        self.assertFalse(reached)
+        self.assertEqual(filled, (WIDTH - 2) * HEIGHT)
+
+    def test_checks_the_budget_every_interval(self):
+        checks = []
+        self.autopilot._out_of_time = lambda: checks.append(1) and False
+        _, filled = self.autopilot._reachable(START, self.target, self.gaps)
+        # Every filled cell is expanded once
+        self.assertEqual(len(checks), filled // BUDGET_CHECK_INTERVAL)
+
+    def test_stops_when_out_of_time(self):
+        self.autopilot.deadline = 0.0
+        reached, filled = self.autopilot._reachable(START, self.target, self.gaps)
+        self.assertFalse(reached)
+        # One budget check after BUDGET_CHECK_INTERVAL cells, each adding at most three
+        self.assertLessEqual(filled, 1 + 3 * BUDGET_CHECK_INTERVAL)
+
+
+class TestFindPath(unittest.TestCase):
+    def test_path_steps_between_neighbors(self):
+        autopilot = Autopilot(width=WIDTH, height=HEIGHT)
+        autopilot.deadline = time.perf_counter() + 60
+        path = autopilot._find_path(0, WIDTH * HEIGHT - 1, {}, set())
+        self.assertEqual(len(path), WIDTH + HEIGHT - 2)
+        previous = 0
+        for cell in path:
+            self.assertIn(cell, [neighbor for _, neighbor in autopilot.neighbors[previous]])
+            previous = cell
+
+    def test_gives_up_when_out_of_time(self):
+        autopilot = Autopilot(width=WIDTH, height=HEIGHT)
+        autopilot.deadline = 0.0
+        blocked = {gy * WIDTH + WIDTH - 2: 10 ** 6 for gy in range(HEIGHT)}
+        self.assertIsNone(autopilot._find_path(0, WIDTH - 1, blocked, set()))
+
+
+class TestDecide(unittest.TestCase):
+    def test_plays_legal_moves(self):
+        sim = SimulationCore(seed=4)
+        autopilot = Autopilot()
+        for _ in range(300):
+            direction = autopilot.decide(sim)
+            self.assertIn(direction, (None, 'up', 'down', 'left', 'right'))
+            if not sim.step(direction):
+                break
+        self.assertEqual(len(autopilot.decision_times), sim.ticks)
+
+
+if __name__ == '__main__':
+    unittest.main()
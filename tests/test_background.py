@@ -0,0 +1,65 @@
+"""Tests for the cached BackgroundLayers surface"""
+import unittest
+import pygame
+from src.engine.background import BackgroundLayers
+
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+
+
+def fill_rect(color, rect):
+    """Layer drawer filling rect with color"""
+    def draw(surface):
+        surface.fill(color, rect)
+    return draw
+
+
+class TestBackgroundLayers(unittest.TestCase):
+    SIZE = (20, 10)
+
+    def setUp(self):
+        self.background = BackgroundLayers(color=BLACK)
+        self.background.add_layer('red', fill_rect(RED, (0, 0, 5, 5)))
+
+    def pixel(self, position, size=SIZE):
+        return tuple(self.background.get_surface(size).get_at(position))[:3]
+
+    def test_surface_is_reused_until_something_changes(self):
+        surface = self.background.get_surface(self.SIZE)
+        for _ in range(3):
+            self.assertIs(self.background.get_surface(self.SIZE), surface)
+            self.background.blit(pygame.Surface(self.SIZE))
+            self.background.blit(pygame.Surface(self.SIZE), pygame.Rect(2, 2, 4, 4))
+        self.assertEqual(self.background.renders, 1)
+
+    def test_adding_a_layer_rebuilds(self):
+        self.assertEqual(self.pixel((10, 5)), BLACK)
+        self.background.add_layer('green', fill_rect(GREEN, (8, 0, 5, 10)))
+        self.assertEqual(self.pixel((10, 5)), GREEN)
+        self.assertEqual(self.pixel((1, 1)), RED)
+        self.assertEqual(self.background.renders, 2)
+
+    def test_removing_a_layer_rebuilds(self):
+        self.assertEqual(self.pixel((1, 1)), RED)
+        self.background.remove_layer('red')
+        self.assertEqual(self.pixel((1, 1)), BLACK)
+        self.assertEqual(self.background.renders, 2)
+
+    def test_resizing_rebuilds(self):
+        self.background.get_surface(self.SIZE)
+        larger = self.background.get_surface((40, 30))
+        self.assertEqual(larger.get_size(), (40, 30))
+        self.assertIs(self.background.get_surface((40, 30)), larger)
+        self.assertEqual(self.background.renders, 2)
+
+    def test_blit_copies_only_the_area(self):
+        screen = pygame.Surface(self.SIZE)
+        screen.fill(GREEN)
+        self.background.blit(screen, pygame.Rect(0, 0, 2, 2))
+        self.assertEqual(tuple(screen.get_at((1, 1)))[:3], RED)
+        self.assertEqual(tuple(screen.get_at((3, 3)))[:3], GREEN)
+
+
+if __name__ == '__main__':
+    unittest.main()
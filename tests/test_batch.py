@@ -0,0 +1,379 @@
+"""Tests for BatchSnakeSim and its agreement with SimulationCore"""
+import random
+import unittest
+import numpy as np
+from src.components.ammo import AMMO_PER_PICKUP
+from src.config.settings import (
+    GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, BOOSTED_FPS, SPEED_BOOST_TICKS, ENEMY_SPEED, FOOD_TYPES,
+)
+from src.core import BatchSnakeSim, SimulationCore
+from src.core.batch import (
+    ACTIONS, FOOD_NAMES, NOOP, UP, DOWN, LEFT, RIGHT, SHOOT, START_X, START_Y, EDGE_X, EDGE_Y,
+)
+from src.components.snake import MOVES, OPPOSITES
+from src.core.simulation import DIRECTIONS
+
+G = GRID_SIZE
+# Segments the snake gains per food effect
+GROWTH = {None: 1, 'speed': 0, 'grow': 3}
+
+
+def cell(x, y):
+    """Cell index of grid coordinates"""
+    return y * GRID_WIDTH + x
+
+
+def place_snake(batch, row, cells, direction):
+    """Put a snake on grid cells (x, y), head first, moving in direction"""
+    batch.occupied[row] = 0
+    for offset, (x, y) in enumerate(cells):
+        batch.body[row, (batch.head_slot - offset) % batch.capacity] = cell(x, y)
+        batch.occupied[row, cell(x, y)] += 1
+    batch.head_x[row], batch.head_y[row] = cells[0]
+    batch.head[row] = cell(*cells[0])
+    batch.length[row] = len(cells)
+    batch.direction[row] = direction - 1
+
+
+def place_enemy(batch, row, x, y, speed=ENEMY_SPEED):
+    """Put the enemy of one game at pixel position (x, y)"""
+    batch.enemy_x[row] = x
+    batch.enemy_y[row] = y
+    batch.enemy_cell[row] = cell(round(x / G), round(y / G))
+    batch.enemy_speed[row] = speed
+
+
+def quiet(count=1, seed=0):
+    """Batch whose enemies, food and ammo sit in far corners away from the snakes"""
+    batch = BatchSnakeSim(count, seed=seed)
+    for row in range(count):
+        place_enemy(batch, row, 0, 0)
+        batch.food_cell[row] = cell(GRID_WIDTH - 1, GRID_HEIGHT - 1)
+        batch.ammo_cell[row] = cell(0, GRID_HEIGHT - 1)
+    return batch
+
+
+def body_counts(batch, row):
+    """Segments per cell counted from the ring buffer"""
+    slots = (batch.head_slot - np.arange(batch.length[row])) % batch.capacity
+    return np.bincount(batch.body[row, slots], minlength=batch.occupied.shape[1])
+
+
+def load(batch, row, sim):
+    """Copy the state of sim's game into one row of batch"""
+    snake = sim.snake
+    cells = [(int(x // G), int(y // G)) for x, y in snake.positions]
+    place_snake(batch, row, cells, ACTIONS.index(snake.direction))
+    batch.growth_queue[row] = snake.growth_queue
+    batch.food_eaten[row] = snake.food_eaten
+    batch.ammo_count[row] = snake.ammo_count
+    batch.boosted[row] = snake.is_boosted
+    batch.boost_end[row] = snake.speed_boost_end
+    batch.ticks[row] = sim.ticks
+    batch.score[row] = sim.score
+
+    enemy = sim.enemy
+    place_enemy(batch, row, *enemy.positions[0], speed=enemy.speed)
+    batch.enemy_length[row] = enemy.length
+    batch.enemy_growth[row] = enemy.growth_queue
+    batch.enemy_food_eaten[row] = enemy.food_eaten
+    batch.slowdown_end[row] = sim.enemy_slowdown_end
+
+    food_x, food_y = sim.food.position
+    batch.food_cell[row] = cell(int(food_x // G), int(food_y // G))
+    batch.food_type[row] = FOOD_NAMES.index(sim.food.type)
+    if sim.ammo:
+        ammo_x, ammo_y = sim.ammo.position
+        batch.ammo_cell[row] = cell(int(ammo_x // G), int(ammo_y // G))
+    else:
+        batch.ammo_cell[row] = -1
+
+    bullets = list(sim.bullets)
+    velocity = sim.bullets.velocity
+    batch.bullet_live[row] = False
+    for slot, (x, y) in enumerate(bullets):
+        batch.bullet_x[row, slot] = x
+        batch.bullet_y[row, slot] = y
+        batch.bullet_dx[row, slot], batch.bullet_dy[row, slot] = velocity[slot]
+        batch.bullet_live[row, slot] = True
+        batch.bullet_fired[row, slot] = slot
+    batch.bullet_count[row] = len(bullets)
+
+
+def seeker(sim, rng):
+    """Head for the ammo while out of bullets, else the food, with some random moves"""
+    if rng.random() < 0.2:
+        return rng.choice(ACTIONS)
+    snake = sim.snake
+    target = sim.ammo.position if sim.ammo and not snake.ammo_count else sim.food.position
+    x, y = snake.head
+    best = None
+    for direction in DIRECTIONS:
+        if len(snake.positions) > 1 and direction == OPPOSITES[snake.direction]:
+            continue
+        dx, dy = MOVES[direction]
+        position = (x + dx, y + dy)
+        if snake.occupies(position):
+            continue
+        distance = abs(position[0] - target[0]) + abs(position[1] - target[1])
+        if best is None or distance < best[0]:
+            best = (distance, direction)
+    return best[1] if best else None
+
+
+class TestTurns(unittest.TestCase):
+    def test_turns_change_direction(self):
+        batch = quiet(4)
+        for row in range(4):
+            place_snake(batch, row, [(START_X, START_Y)], UP)
+        batch.step([UP, DOWN, LEFT, RIGHT])
+        self.assertEqual(batch.head_x.tolist(), [START_X, START_X, START_X - 1, START_X + 1])
+        self.assertEqual(batch.head_y.tolist(), [START_Y - 1, START_Y + 1, START_Y, START_Y])
+
+    def test_reversal_is_refused_once_the_snake_is_longer_than_one(self):
+        batch = quiet(2)
+        place_snake(batch, 0, [(START_X, START_Y), (START_X - 1, START_Y)], RIGHT)
+        place_snake(batch, 1, [(START_X, START_Y)], RIGHT)
+        ended = batch.step([LEFT, LEFT])
+        self.assertFalse(ended.any())
+        self.assertEqual(batch.direction.tolist(), [RIGHT - 1, LEFT - 1])
+        self.assertEqual(batch.head_x.tolist(), [START_X + 1, START_X - 1])
+
+    def test_no_action_keeps_direction(self):
+        batch = quiet()
+        place_snake(batch, 0, [(START_X, START_Y)], DOWN)
+        batch.step([NOOP])
+        batch.step([NOOP])
+        self.assertEqual((batch.head_x[0], batch.head_y[0]), (START_X, START_Y + 2))
+
+
+class TestFood(unittest.TestCase):
+    def test_growth_and_points_follow_food_types(self):
+        for code, name in enumerate(FOOD_NAMES):
+            with self.subTest(food=name):
+                batch = quiet()
+                place_snake(batch, 0, [(START_X, START_Y)], RIGHT)
+                batch.food_cell[0] = cell(START_X + 1, START_Y)
+                batch.food_type[0] = code
+                batch.step([NOOP])
+                growth = GROWTH[FOOD_TYPES[name]['effect']]
+                self.assertEqual(batch.score[0], FOOD_TYPES[name]['points'])
+                self.assertEqual(batch.food_eaten[0], 1)
+                self.assertEqual(batch.growth_queue[0], growth)
+                self.assertNotEqual(batch.food_cell[0], cell(START_X + 1, START_Y))
+                batch.food_cell[0] = cell(GRID_WIDTH - 1, GRID_HEIGHT - 1)
+                for _ in range(4):
+                    batch.step([NOOP])
+                self.assertEqual(batch.length[0], 1 + growth)
+                self.assertEqual(batch.growth_queue[0], 0)
+
+    def test_enemy_eating_food_grows_it(self):
+        batch = quiet()
+        place_snake(batch, 0, [(START_X, START_Y)], DOWN)
+        place_enemy(batch, 0, 0, 0, speed=0)
+        batch.food_cell[0] = cell(0, 0)
+        batch.food_type[0] = FOOD_NAMES.index('special')
+        batch.step([NOOP])
+        self.assertEqual(batch.enemy_growth[0], 3)
+        self.assertEqual(batch.enemy_food_eaten[0], 1)
+        batch.step([NOOP])
+        self.assertEqual(batch.enemy_length[0], 4)
+
+
+class TestBoost(unittest.TestCase):
+    def test_boost_slows_the_enemy_until_it_ends(self):
+        batch = quiet()
+        place_snake(batch, 0, [(START_X, START_Y)], RIGHT)
+        batch.food_cell[0] = cell(START_X + 1, START_Y)
+        batch.food_type[0] = FOOD_NAMES.index('boost')
+        batch.step([NOOP])
+        eaten_at = batch.ticks[0]
+        self.assertTrue(batch.boosted[0])
+        self.assertEqual(batch.boost_end[0], eaten_at + SPEED_BOOST_TICKS)
+        self.assertEqual(batch.snake_speed[0], BOOSTED_FPS)
+        # A fresh boost briefly speeds the enemy up, then it slows down
+        self.assertEqual(batch.enemy_speed[0], max(ENEMY_SPEED * 0.5, 1))
+        self.assertEqual(batch.slowdown_end[0], batch.boost_end[0])
+        batch.food_cell[0] = cell(GRID_WIDTH - 1, GRID_HEIGHT - 1)
+
+        # Circle a 2x2 square until the boost runs out
+        loop = [DOWN, LEFT, UP, RIGHT]
+        while batch.ticks[0] < eaten_at + SPEED_BOOST_TICKS - 1:
+            ended = batch.step([loop[batch.ticks[0] % 4]])
+            self.assertFalse(ended[0])
+            self.assertTrue(batch.boosted[0])
+            self.assertEqual(batch.enemy_speed[0], max(ENEMY_SPEED * 0.2, 0.1))
+        batch.step([loop[batch.ticks[0] % 4]])
+        self.assertFalse(batch.boosted[0])
+        self.assertEqual(batch.enemy_speed[0], ENEMY_SPEED)
+        self.assertEqual(batch.slowdown_end[0], 0)
+
+
+class TestAmmo(unittest.TestCase):
+    def test_pickup_adds_ammo_and_a_new_pack_appears(self):
+        batch = quiet()
+        place_snake(batch, 0, [(START_X, START_Y)], UP)
+        batch.ammo_cell[0] = cell(START_X, START_Y - 1)
+        batch.step([NOOP])
+        self.assertEqual(batch.ammo_count[0], AMMO_PER_PICKUP)
+        self.assertEqual(batch.ammo_cell[0], -1)
+        batch.step([NOOP])
+        ammo = batch.ammo_cell[0]
+        self.assertGreaterEqual(ammo, 0)
+        self.assertEqual(batch.occupied[0, ammo], 0)
+        self.assertNotIn(ammo, (batch.food_cell[0], batch.enemy_cell[0]))
+
+    def test_shooting_spends_ammo(self):
+        batch = quiet()
+        place_snake(batch, 0, [(START_X, START_Y)], LEFT)
+        batch.ammo_count[0] = 1
+        batch.step([SHOOT])
+        batch.step([SHOOT])
+        self.assertEqual(batch.ammo_count[0], 0)
+        self.assertEqual(batch.bullet_count[0], 1)
+
+
+class TestBullets(unittest.TestCase):
+    def fire(self, batch, x, y, dx, fired):
+        slot = batch.bullet_count[0]
+        batch.bullet_x[0, slot] = x
+        batch.bullet_y[0, slot] = y
+        batch.bullet_dx[0, slot] = dx
+        batch.bullet_dy[0, slot] = 0
+        batch.bullet_live[0, slot] = True
+        batch.bullet_fired[0, slot] = fired
+        batch.bullet_count[0] += 1
+
+    def test_fast_bullet_hits_an_enemy_it_passes_within_one_tick(self):
+        batch = quiet()
+        place_snake(batch, 0, [(START_X, START_Y)], DOWN)
+        target = (8 * G, 4 * G)
+        place_enemy(batch, 0, *target, speed=0)
+        # Neither end of the step overlaps the enemy's cell
+        self.fire(batch, target[0] - 1.5 * G, target[1], 3 * G, fired=0)
+        batch.step([NOOP])
+        self.assertEqual(batch.score[0], 5)
+        self.assertEqual(batch.bullet_count[0], 0)
+        x, y = batch.enemy_x[0], batch.enemy_y[0]
+        self.assertTrue(x in (0, EDGE_X) or y in (0, EDGE_Y))
+
+    def test_bullet_beside_the_path_misses(self):
+        batch = quiet()
+        place_snake(batch, 0, [(START_X, START_Y)], DOWN)
+        target = (8 * G, 4 * G)
+        place_enemy(batch, 0, *target, speed=0)
+        self.fire(batch, target[0] - 1.5 * G, target[1] + G, 3 * G, fired=0)
+        batch.step([NOOP])
+        self.assertEqual(batch.score[0], 0)
+        self.assertEqual(batch.bullet_count[0], 1)
+
+    def test_oldest_bullet_is_spent(self):
+        batch = quiet()
+        place_snake(batch, 0, [(START_X, START_Y)], DOWN)
+        target = (8 * G, 4 * G)
+        place_enemy(batch, 0, *target, speed=0)
+        self.fire(batch, target[0] + G, target[1], -G, fired=5)
+        self.fire(batch, target[0] - G, target[1], G, fired=2)
+        batch.step([NOOP])
+        self.assertEqual(batch.score[0], 5)
+        self.assertEqual(batch.bullet_live[0].tolist().count(True), 1)
+        self.assertTrue(batch.bullet_live[0, 0])
+
+
+class TestReset(unittest.TestCase):
+    def test_ended_games_record_their_result_and_restart(self):
+        batch = quiet(2)
+        place_snake(batch, 0, [(GRID_WIDTH - 1, START_Y)], RIGHT)
+        place_snake(batch, 1, [(START_X, START_Y)], UP)
+        batch.score[0] = 7
+        batch.ticks[0] = 40
+        ended = batch.step([NOOP, NOOP])
+        self.assertEqual(ended.tolist(), [True, False])
+        self.assertEqual(batch.final_score[0], 7)
+        self.assertEqual(batch.final_ticks[0], 41)
+        self.assertEqual(batch.episodes, 1)
+        self.assertEqual((batch.score[0], batch.ticks[0], batch.length[0]), (0, 0, 1))
+        self.assertEqual((batch.head_x[0], batch.head_y[0]), (START_X, START_Y))
+        self.assertEqual(batch.occupied[0].sum(), 1)
+        self.assertEqual(batch.ticks[1], 1)
+
+    def test_running_into_the_body_ends_the_game(self):
+        batch = quiet()
+        x, y = START_X, START_Y
+        place_snake(batch, 0, [(x, y), (x, y + 1), (x - 1, y + 1), (x - 1, y), (x - 1, y - 1)], UP)
+        ended = batch.step([LEFT])
+        self.assertTrue(ended[0])
+
+
+class TestOccupancy(unittest.TestCase):
+    def test_occupied_matches_the_ring_buffer(self):
+        batch = BatchSnakeSim(16, seed=3)
+        rng = np.random.default_rng(4)
+        for _ in range(600):
+            batch.step(rng.choice([NOOP] * 6 + [UP, DOWN, LEFT, RIGHT], size=16))
+            for row in range(16):
+                self.assertEqual(batch.occupied[row].tolist(), body_counts(batch, row).tolist())
+        self.assertGreater(batch.episodes, 0)
+
+
+class TestLockstep(unittest.TestCase):
+    def test_rules_match_simulation_core(self):
+        """Each tick starts both from the same state and must end in the same state
+
+        Food, ammo and respawned enemies are placed by different random
+        streams, so those positions are only compared when no draw moved them.
+        """
+        seen = {'boost': 0, 'pickup': 0, 'shot': 0, 'ended': 0}
+        batch = BatchSnakeSim(1, seed=0)
+        for seed in range(4):
+            sim = SimulationCore(seed=seed)
+            rng = random.Random(seed)
+            alive = True
+            while alive and sim.ticks < 1500:
+                load(batch, 0, sim)
+                action = seeker(sim, rng)
+                score, eaten = sim.score, sim.snake.food_eaten
+                enemy_eaten = sim.enemy.food_eaten
+                boosted, ammo_count = sim.snake.is_boosted, sim.snake.ammo_count
+
+                alive = sim.step(action)
+                ended = batch.step([ACTIONS.index(action)])
+                self.assertEqual(bool(ended[0]), not alive)
+                if not alive:
+                    self.assertEqual(batch.final_score[0], sim.score)
+                    self.assertEqual(batch.final_ticks[0], sim.ticks)
+                    seen['ended'] += 1
+                    break
+
+                snake = sim.snake
+                self.assertEqual(batch.positions(0), list(snake.positions))
+                self.assertEqual(batch.direction[0], ACTIONS.index(snake.direction) - 1)
+                self.assertEqual(batch.score[0], sim.score)
+                self.assertEqual(batch.growth_queue[0], snake.growth_queue)
+                self.assertEqual(batch.food_eaten[0], snake.food_eaten)
+                self.assertEqual(batch.ammo_count[0], snake.ammo_count)
+                self.assertEqual(batch.boosted[0], snake.is_boosted)
+                self.assertEqual(batch.boost_end[0], snake.speed_boost_end)
+                self.assertEqual(batch.enemy_speed[0], sim.enemy.speed)
+                self.assertEqual(batch.enemy_length[0], sim.enemy.length)
+                self.assertEqual(batch.enemy_growth[0], sim.enemy.growth_queue)
+                self.assertEqual(batch.slowdown_end[0], sim.enemy_slowdown_end)
+                self.assertEqual(batch.bullet_count[0], len(sim.bullets))
+                live = batch.bullet_live[0]
+                self.assertEqual(sorted(zip(batch.bullet_x[0][live].tolist(),
+                                            batch.bullet_y[0][live].tolist())),
+                                 sorted(sim.bullets))
+                if sim.score - score < 5:  # No hit, so the enemy was not respawned
+                    self.assertEqual((batch.enemy_x[0], batch.enemy_y[0]), sim.enemy.position)
+                if snake.food_eaten == eaten and sim.enemy.food_eaten == enemy_eaten:
+                    food_x, food_y = sim.food.position
+                    self.assertEqual(batch.food_cell[0], cell(int(food_x // G), int(food_y // G)))
+                self.assertEqual(batch.ammo_cell[0] >= 0, sim.ammo is not None)
+                seen['boost'] += snake.is_boosted and not boosted
+                seen['pickup'] += snake.ammo_count > ammo_count
+                seen['shot'] += snake.ammo_count < ammo_count
+        self.assertTrue(all(seen.values()), seen)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Tests for BulletPool movement and hits"""
+import unittest
+from src.config.settings import GRID_SIZE
+from src.core.bullets import BulletPool
+
+G = GRID_SIZE
+TARGET = (8 * G, 4 * G)
+
+
+class TestHits(unittest.TestCase):
+    def test_fast_bullet_hits_a_target_it_passes_within_one_tick(self):
+        # Starts 1.5 cells before the target and ends 1.5 cells past it,
+        # so neither end of the step overlaps the target's cell
+        pool = BulletPool(speed=3 * G)
+        pool.spawn((TARGET[0] - 1.5 * G, TARGET[1]), 'right')
+        self.assertEqual(pool.update([TARGET]), [0])
+        self.assertEqual(len(pool), 0)
+
+    def test_bullet_at_default_speed_hits_a_target_it_passes(self):
+        pool = BulletPool()
+        pool.spawn((TARGET[0], TARGET[1] + 1.2 * G), 'up')
+        self.assertEqual(pool.update([TARGET]), [0])
+
+    def test_bullet_beside_the_path_misses(self):
+        pool = BulletPool(speed=3 * G)
+        pool.spawn((TARGET[0] - 1.5 * G, TARGET[1] + G), 'right')
+        self.assertEqual(pool.update([TARGET]), [])
+        self.assertEqual(len(pool), 1)
+
+    def test_one_bullet_per_target_per_tick(self):
+        pool = BulletPool()
+        pool.spawn((TARGET[0] - G, TARGET[1]), 'right')
+        pool.spawn((TARGET[0] + G, TARGET[1]), 'left')
+        self.assertEqual(pool.update([TARGET]), [0])
+        # The older bullet is spent, the newer one flies on
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(list(pool), [(TARGET[0] + G - pool.speed, TARGET[1])])
+
+    def test_two_bullets_hit_two_targets(self):
+        other = (TARGET[0], TARGET[1] + 4 * G)
+        pool = BulletPool()
+        pool.spawn((TARGET[0] - G, TARGET[1]), 'right')
+        pool.spawn((other[0] - G, other[1]), 'right')
+        self.assertEqual(sorted(pool.update([TARGET, other])), [0, 1])
+        self.assertEqual(len(pool), 0)
+
+    def test_bullets_leaving_the_screen_are_removed(self):
+        pool = BulletPool()
+        pool.spawn((G, G), 'left')
+        pool.spawn((10 * G, 10 * G), 'left')
+        pool.update([])
+        self.assertEqual(list(pool), [(10 * G - pool.speed, 10 * G)])
+
+    def test_full_pool_refuses_shots(self):
+        pool = BulletPool(capacity=2)
+        self.assertTrue(pool.spawn((G, G), 'up'))
+        self.assertTrue(pool.spawn((G, G), 'up'))
+        self.assertFalse(pool.spawn((G, G), 'up'))
+        self.assertEqual(pool.dropped, 1)
+
+    def test_copies_do_not_share_bullets(self):
+        pool = BulletPool()
+        pool.spawn((5 * G, 5 * G), 'right')
+        copy = pool.copy()
+        copy.update([])
+        copy.spawn((G, G), 'down')
+        self.assertEqual(list(pool), [(5 * G, 5 * G)])
+        self.assertEqual(len(copy), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Tests for the TickClock and FixedTimestep"""
+import unittest
+from src.utils.clock import FixedTimestep, TickClock
+
+STEP = 0.25
+
+
+def steps(timestep):
+    """Number of steps consume() releases before running out"""
+    count = 0
+    while timestep.consume(STEP):
+        count += 1
+    return count
+
+
+class TestFixedTimestep(unittest.TestCase):
+    def setUp(self):
+        self.timestep = FixedTimestep(max_frame_time=1.0)
+
+    def test_consume_releases_whole_steps(self):
+        self.timestep.add_frame(0.125)
+        self.assertEqual(steps(self.timestep), 0)
+        self.timestep.add_frame(0.5)
+        self.assertEqual(steps(self.timestep), 2)
+        self.assertEqual(self.timestep.accumulator, 0.125)
+
+    def test_leftover_time_carries_into_later_frames(self):
+        counts = []
+        for _ in range(4):
+            self.timestep.add_frame(0.375)
+            counts.append(steps(self.timestep))
+        self.assertEqual(counts, [1, 2, 1, 2])
+        self.assertEqual(self.timestep.accumulator, 0.0)
+
+    def test_alpha_is_the_fraction_into_the_next_step(self):
+        self.assertEqual(self.timestep.alpha(STEP), 0.0)
+        self.timestep.add_frame(0.3125)
+        self.assertEqual(self.timestep.alpha(STEP), 1.0)
+        self.timestep.consume(STEP)
+        self.assertEqual(self.timestep.alpha(STEP), 0.25)
+
+    def test_long_frames_are_clamped(self):
+        self.timestep.add_frame(10.0)
+        self.assertEqual(self.timestep.accumulator, 1.0)
+        self.assertEqual(steps(self.timestep), 4)
+
+    def test_reset_drops_accumulated_time(self):
+        self.timestep.add_frame(0.875)
+        self.timestep.reset()
+        self.assertEqual(self.timestep.alpha(STEP), 0.0)
+        self.assertFalse(self.timestep.consume(STEP))
+
+
+class TestTickClock(unittest.TestCase):
+    def test_advance_and_reset(self):
+        clock = TickClock(tick_rate=10)
+        clock.advance(5)
+        self.assertEqual((clock.ticks, clock.seconds), (5, 0.5))
+        self.assertEqual(clock.ticks_for(1.5), 15)
+        self.assertEqual(clock.ticks_for(0), 1)
+        clock.reset()
+        self.assertEqual((clock.ticks, clock.seconds), (0, 0.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Tests for SnakeEnv observations, rewards and episode ends"""
+import random
+import unittest
+import numpy as np
+from src.core.batch import ACTIONS, NOOP, RIGHT
+from src.env import OBSERVATION_SHAPE, SnakeEnv
+from src.tournament import greedy_bot
+
+
+def rebuilt(env):
+    """Planes drawn from scratch for the env's current game, leaving the env as it was"""
+    kept, length = env.observation, env.length
+    env.observation = np.zeros_like(kept)
+    env._write_observation()
+    fresh = env.observation
+    env.observation, env.length = kept, length
+    return fresh
+
+
+class TestObservation(unittest.TestCase):
+    def test_updates_in_place_match_a_rebuild(self):
+        for seed in range(3):
+            env = SnakeEnv(seed=seed, max_ticks=2000)
+            observation, _ = env.reset()
+            np.testing.assert_array_equal(observation, rebuilt(env))
+            bot = greedy_bot(seed)
+            rng = random.Random(seed)
+            grown = False
+            terminated = truncated = False
+            while not (terminated or truncated):
+                action = ACTIONS.index(bot(env.sim)) if rng.random() > 0.1 else rng.randrange(len(ACTIONS))
+                observation, _, terminated, truncated, info = env.step(action)
+                np.testing.assert_array_equal(observation, rebuilt(env))
+                grown |= info["length"] > 3
+            self.assertTrue(grown)
+
+    def test_every_call_returns_the_same_array(self):
+        env = SnakeEnv(seed=1)
+        observation, _ = env.reset()
+        self.assertIs(observation, env.observation)
+        for _ in range(5):
+            self.assertIs(env.step(NOOP)[0], observation)
+        self.assertIs(env.reset(seed=2)[0], observation)
+
+    def test_planes_go_into_a_caller_buffer(self):
+        buffer = np.zeros((2,) + OBSERVATION_SHAPE, dtype=np.float32)
+        env = SnakeEnv(seed=1, observation=buffer[1])
+        observation, _, _, _, _ = env.step(NOOP)
+        self.assertTrue(np.shares_memory(observation, buffer[1]))
+        np.testing.assert_array_equal(buffer[1], rebuilt(env))
+        self.assertFalse(buffer[0].any())
+
+    def test_buffer_of_the_wrong_shape_raises(self):
+        with self.assertRaises(ValueError):
+            SnakeEnv(observation=np.zeros(OBSERVATION_SHAPE[1:], dtype=np.float32))
+
+
+class TestStep(unittest.TestCase):
+    def test_reward_is_the_score_gained(self):
+        env = SnakeEnv(seed=4, max_ticks=3000)
+        env.reset()
+        bot = greedy_bot(4)
+        rewards = []
+        score = 0
+        terminated = truncated = False
+        while not (terminated or truncated):
+            _, reward, terminated, truncated, info = env.step(ACTIONS.index(bot(env.sim)))
+            self.assertEqual(reward, info["score"] - score)
+            score = info["score"]
+            rewards.append(reward)
+        self.assertGreater(sum(rewards), 0)
+
+    def test_step_limit_truncates(self):
+        env = SnakeEnv(seed=1, max_ticks=5)
+        env.reset()
+        for tick in range(1, 6):
+            _, _, terminated, truncated, info = env.step(NOOP)
+            self.assertFalse(terminated)
+            self.assertEqual(truncated, tick == 5)
+        self.assertEqual(info["ticks"], 5)
+
+    def test_game_over_terminates(self):
+        env = SnakeEnv(seed=1, max_ticks=10_000)
+        env.reset()
+        terminated = truncated = False
+        while not (terminated or truncated):
+            _, _, terminated, truncated, _ = env.step(RIGHT)
+        self.assertTrue(terminated)
+        self.assertFalse(truncated)
+        self.assertTrue(env.sim.game_over)
+
+    def test_game_over_at_the_step_limit_is_not_truncated(self):
+        probe = SnakeEnv(seed=1)
+        ticks = 0
+        while not probe.step(RIGHT)[2]:
+            ticks += 1
+        env = SnakeEnv(seed=1, max_ticks=ticks + 1)
+        for _ in range(ticks):
+            env.step(RIGHT)
+        _, _, terminated, truncated, _ = env.step(RIGHT)
+        self.assertTrue(terminated)
+        self.assertFalse(truncated)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Tests for the breadth-first FlowField used by the pathfinding enemy AI"""
+import unittest
+from src.config.settings import GRID_SIZE
+from src.core import FlowField, SimulationCore
+
+G = GRID_SIZE
+
+
+def at(x, y):
+    """Pixel position of grid cell (x, y)"""
+    return (x * G, y * G)
+
+
+class TestPaths(unittest.TestCase):
+    def setUp(self):
+        # A wall across column 2 with a gap at the bottom row
+        self.field = FlowField(width=5, height=5)
+        self.wall = [at(2, y) for y in range(4)]
+
+    def walk(self, start, limit=50):
+        """Cells visited following step() from start until it returns None"""
+        path = [start]
+        while len(path) < limit:
+            step = self.field.step(path[-1])
+            if step is None or step == path[-1]:
+                break
+            path.append(step)
+        return path
+
+    def test_steps_lead_around_blocked_cells(self):
+        self.field.target(at(4, 0), self.wall)
+        self.assertTrue(self.field.expand([at(0, 0)]))
+        path = self.walk(at(0, 0))
+        self.assertEqual(path[-1], at(4, 0))
+        self.assertFalse(set(path) & set(self.wall))
+        self.assertIn(at(2, 4), path)
+        # Down four, across four, up four
+        self.assertEqual(len(path) - 1, 12)
+        for (x0, y0), (x1, y1) in zip(path, path[1:]):
+            self.assertEqual(abs(x1 - x0) + abs(y1 - y0), G)
+
+    def test_enclosed_cells_have_no_step(self):
+        self.field.target(at(4, 0), self.wall + [at(2, 4)])
+        self.assertTrue(self.field.expand([at(0, 0)]))
+        self.assertIsNone(self.field.step(at(0, 0)))
+        self.assertIsNone(self.field.step(at(2, 1)))
+
+    def test_repeated_key_reuses_the_field(self):
+        field = self.field
+        field.target(at(4, 0), self.wall, key='first')
+        field.expand([at(0, 0)])
+        parent = field.parent
+        field.target(at(4, 0), [], key='first')
+        self.assertIs(field.parent, parent)
+        self.assertEqual((field.searches, field.reuses), (1, 1))
+        # The obstacles of the first call still apply
+        self.assertIsNone(field.step(at(2, 0)))
+        field.target(at(4, 0), [], key='second')
+        self.assertIsNot(field.parent, parent)
+        self.assertEqual((field.searches, field.reuses), (2, 1))
+
+    def test_exhausted_budget_leaves_far_cells_without_a_step(self):
+        field = FlowField()
+        field.target(at(0, 0), [])
+        far = at(field.width - 1, field.height - 1)
+        self.assertFalse(field.expand([far], budget=0))
+        self.assertIsNone(field.step(far))
+        self.assertEqual(field.budget_misses, 1)
+        # Resuming without a limit reaches it from the same frontier
+        self.assertTrue(field.expand([far]))
+        self.assertIsNotNone(field.step(far))
+        self.assertEqual((field.searches, field.budget_misses), (1, 1))
+
+
+class TestSimulation(unittest.TestCase):
+    def test_new_game_does_not_reuse_the_old_field(self):
+        sim = SimulationCore(seed=3, enemy_ai='pathfinding', path_budget_ms=None)
+        sim.step()
+        self.assertIsNotNone(sim.flow_field.key)
+        sim.reset()
+        self.assertIsNone(sim.flow_field.key)
+        sim.step()
+        self.assertEqual(sim.flow_field.searches, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Tests for FreeCellIndex occupancy counts and sampling"""
+import random
+import unittest
+from src.config.settings import GRID_SIZE
+from src.core.free_cells import FreeCellIndex, REJECTION_RATIO
+
+WIDTH, HEIGHT = 8, 4
+
+
+def position(cell):
+    """Pixel position of a cell number on the test board"""
+    return ((cell % WIDTH) * GRID_SIZE, (cell // WIDTH) * GRID_SIZE)
+
+
+class TestOccupancy(unittest.TestCase):
+    def setUp(self):
+        self.index = FreeCellIndex(WIDTH, HEIGHT, random.Random(0))
+
+    def test_occupy_and_release(self):
+        self.index.occupy(position(5))
+        self.assertFalse(self.index.is_free(position(5)))
+        self.assertEqual(len(self.index), WIDTH * HEIGHT - 1)
+        self.index.release(position(5))
+        self.assertTrue(self.index.is_free(position(5)))
+        self.assertEqual(len(self.index), WIDTH * HEIGHT)
+
+    def test_shared_cell_stays_taken_until_every_occupant_leaves(self):
+        self.index.occupy(position(3))
+        self.index.occupy(position(3))
+        self.index.release(position(3))
+        self.assertFalse(self.index.is_free(position(3)))
+        self.assertNotIn(3, self.index.free)
+        self.index.release(position(3))
+        self.assertTrue(self.index.is_free(position(3)))
+        self.assertEqual(list(self.index.free).count(3), 1)
+
+    def test_releasing_a_free_cell_is_ignored(self):
+        self.index.release(position(2))
+        self.assertEqual(len(self.index), WIDTH * HEIGHT)
+        self.assertEqual(self.index.counts[2], 0)
+
+    def test_positions_off_the_board_are_ignored(self):
+        self.index.occupy((-GRID_SIZE, 0))
+        self.index.occupy((WIDTH * GRID_SIZE, 0))
+        self.assertEqual(len(self.index), WIDTH * HEIGHT)
+
+    def test_slots_point_at_each_free_cell(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            cell = rng.randrange(WIDTH * HEIGHT)
+            if rng.random() < 0.6:
+                self.index.occupy(position(cell))
+            else:
+                self.index.release(position(cell))
+        for slot, cell in enumerate(self.index.free):
+            self.assertEqual(self.index.slots[cell], slot)
+            self.assertEqual(self.index.counts[cell], 0)
+        taken = [cell for cell in range(WIDTH * HEIGHT) if self.index.counts[cell]]
+        self.assertTrue(all(self.index.slots[cell] == -1 for cell in taken))
+
+    def test_snapshot_tables_are_not_changed_by_the_index(self):
+        self.index.occupy(position(1))
+        counts, free, slots = self.index.snapshot()
+        saved = (counts.tolist(), free.tolist(), slots.tolist())
+        self.index.occupy(position(2))
+        self.index.release(position(1))
+        self.assertEqual((counts.tolist(), free.tolist(), slots.tolist()), saved)
+        self.index.restore((counts, free, slots))
+        self.assertFalse(self.index.is_free(position(1)))
+        self.assertTrue(self.index.is_free(position(2)))
+
+
+class TestSample(unittest.TestCase):
+    def setUp(self):
+        self.index = FreeCellIndex(WIDTH, HEIGHT, random.Random(0))
+
+    def test_full_board_returns_none(self):
+        for cell in range(WIDTH * HEIGHT):
+            self.index.occupy(position(cell))
+        self.assertIsNone(self.index.sample())
+        self.index.release(position(9))
+        self.assertEqual(self.index.sample(), position(9))
+
+    def test_samples_are_free_on_a_nearly_full_board(self):
+        open_cells = {4, 17, 30}
+        self.assertLess(len(open_cells) * REJECTION_RATIO, WIDTH * HEIGHT)
+        for cell in range(WIDTH * HEIGHT):
+            if cell not in open_cells:
+                self.index.occupy(position(cell))
+        drawn = {self.index.sample() for _ in range(200)}
+        self.assertEqual(drawn, {position(cell) for cell in open_cells})
+
+    def test_samples_are_free_on_an_empty_board(self):
+        self.index.occupy(position(0))
+        for _ in range(200):
+            self.assertNotEqual(self.index.sample(), position(0))
+
+    def test_copies_draw_the_same_cells(self):
+        for cell in range(0, WIDTH * HEIGHT - 2):
+            self.index.occupy(position(cell))
+        copy = self.index.copy(random.Random(5))
+        self.index.rng = random.Random(5)
+        self.assertEqual([copy.sample() for _ in range(20)],
+                         [self.index.sample() for _ in range(20)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,20 +1,169 @@
-snake-game
-├── src
-│   ├── assets
-│   │   └── fonts
-│   │       └── game_font.ttf
-│   ├── components
-│   │   ├── enemy.py
-│   │   ├── food.py
-│   │   ├── menu.py
-│   │   └── snake.py
-│   ├── config
-│   │   └── settings.py
-│   ├── utils
-│   │   ├── collision.py
-│   │   └── display.py
-│   └── main.py
-├── tests
-│   └── test_game.py
-├── requirements.txt
-└── README.md
\ No newline at end of file
+"""Tests for the headless simulation: stepping, snapshots and spawning"""
+import random
+import unittest
+from src.core import SimulationCore
+from src.core.simulation import DIRECTIONS, SHOOT, ENEMY_KEY, FOOD_KEY, AMMO_KEY
+
+ACTIONS = (None,) + DIRECTIONS + (SHOOT,)
+
+
+def random_actions(seed, count):
+    """A fixed sequence of actions, None meaning no input"""
+    rng = random.Random(seed)
+    return [rng.choice(ACTIONS) for _ in range(count)]
+
+
+def play(sim, actions):
+    """Step sim through actions and return the observable state after each tick"""
+    trace = []
+    for action in actions:
+        alive = sim.step(action)
+        trace.append((tuple(sim.snake.positions), sim.snake.direction, sim.enemy.position,
+                      sim.food.position, sim.food.type, sim.ammo and sim.ammo.position,
+                      tuple(sim.bullets), sim.score, sim.ticks))
+        if not alive:
+            break
+    return trace
+
+
+def free_cell_set(sim):
+    """Free cells of sim's index as a set of cell numbers"""
+    return set(sim.free_cells.free)
+
+
+def expected_free_cells(sim):
+    """Free cells recomputed from the positions of everything on the board"""
+    index = sim.free_cells
+    taken = set()
+    positions = list(sim.snake.positions) + [sim.enemy_cell, sim.food.position]
+    positions += [tuple(cell) for cell in sim.swarm.cells.tolist()]
+    if sim.ammo:
+        positions.append(sim.ammo.position)
+    for position in positions:
+        cell = index._cell(position)
+        if cell is not None:
+            taken.add(cell)
+    return set(range(index.width * index.height)) - taken
+
+
+def expected_spatial(sim):
+    """Cell of every spatial grid key recomputed from the entities' positions"""
+    spatial = sim.spatial
+    cells = {ENEMY_KEY: spatial.cell_of(sim.enemy_cell), FOOD_KEY: spatial.cell_of(sim.food.position)}
+    if sim.ammo:
+        cells[AMMO_KEY] = spatial.cell_of(sim.ammo.position)
+    for index, cell in enumerate(sim.swarm.cells.tolist()):
+        cells[index] = spatial.cell_of(cell)
+    return cells
+
+
+class TestStep(unittest.TestCase):
+    def test_same_seed_and_actions_replay_exactly(self):
+        actions = random_actions(1, 400)
+        first = play(SimulationCore(seed=7), actions)
+        second = play(SimulationCore(seed=7), actions)
+        self.assertEqual(first, second)
+
+    def test_reset_with_seed_matches_new_game(self):
+        actions = random_actions(2, 300)
+        sim = SimulationCore(seed=3)
+        play(sim, random_actions(3, 50))
+        sim.reset(11)
+        self.assertEqual(play(sim, actions), play(SimulationCore(seed=11), actions))
+
+    def test_step_advances_one_tick_and_moves_the_head(self):
+        sim = SimulationCore(seed=5)
+        head = sim.snake.head
+        self.assertTrue(sim.step(None))
+        self.assertEqual(sim.ticks, 1)
+        self.assertNotEqual(sim.snake.head, head)
+        self.assertEqual(sim.previous_head, head)
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.sim = SimulationCore(seed=21, swarm_size=2)
+        play(self.sim, random_actions(21, 120))
+        if self.sim.game_over:
+            self.sim.reset(21)
+        self.actions = random_actions(22, 200)
+
+    def test_restore_replays_the_same_future(self):
+        snapshot = self.sim.snapshot()
+        expected = play(self.sim, self.actions)
+        self.sim.restore(snapshot)
+        self.assertEqual(play(self.sim, self.actions), expected)
+
+    def test_restore_into_another_game(self):
+        snapshot = self.sim.snapshot()
+        other = SimulationCore(seed=99, swarm_size=2)
+        other.restore(snapshot)
+        self.assertEqual(play(other, self.actions), play(self.sim, self.actions))
+
+    def test_snapshot_is_unchanged_by_later_ticks(self):
+        snapshot = self.sim.snapshot()
+        copy = self.sim.snapshot()
+        play(self.sim, self.actions)
+        self.assertEqual(snapshot.snake[:-1], copy.snake[:-1])
+        self.assertEqual(snapshot.indexes[0][0].tolist(), copy.indexes[0][0].tolist())
+        self.sim.restore(snapshot)
+        self.assertEqual(free_cell_set(self.sim), expected_free_cells(self.sim))
+
+    def test_restore_without_indexes_rebuilds_them(self):
+        snapshot = self.sim.snapshot()._replace(indexes=None)
+        other = SimulationCore(seed=98, swarm_size=2)
+        other.restore(snapshot)
+        self.assertEqual(free_cell_set(other), expected_free_cells(other))
+        self.assertEqual(other.enemy_cell, self.sim.enemy_cell)
+
+    def test_clone_is_independent(self):
+        clone = self.sim.clone()
+        expected = play(clone, self.actions)
+        self.assertEqual(play(self.sim, self.actions), expected)
+        # Stepping the original further leaves the clone where it stopped
+        ticks = clone.ticks
+        play(self.sim, random_actions(23, 20))
+        self.assertEqual(clone.ticks, ticks)
+        self.assertEqual(free_cell_set(clone), expected_free_cells(clone))
+
+    def test_clones_keep_their_own_spatial_grid(self):
+        for swarm_size in (0, 2):
+            sim = SimulationCore(seed=24, swarm_size=swarm_size)
+            clones = [sim.clone() for _ in range(3)]
+            for game, seed in zip([sim] + clones, range(25, 29)):
+                for action in random_actions(seed, 150):
+                    if not game.step(action):
+                        break
+            for game in [sim] + clones:
+                self.assertEqual(game.spatial.entity_cells, expected_spatial(game))
+
+
+class TestSpawnIndex(unittest.TestCase):
+    def test_index_tracks_the_board_while_playing(self):
+        for swarm_size in (0, 6):
+            sim = SimulationCore(seed=31, swarm_size=swarm_size)
+            for action in random_actions(31, 600):
+                if not sim.step(action):
+                    sim.reset()
+                self.assertEqual(free_cell_set(sim), expected_free_cells(sim))
+
+    def test_swarm_enemies_are_in_the_spatial_grid(self):
+        sim = SimulationCore(seed=33, swarm_size=6)
+        for action in random_actions(33, 300):
+            if not sim.step(action):
+                sim.reset()
+            for index, cell in enumerate(sim.swarm.cells.tolist()):
+                self.assertIn(index, sim.spatial.at(cell, kind='enemy'))
+
+    def test_food_never_spawns_on_an_occupied_cell(self):
+        sim = SimulationCore(seed=32, swarm_size=6)
+        swarm_cells = {tuple(cell) for cell in sim.swarm.cells.tolist()}
+        for _ in range(200):
+            sim.food.randomize_position(sim.free_cells)
+            self.assertNotIn(sim.food.position, sim.snake.occupied)
+            self.assertNotEqual(sim.food.position, sim.enemy_cell)
+            self.assertNotIn(sim.food.position, swarm_cells)
+
+
+if __name__ == '__main__':
+    unittest.main()
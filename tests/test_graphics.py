@@ -0,0 +1,77 @@
+"""Tests for the effect surface cache of GraphicsEngine"""
+import unittest
+import pygame
+from src.engine import GraphicsEngine
+from src.engine.graphics import SurfaceCache
+from src.utils.rng import GameRng
+
+
+class Factory:
+    """Surface factory that records the keys it built"""
+
+    def __init__(self):
+        self.built = []
+
+    def __call__(self, key):
+        def build():
+            self.built.append(key)
+            return pygame.Surface((2, 2))
+        return build
+
+
+class TestSurfaceCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = SurfaceCache(max_size=2)
+        self.factory = Factory()
+
+    def get(self, key):
+        return self.cache.get(key, self.factory(key))
+
+    def test_hit_returns_the_cached_surface(self):
+        first = self.get('a')
+        self.assertIs(self.get('a'), first)
+        self.assertEqual(self.factory.built, ['a'])
+        self.assertEqual(self.cache.stats(), {"hits": 1, "misses": 1, "evictions": 0, "size": 1})
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.get('a')
+        self.get('b')
+        self.get('a')  # Now b is the least recently used
+        self.get('c')
+        self.assertEqual(list(self.cache.surfaces), ['a', 'c'])
+        self.get('a')
+        self.get('b')
+        self.assertEqual(self.factory.built, ['a', 'b', 'c', 'b'])
+        self.assertEqual(list(self.cache.surfaces), ['a', 'b'])
+        self.assertEqual(self.cache.stats(), {"hits": 2, "misses": 4, "evictions": 2, "size": 2})
+
+    def test_clear_drops_entries_and_keeps_counters(self):
+        self.get('a')
+        self.get('a')
+        self.cache.clear()
+        self.get('a')
+        self.assertEqual(self.factory.built, ['a', 'a'])
+        self.assertEqual(self.cache.stats(), {"hits": 1, "misses": 2, "evictions": 0, "size": 1})
+
+
+class TestEngineCache(unittest.TestCase):
+    def setUp(self):
+        self.graphics = GraphicsEngine(pygame.Surface((100, 80)), GameRng(1))
+
+    def test_equal_glows_share_one_surface(self):
+        glow = self.graphics.create_glow((255, 0, 0), 10)
+        self.assertIs(self.graphics.create_glow((255, 0, 0, 255), 10, intensity=1.001), glow)
+        self.assertIsNot(self.graphics.create_glow((255, 0, 0), 11), glow)
+        stats = self.graphics.cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+    def test_kinds_do_not_collide(self):
+        glow = self.graphics.create_glow((0, 255, 0), 8)
+        rings = self.graphics.create_ring_glow((0, 255, 0), 8, rings=3, alpha=200, alpha_step=50)
+        gradient = self.graphics.create_gradient((0, 255, 0), (0, 0, 0), 8)
+        self.assertEqual(len({id(glow), id(rings), id(gradient)}), 3)
+        self.assertEqual(self.graphics.cache_stats()["misses"], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Tests for InputQueue buffering and latency statistics"""
+import unittest
+from src.core import InputQueue
+from src.core.input_queue import LATENCY_SAMPLES
+
+
+class FakeTimer:
+    """Clock advanced by hand, in seconds"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestInputQueue(unittest.TestCase):
+    def setUp(self):
+        self.timer = FakeTimer()
+        self.queue = InputQueue(max_turns=3, timer=self.timer)
+
+    def test_turns_come_out_in_order(self):
+        self.assertTrue(self.queue.push_turn('up', 'right', 5))
+        self.assertTrue(self.queue.push_turn('left', 'right', 5))
+        self.assertEqual(self.queue.pop_turn(), 'up')
+        self.assertEqual(self.queue.pop_turn(), 'left')
+        self.assertIsNone(self.queue.pop_turn())
+
+    def test_reversals_and_repeats_are_refused(self):
+        self.assertFalse(self.queue.push_turn('left', 'right', 5))
+        self.assertFalse(self.queue.push_turn('right', 'right', 5))
+        self.assertTrue(self.queue.push_turn('up', 'right', 5))
+        # Checked against the queued turn, not the snake's direction
+        self.assertFalse(self.queue.push_turn('down', 'right', 5))
+        self.assertTrue(self.queue.push_turn('left', 'right', 1))
+
+    def test_overflow_is_counted(self):
+        for direction in ('up', 'left', 'down', 'right'):
+            self.queue.push_turn(direction, 'right', 5)
+        self.assertEqual(len(self.queue.turns), 3)
+        self.assertEqual(self.queue.dropped, 1)
+
+    def test_latency_stats_are_empty_before_any_turn(self):
+        stats = self.queue.latency_stats()
+        self.assertEqual(stats["count"], 0)
+        self.assertEqual(stats["max"], 0.0)
+
+    def test_latency_is_time_from_push_to_pop_in_ms(self):
+        current = 'right'
+        for direction, wait in (('up', 0.010), ('left', 0.030), ('down', 0.020)):
+            self.queue.push_turn(direction, current, 5)
+            current = direction
+            self.timer.now += wait
+            self.assertEqual(self.queue.pop_turn(), direction)
+        stats = self.queue.latency_stats()
+        self.assertEqual(stats["count"], 3)
+        self.assertAlmostEqual(stats["mean"], 20.0)
+        self.assertAlmostEqual(stats["p50"], 20.0)
+        self.assertAlmostEqual(stats["max"], 30.0)
+
+    def test_latency_keeps_recent_samples(self):
+        for index in range(LATENCY_SAMPLES + 10):
+            self.queue.push_turn('up', 'right', 5)
+            self.timer.now += 0.001 if index < 10 else 0.005
+            self.queue.pop_turn()
+        stats = self.queue.latency_stats()
+        self.assertEqual(stats["count"], LATENCY_SAMPLES)
+        self.assertAlmostEqual(stats["p50"], 5.0)
+        self.assertAlmostEqual(stats["p95"], 5.0)
+
+    def test_clear_drops_turns_without_recording_latency(self):
+        self.queue.push_turn('up', 'right', 5)
+        self.queue.clear()
+        self.assertIsNone(self.queue.pop_turn())
+        self.assertEqual(self.queue.latency_stats()["count"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Tests for the NumPy ParticleSystem"""
+import unittest
+import numpy as np
+import pygame
+from src.engine.particles import ParticleSystem
+
+RED = (255, 0, 0, 255)
+BLUE = (0, 0, 255, 255)
+
+
+def circles(size, particles):
+    """Surface with pygame.draw.circle drawn for each (position, color, radius)"""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    for position, color, radius in particles:
+        pygame.draw.circle(surface, color, position, radius)
+    return surface
+
+
+class TestUpdate(unittest.TestCase):
+    def test_dead_particles_are_compacted_out(self):
+        system = ParticleSystem(capacity=8)
+        system.emit((1, 1), RED, 2, lifetime=1)
+        system.emit((5, 6), BLUE, 3, lifetime=3, velocity=(1, 0))
+        system.emit((9, 9), RED, 4, lifetime=1)
+        system.update()
+        self.assertEqual(len(system), 1)
+        self.assertEqual(system.position[0].tolist(), [6, 6])
+        self.assertEqual(system.color[0, :3].tolist(), [0, 0, 255])
+        self.assertEqual((system.size[0], system.lifetime[0], system.max_lifetime[0]), (3, 2, 3))
+        system.update()
+        system.update()
+        self.assertEqual(len(system), 0)
+
+    def test_velocity_and_gravity(self):
+        system = ParticleSystem(capacity=4)
+        system.emit((0, 0), RED, 1, lifetime=10, velocity=(2, 1), gravity=0.5)
+        system.update()
+        system.update()
+        self.assertEqual(system.position[0].tolist(), [4, 2.5])
+        self.assertEqual(system.velocity[0].tolist(), [2, 2])
+
+    def test_alpha_fades_over_the_lifetime(self):
+        system = ParticleSystem(capacity=4)
+        system.emit((0, 0), RED, 1, lifetime=4)
+        system.emit((0, 0), BLUE, 1, lifetime=4, fade=False)
+        alphas = []
+        for _ in range(3):
+            system.update()
+            alphas.append(system.color[:2, 3].tolist())
+        self.assertEqual(alphas, [[191, 255], [127, 255], [63, 255]])
+
+
+class TestCapacity(unittest.TestCase):
+    def test_full_system_refuses_particles(self):
+        system = ParticleSystem(capacity=2)
+        self.assertTrue(system.emit((0, 0), RED, 1, lifetime=5))
+        self.assertTrue(system.emit((0, 0), RED, 1, lifetime=5))
+        self.assertFalse(system.emit((0, 0), RED, 1, lifetime=5))
+        self.assertEqual((len(system), system.dropped), (2, 1))
+
+    def test_burst_keeps_what_fits(self):
+        system = ParticleSystem(capacity=5)
+        system.emit((0, 0), RED, 1, lifetime=5)
+        positions = np.arange(12, dtype=np.float32).reshape(6, 2)
+        added = system.emit_many(positions, np.zeros_like(positions), BLUE, 2, lifetime=5)
+        self.assertEqual(added, 4)
+        self.assertEqual((len(system), system.dropped), (5, 2))
+        self.assertEqual(system.position[1:5].tolist(), positions[:4].tolist())
+
+    def test_dead_particles_free_their_slots(self):
+        system = ParticleSystem(capacity=1)
+        system.emit((0, 0), RED, 1, lifetime=1)
+        system.update()
+        self.assertTrue(system.emit((0, 0), RED, 1, lifetime=1))
+
+
+class TestDraw(unittest.TestCase):
+    SIZE = (40, 30)
+
+    def draw(self, particles):
+        system = ParticleSystem(capacity=16)
+        for position, color, radius in particles:
+            system.emit(position, color, radius, lifetime=10, fade=False)
+        surface = pygame.Surface(self.SIZE, pygame.SRCALPHA)
+        system.draw(surface)
+        return surface
+
+    def assertSamePixels(self, surface, expected):
+        self.assertTrue(pygame.surfarray.array_alpha(expected).any())
+        self.assertEqual(pygame.image.tobytes(surface, 'RGBA'), pygame.image.tobytes(expected, 'RGBA'))
+
+    def test_matches_pygame_circles_inside_the_surface(self):
+        particles = [((10, 10), RED, 3), ((25, 15), BLUE, 5)]
+        self.assertSamePixels(self.draw(particles), circles(self.SIZE, particles))
+
+    def test_particles_on_the_edges_are_clipped(self):
+        particles = [((0, 0), RED, 4), ((39, 15), BLUE, 3), ((20, 29), RED, 6), ((-2, 12), BLUE, 3)]
+        self.assertSamePixels(self.draw(particles), circles(self.SIZE, particles))
+
+    def test_particles_off_the_surface_draw_nothing(self):
+        surface = self.draw([((-20, 5), RED, 3), ((70, 70), BLUE, 4), ((10, -9), RED, 2)])
+        self.assertFalse(pygame.surfarray.array_alpha(surface).any())
+
+
+if __name__ == '__main__':
+    unittest.main()
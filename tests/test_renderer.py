@@ -0,0 +1,99 @@
+"""Tests for GameRenderer under the SDL dummy video driver"""
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from src.config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.core import SimulationCore
+from src.engine import GraphicsEngine, GameRenderer
+from src.utils.profiler import FrameProfiler
+from src.utils.rng import GameRng
+
+
+class RendererTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        cls.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        self.profiler = FrameProfiler(enabled=True)
+        graphics = GraphicsEngine(self.screen, GameRng(1), self.profiler)
+        self.renderer = GameRenderer(self.screen, graphics)
+        self.sim = SimulationCore(seed=1)
+
+    def record_frames(self, count):
+        for _ in range(count):
+            self.profiler.start_frame("draw")
+            self.renderer.draw(self.sim)
+            self.renderer.present()
+            self.profiler.end_frame()
+
+
+class TestProfileOverlay(RendererTestCase):
+    def test_notes_add_lines_under_the_table(self):
+        self.record_frames(3)
+        table = self.renderer.render_profile(self.profiler)
+        noted = self.renderer.render_profile(self.profiler, ["trace saved to profiles/trace.csv and .json"])
+        self.assertGreater(noted.get_height(), table.get_height())
+
+    def test_notes_are_read_only_when_the_overlay_refreshes(self):
+        self.record_frames(2)
+        calls = []
+
+        def notes():
+            calls.append(self.profiler.frames)
+            return ["note"]
+
+        self.renderer.draw_profile(self.profiler, notes)
+        self.record_frames(2)
+        self.renderer.draw_profile(self.profiler, notes)
+        self.assertEqual(len(calls), 1)
+        self.renderer.refresh_profile()
+        self.renderer.draw_profile(self.profiler, notes)
+        self.assertEqual(len(calls), 2)
+
+
+class TestStats(RendererTestCase):
+    def test_full_redraw_pushes_the_whole_screen(self):
+        self.renderer.request_full_redraw()
+        self.renderer.draw(self.sim)
+        stats = self.renderer.stats()
+        self.assertEqual(stats["pixels_pushed"], SCREEN_WIDTH * SCREEN_HEIGHT)
+        self.assertEqual(stats["rects"], 1)
+
+    def test_dirty_frame_pushes_only_changed_areas(self):
+        self.renderer.draw(self.sim)
+        self.sim.step()
+        self.renderer.draw(self.sim)
+        stats = self.renderer.stats()
+        self.assertTrue(stats["dirty_rects"])
+        self.assertGreater(stats["rects"], 0)
+        self.assertEqual(stats["rects"], len(self.renderer.update_rects))
+        self.assertEqual(stats["pixels_pushed"],
+                         sum(rect.width * rect.height for rect in self.renderer.update_rects))
+        self.assertLess(stats["pixels_pushed"], SCREEN_WIDTH * SCREEN_HEIGHT // 4)
+
+    def test_unchanged_frame_pushes_nothing(self):
+        self.renderer.draw(self.sim)
+        self.renderer.draw(self.sim)
+        self.assertEqual(self.renderer.stats()["pixels_pushed"], 0)
+
+    def test_dirty_rects_off_redraws_every_frame(self):
+        self.renderer.set_dirty_rects(False)
+        for _ in range(2):
+            self.sim.step()
+            self.renderer.draw(self.sim)
+            stats = self.renderer.stats()
+            self.assertFalse(stats["dirty_rects"])
+            self.assertEqual(stats["pixels_pushed"], SCREEN_WIDTH * SCREEN_HEIGHT)
+
+
+if __name__ == '__main__':
+    unittest.main()
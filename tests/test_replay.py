@@ -0,0 +1,161 @@
+"""Tests for the replay file format and playback"""
+import io
+import random
+import unittest
+from src.core.replay import (
+    ACTIONS, CODE_BITS, END_CODE, MAGIC, VERSION, ReplayPlayer, ReplayWriter,
+    decode_varint, encode_varint, read_replay,
+)
+from src.core.simulation import SimulationCore
+
+HEADER = MAGIC + bytes([VERSION])
+
+
+class KeepOpen(io.BytesIO):
+    """BytesIO whose contents survive close"""
+
+    def close(self):
+        pass
+
+
+def write_games(games, buffer_size=4096):
+    """Replay bytes for games given as (seed, [(tick, action)], end) with end (ticks, score) or None"""
+    stream = KeepOpen()
+    writer = ReplayWriter(stream, buffer_size)
+    for seed, events, end in games:
+        writer.begin_game(seed)
+        for tick, action in events:
+            writer.record(tick, action)
+        if end is not None:
+            writer.end_game(*end)
+    writer.close()
+    return stream.getvalue()
+
+
+class TestVarint(unittest.TestCase):
+    def test_round_trip(self):
+        values = [0, 1, 0x7F, 0x80, 0x3FFF, 0x4000, 2 ** 32, 2 ** 63 - 1]
+        data = bytearray()
+        for value in values:
+            encode_varint(value, data)
+        offset = 0
+        for value in values:
+            decoded, offset = decode_varint(data, offset)
+            self.assertEqual(decoded, value)
+        self.assertEqual(offset, len(data))
+
+    def test_sizes(self):
+        for value, size in ((0, 1), (0x7F, 1), (0x80, 2), (0x3FFF, 2), (0x4000, 3)):
+            data = bytearray()
+            encode_varint(value, data)
+            self.assertEqual(len(data), size)
+
+    def test_truncated_varint_raises(self):
+        data = bytearray()
+        encode_varint(300, data)
+        with self.assertRaises(EOFError):
+            decode_varint(data[:1], 0)
+
+
+class TestFormat(unittest.TestCase):
+    def test_events_pack_delta_and_code(self):
+        data = write_games([(5, [(3, 'left'), (3, 'shoot'), (20, 'up')], (21, 7))])
+        # Seed, swarm size and enemy AI byte, then one varint per event
+        body = data[len(HEADER) + 3:]
+        expected = bytearray()
+        for delta, action in ((3, 'left'), (0, 'shoot'), (17, 'up')):
+            encode_varint(delta << CODE_BITS | ACTIONS.index(action), expected)
+        encode_varint(1 << CODE_BITS | END_CODE, expected)
+        encode_varint(7, expected)
+        self.assertEqual(body, expected)
+
+    def test_games_round_trip(self):
+        rng = random.Random(3)
+        games = []
+        for seed in (1, 2 ** 40, 3):
+            tick = 0
+            events = []
+            for _ in range(rng.randrange(1, 60)):
+                tick += rng.choice((0, 1, 5, 200, 5000))
+                events.append((tick, rng.choice(ACTIONS)))
+            games.append((seed, events, (tick + 10, rng.randrange(1000))))
+        for game, (seed, events, end) in zip(read_replay(write_games(games)), games):
+            self.assertEqual(game.seed, seed)
+            self.assertEqual(game.events, events)
+            self.assertEqual((game.ticks, game.score), end)
+
+    def test_end_code_closes_the_game(self):
+        data = write_games([(1, [(4, 'down')], (9, 30)), (2, [], (0, 0))])
+        first, second = read_replay(data)
+        self.assertEqual((first.ticks, first.score), (9, 30))
+        self.assertEqual(first.events, [(4, 'down')])
+        self.assertEqual((second.seed, second.events, second.ticks), (2, [], 0))
+
+    def test_unfinished_game_has_no_end(self):
+        game, = read_replay(write_games([(1, [(2, 'left'), (6, 'up')], None)]))
+        self.assertEqual(game.events, [(2, 'left'), (6, 'up')])
+        self.assertIsNone(game.ticks)
+        self.assertIsNone(game.score)
+
+    def test_recording_cut_between_events(self):
+        data = write_games([(1, [(2, 'left')], (5, 1)), (2, [(3, 'up'), (400, 'down')], (500, 9))])
+        cut = data[:-3]  # Drops the end of the second game
+        first, second = read_replay(cut)
+        self.assertEqual(first.ticks, 5)
+        self.assertEqual(second.events, [(3, 'up'), (400, 'down')])
+        self.assertIsNone(second.ticks)
+
+    def test_data_cut_inside_a_value_raises(self):
+        data = write_games([(2 ** 40, [(3, 'up')], None)])
+        with self.assertRaises(EOFError):
+            list(read_replay(data[:len(HEADER) + 2]))
+        with self.assertRaises(EOFError):
+            list(read_replay(data[:len(HEADER) + 6]))
+        # Seed and swarm size present, enemy AI byte missing
+        with self.assertRaises(EOFError):
+            list(read_replay(data[:len(HEADER) + 7]))
+
+    def test_rejects_other_files(self):
+        for data in (b'', MAGIC, b'PK\x03\x04\x01'):
+            with self.assertRaises(ValueError):
+                list(read_replay(data))
+        with self.assertRaises(ValueError):
+            list(read_replay(MAGIC + bytes([VERSION + 1])))
+
+    def test_small_buffer_flushes_whole_events(self):
+        events = [(tick * 3, 'left' if tick % 2 else 'up') for tick in range(100)]
+        stream = KeepOpen()
+        writer = ReplayWriter(stream, buffer_size=8)
+        writer.begin_game(4)
+        for tick, action in events:
+            writer.record(tick, action)
+            game, = read_replay(stream.getvalue())
+            self.assertEqual(game.events, events[:len(game.events)])
+        writer.close()
+
+
+class TestPlayback(unittest.TestCase):
+    def test_replay_reproduces_a_game(self):
+        rng = random.Random(8)
+        sim = SimulationCore(seed=77)
+        stream = KeepOpen()
+        writer = ReplayWriter(stream)
+        writer.begin_game(77)
+        while not sim.game_over and sim.ticks < 2000:
+            action = rng.choice((None, None, None) + ACTIONS)
+            if action is not None:
+                writer.record(sim.ticks, action)
+                sim.apply_action(action)
+            sim.step()
+        writer.end_game(sim.ticks, sim.score)
+        writer.close()
+
+        game, = read_replay(stream.getvalue())
+        player = ReplayPlayer(game)
+        player.run()
+        self.assertTrue(player.matches_recording())
+        self.assertEqual(player.sim.snake.head, sim.snake.head)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""Tests for IdleScheduler frame pacing and per-state time accounting"""
+import unittest
+from unittest import mock
+from src.engine.scheduler import IdleScheduler
+
+
+class FakeTime:
+    """Stands in for the time module with hand-advanced clocks"""
+
+    def __init__(self):
+        self.wall = 0.0
+        self.cpu = 0.0
+
+    def perf_counter(self):
+        return self.wall
+
+    def process_time(self):
+        return self.cpu
+
+    def advance(self, wall, cpu):
+        self.wall += wall
+        self.cpu += cpu
+
+
+class SchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.time = FakeTime()
+        patcher = mock.patch('src.engine.scheduler.time', self.time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.scheduler = IdleScheduler({"menu": 0.1, "paused": None}, max_wait_ms=250)
+
+
+class TestAccounting(SchedulerTestCase):
+    def test_stats_report_cpu_and_wall_time_per_state(self):
+        self.time.advance(wall=2.0, cpu=0.5)
+        self.scheduler.account("menu")
+        self.time.advance(wall=4.0, cpu=0.1)
+        self.scheduler.account("paused")
+        self.time.advance(wall=1.0, cpu=0.5)
+        self.scheduler.account("menu")
+        stats = self.scheduler.stats()
+        self.assertAlmostEqual(stats["menu"]["cpu_seconds"], 1.0)
+        self.assertAlmostEqual(stats["menu"]["wall_seconds"], 3.0)
+        self.assertAlmostEqual(stats["menu"]["cpu_share"], 1 / 3)
+        self.assertAlmostEqual(stats["paused"]["cpu_share"], 0.025)
+
+    def test_stats_count_frames_rendered(self):
+        self.scheduler.account("menu")
+        self.assertTrue(self.scheduler.should_render("menu"))
+        self.assertFalse(self.scheduler.should_render("menu"))
+        self.time.advance(wall=0.1, cpu=0.0)
+        self.assertTrue(self.scheduler.should_render("menu"))
+        self.assertEqual(self.scheduler.stats()["menu"]["frames"], 2)
+
+    def test_no_states_before_accounting(self):
+        self.assertEqual(self.scheduler.stats(), {})
+
+
+class TestPacing(SchedulerTestCase):
+    def test_static_state_redraws_only_when_invalidated(self):
+        self.assertTrue(self.scheduler.should_render("paused"))
+        self.time.advance(wall=10.0, cpu=0.0)
+        self.assertFalse(self.scheduler.should_render("paused"))
+        self.assertEqual(self.scheduler._timeout_ms("paused"), 250)
+        self.scheduler.invalidate()
+        self.assertEqual(self.scheduler._timeout_ms("paused"), 0)
+        self.assertTrue(self.scheduler.should_render("paused"))
+
+    def test_animated_state_waits_until_the_next_frame(self):
+        self.scheduler.should_render("menu")
+        self.time.advance(wall=0.04, cpu=0.0)
+        self.assertEqual(self.scheduler._timeout_ms("menu"), 60)
+        self.time.advance(wall=0.06, cpu=0.0)
+        self.assertEqual(self.scheduler._timeout_ms("menu"), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
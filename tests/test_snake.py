@@ -0,0 +1,79 @@
+"""Tests for the snake's segment occupancy counts"""
+import random
+import unittest
+from collections import Counter
+from src.config.settings import GRID_SIZE, BASE_FPS
+from src.components.snake import Snake
+from src.utils.clock import TickClock
+
+G = GRID_SIZE
+
+
+def make_snake(positions, direction, growth_queue=0):
+    """Snake with the given segments, head first, and no occupancy counts"""
+    snake = Snake(TickClock(), random.Random(0))
+    snake.restore((tuple(positions), len(positions), direction, BASE_FPS, BASE_FPS,
+                   0, 0, 0, False, 0, growth_queue, None))
+    return snake
+
+
+class TestOccupancy(unittest.TestCase):
+    def assertInSync(self, snake):
+        self.assertEqual(snake.occupied, dict(Counter(snake.positions)))
+        self.assertEqual(len(snake.positions), snake.length)
+
+    def test_restore_rebuilds_occupied(self):
+        snake = make_snake([(2 * G, 0), (G, 0), (0, 0)], 'right')
+        self.assertEqual(snake.occupied, {(2 * G, 0): 1, (G, 0): 1, (0, 0): 1})
+
+    def test_restore_counts_stacked_segments(self):
+        snake = make_snake([(G, 0), (G, 0), (0, 0)], 'right')
+        self.assertEqual(snake.occupied, {(G, 0): 2, (0, 0): 1})
+        self.assertTrue(snake.collides_with_self())
+
+    def test_growth_queue_stays_in_sync(self):
+        snake = make_snake([(5 * G, 5 * G)], 'right')
+        snake.grow(3)
+        for _ in range(3):
+            snake.move()
+            self.assertInSync(snake)
+        self.assertEqual(snake.length, 4)
+        self.assertEqual(snake.growth_queue, 0)
+        snake.move()
+        self.assertEqual(snake.length, 4)
+        self.assertInSync(snake)
+
+    def test_moving_into_the_cell_the_tail_just_left(self):
+        # A 2x2 loop: the head moves down onto the tail's cell as the tail leaves it
+        snake = make_snake([(G, 0), (0, 0), (0, G), (G, G)], 'down')
+        snake.move()
+        self.assertEqual(snake.head, (G, G))
+        self.assertFalse(snake.collides_with_self())
+        self.assertInSync(snake)
+
+    def test_moving_into_the_tail_while_growing_collides(self):
+        snake = make_snake([(G, 0), (0, 0), (0, G), (G, G)], 'down', growth_queue=1)
+        snake.move()
+        self.assertTrue(snake.collides_with_self())
+        self.assertEqual(snake.occupied[(G, G)], 2)
+
+    def test_running_into_the_body_collides(self):
+        snake = make_snake([(G, G), (G, 0), (0, 0), (0, G), (0, 2 * G)], 'left')
+        snake.move()
+        self.assertEqual(snake.head, (0, G))
+        self.assertTrue(snake.collides_with_self())
+
+    def test_snapshot_keeps_its_counts_after_moves(self):
+        snake = make_snake([(2 * G, 0), (G, 0), (0, 0)], 'down')
+        state = snake.snapshot()
+        saved = dict(state[-1])
+        snake.move()
+        snake.move()
+        self.assertEqual(state[-1], saved)
+        snake.restore(state)
+        self.assertInSync(snake)
+        self.assertEqual(snake.head, (2 * G, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Tests for EnemySwarm against the per-object Enemy rules"""
+import random
+import unittest
+import numpy as np
+from src.components.enemy import Enemy
+from src.config.settings import GRID_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_SPEED
+from src.core.swarm import DIRECTION_NAMES, EnemySwarm
+
+G = GRID_SIZE
+
+
+def place(swarm, index, position):
+    """Put one swarm enemy on position with every segment stacked there"""
+    swarm.heads[index] = position
+    swarm.segments[index] = position
+    swarm.cells[index] = swarm.grid_cells()[index]
+
+
+def enemy_at(position, speed=ENEMY_SPEED):
+    """An Enemy on position with the starting three stacked segments"""
+    enemy = Enemy(random.Random(0))
+    enemy.positions = [position] * enemy.length
+    enemy.position = position
+    enemy.speed = speed
+    return enemy
+
+
+class TestMove(unittest.TestCase):
+    def assertSameEnemies(self, swarm, enemies):
+        for index, enemy in enumerate(enemies):
+            np.testing.assert_allclose(swarm.heads[index], enemy.position, rtol=0, atol=1e-9)
+            np.testing.assert_allclose(swarm.positions(index), enemy.positions, rtol=0, atol=1e-9)
+            self.assertEqual(DIRECTION_NAMES[swarm.direction[index]], enemy.direction)
+            self.assertEqual(swarm.length[index], enemy.length)
+
+    def test_matches_enemy_move(self):
+        rng = random.Random(3)
+        count = 12
+        swarm = EnemySwarm(count, rng=random.Random(0))
+        enemies = []
+        for index in range(count):
+            position = (rng.uniform(0, SCREEN_WIDTH - G), rng.uniform(0, SCREEN_HEIGHT - G))
+            speed = rng.choice((ENEMY_SPEED, ENEMY_SPEED * 0.2, 1))
+            place(swarm, index, position)
+            swarm.speed[index] = speed
+            enemies.append(enemy_at(position, speed))
+        swarm.direction[:] = [DIRECTION_NAMES.index(enemy.direction) for enemy in enemies]
+
+        for tick in range(40):
+            snake_head = (rng.randrange(0, SCREEN_WIDTH, G), rng.randrange(0, SCREEN_HEIGHT, G))
+            food = (rng.randrange(0, SCREEN_WIDTH, G), rng.randrange(0, SCREEN_HEIGHT, G))
+            if tick % 7 == 0:
+                eater = tick % count
+                swarm.grow(eater, amount=3)
+                enemies[eater].grow(amount=3)
+            swarm.move(snake_head, food)
+            for enemy in enemies:
+                enemy.move(snake_head, food)
+            self.assertSameEnemies(swarm, enemies)
+        self.assertEqual(swarm.cells.tolist(), [list(enemy.get_position_grid()) for enemy in enemies])
+
+    def test_waypoints_match_enemy_move(self):
+        swarm = EnemySwarm(3, rng=random.Random(0))
+        starts = [(0, 0), (10 * G, 2 * G), (20 * G, 20 * G)]
+        enemies = []
+        for index, position in enumerate(starts):
+            place(swarm, index, position)
+            enemies.append(enemy_at(position))
+        swarm.direction[:] = [DIRECTION_NAMES.index(enemy.direction) for enemy in enemies]
+        snake_head = (12 * G, 12 * G)
+        food = (40 * G, 0)
+        waypoints = [(G, 0), None, (20 * G, 19 * G)]
+        rows = np.array([point if point else (np.nan, np.nan) for point in waypoints])
+        swarm.move(snake_head, food, rows)
+        for enemy, waypoint in zip(enemies, waypoints):
+            enemy.move(snake_head, food, waypoint)
+        self.assertSameEnemies(swarm, enemies)
+
+    def test_heads_stay_on_the_screen(self):
+        swarm = EnemySwarm(2, rng=random.Random(0))
+        place(swarm, 0, (0, 0))
+        place(swarm, 1, (SCREEN_WIDTH - G, SCREEN_HEIGHT - G))
+        swarm.speed[:] = 10
+        for _ in range(5):
+            swarm.move((-5 * G, -5 * G), (SCREEN_WIDTH + G, SCREEN_HEIGHT + G))
+        self.assertEqual(swarm.heads.tolist(), [[0, 0], [SCREEN_WIDTH - G, SCREEN_HEIGHT - G]])
+
+
+class TestSpawn(unittest.TestCase):
+    def test_spawn_at_edge_snaps_cells_to_the_grid(self):
+        swarm = EnemySwarm(50, rng=random.Random(4))
+        for index in range(swarm.count):
+            swarm.spawn_at_edge(index)
+            x, y = swarm.heads[index]
+            self.assertTrue(x in (0, SCREEN_WIDTH - G) or y in (0, SCREEN_HEIGHT - G))
+        self.assertEqual(swarm.cells.tolist(), swarm.grid_cells().tolist())
+        self.assertFalse((swarm.cells % G).any())
+
+    def test_spawn_resets_the_body(self):
+        swarm = EnemySwarm(1, rng=random.Random(5))
+        for _ in range(3):
+            swarm.move((0, 0), (SCREEN_WIDTH - G, SCREEN_HEIGHT - G))
+        swarm.spawn_at_edge(0)
+        head = tuple(swarm.heads[0])
+        self.assertEqual(swarm.positions(0), [head] * swarm.length[0])
+
+
+class TestBody(unittest.TestCase):
+    def test_growth_stops_at_max_length(self):
+        swarm = EnemySwarm(2, max_length=5, rng=random.Random(6))
+        swarm.grow(0, amount=10)
+        for _ in range(10):
+            swarm.move((0, 0), (SCREEN_WIDTH - G, SCREEN_HEIGHT - G))
+        self.assertEqual(swarm.length.tolist(), [5, 3])
+        self.assertEqual(swarm.growth_queue.tolist(), [0, 0])
+        self.assertEqual(len(swarm.positions(0)), 5)
+
+    def test_ring_buffer_wraps(self):
+        swarm = EnemySwarm(1, max_length=4, rng=random.Random(7))
+        place(swarm, 0, (0, 0))
+        swarm.grow(0, amount=1)
+        heads = []
+        for tick in range(11):
+            swarm.move((SCREEN_WIDTH - G, SCREEN_HEIGHT - G), (0, SCREEN_HEIGHT - G))
+            heads.append(tuple(swarm.heads[0]))
+            self.assertEqual(swarm.head_slot, (tick + 1) % 4)
+        self.assertEqual(swarm.length[0], 4)
+        self.assertEqual(swarm.positions(0), heads[::-1][:4])
+
+
+if __name__ == '__main__':
+    unittest.main()
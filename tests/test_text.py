@@ -0,0 +1,65 @@
+"""Tests for the shared TextRenderer caches"""
+import unittest
+import pygame
+from src.utils.text import TextRenderer, quantize_pulse
+
+WHITE = (255, 255, 255)
+
+
+def setUpModule():
+    pygame.font.init()
+
+
+class TestTextRenderer(unittest.TestCase):
+    def setUp(self):
+        self.text = TextRenderer(max_size=2)
+
+    def test_fonts_are_created_once_per_size(self):
+        font = self.text.font(20)
+        self.assertIs(self.text.font(20), font)
+        self.assertIsNot(self.text.font(30), font)
+        self.assertEqual(self.text.stats()["fonts"], 2)
+
+    def test_hit_returns_the_cached_surface(self):
+        surface = self.text.render('Score', 20, WHITE)
+        self.assertIs(self.text.render('Score', 20, [255, 255, 255]), surface)
+        self.assertEqual((self.text.hits, self.text.misses), (1, 1))
+
+    def test_any_key_part_changes_misses(self):
+        surface = self.text.render('Score', 20, WHITE)
+        self.text.max_size = 8
+        for other in [('Level', 20, WHITE, True), ('Score', 24, WHITE, True),
+                      ('Score', 20, (255, 0, 0), True), ('Score', 20, WHITE, False)]:
+            self.assertIsNot(self.text.render(*other), surface)
+        self.assertEqual((self.text.hits, self.text.misses), (0, 5))
+
+    def test_least_recently_used_surface_is_evicted(self):
+        self.text.render('a', 20, WHITE)
+        self.text.render('b', 20, WHITE)
+        self.text.render('a', 20, WHITE)  # Now b is the least recently used
+        self.text.render('c', 20, WHITE)
+        self.assertEqual([key[0] for key in self.text.surfaces], ['a', 'c'])
+        self.text.render('b', 20, WHITE)
+        self.assertEqual([key[0] for key in self.text.surfaces], ['c', 'b'])
+        self.assertEqual(self.text.stats(), {"hits": 1, "misses": 4, "evictions": 2, "size": 2, "fonts": 1})
+
+    def test_clear_drops_fonts_and_surfaces(self):
+        font = self.text.font(20)
+        surface = self.text.render('a', 20, WHITE)
+        self.text.clear()
+        self.assertEqual((len(self.text.fonts), len(self.text.surfaces)), (0, 0))
+        self.assertIsNot(self.text.render('a', 20, WHITE), surface)
+        self.assertIsNot(self.text.font(20), font)
+        self.assertEqual((self.text.hits, self.text.misses), (0, 2))
+
+
+class TestQuantizePulse(unittest.TestCase):
+    def test_snaps_to_the_nearest_phase(self):
+        self.assertEqual(quantize_pulse(0.0), 0.0)
+        self.assertEqual(quantize_pulse(0.51), 0.5)
+        self.assertEqual(quantize_pulse(0.3, steps=4), 0.25)
+        self.assertEqual(quantize_pulse(1.0), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Tests for the tournament runner's settings sweeps"""
+import unittest
+from unittest import mock
+from src import tournament
+from src.config import settings
+from src.core import SimulationCore
+
+
+def play(settings_values, seed, bot='greedy'):
+    """Result of one tournament game under the given settings overrides"""
+    config = {'id': 0, 'bot': bot, 'settings': list(settings_values.items())}
+    return tournament.play_game((config, 0, seed, tournament.DEFAULT_MAX_TICKS))
+
+
+class TestSettings(unittest.TestCase):
+    def tearDown(self):
+        tournament.apply_settings({})
+
+    def test_overrides_reach_modules_that_import_them(self):
+        tournament.apply_settings({'SPEED_INCREMENT': 0.5})
+        self.assertEqual(settings.SPEED_INCREMENT, 0.5)
+        tournament.apply_settings({})
+        self.assertEqual(settings.SPEED_INCREMENT, tournament.DEFAULTS['SPEED_INCREMENT'])
+
+    def test_unknown_setting_is_refused(self):
+        with self.assertRaisesRegex(ValueError, 'unknown setting'):
+            tournament.apply_settings({'NOT_A_SETTING': 1})
+
+    def test_enemy_speed_reaches_the_game(self):
+        games = []
+
+        class Recorder(SimulationCore):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                games.append(self)
+
+        with mock.patch.object(tournament, 'SimulationCore', Recorder):
+            play({'ENEMY_SPEED': 2.0, 'SWARM_SIZE': 2, 'ENEMY_AI': 'greedy'}, seed=1, bot='random')
+        sim, = games
+        self.assertEqual(sim.enemy.base_speed, 2.0)
+        self.assertEqual(sim.swarm.base_speed, 2.0)
+
+    def test_enemy_speed_changes_a_seeded_game(self):
+        # The boost floors and growth caps on enemy speed do not scale with it
+        slow = play({'ENEMY_SPEED': 0.2}, seed=6)
+        fast = play({'ENEMY_SPEED': 2.0}, seed=6)
+        self.assertEqual(play({'ENEMY_SPEED': 0.2}, seed=6)['ticks'], slow['ticks'])
+        self.assertNotEqual((slow['score'], slow['ticks']), (fast['score'], fast['ticks']))
+
+
+if __name__ == '__main__':
+    unittest.main()